@@ -19,7 +19,7 @@ from ....core.database import get_session, transactional
 from ....core.security import get_current_user, user_is_admin
 from ....core.prompts import get_prompt_store
 from ....models.user import User
-from ....services.chat_service import ChatService
+from ....services.chat_service import ChatService, extract_sql_command
 from ....services.animator_agent import AnimatorAgent
 from ....engines.openai_engine import OpenAIChatEngine
 from ....integrations.openai_client import OpenAICompatibleClient, OpenAIBackendError
@@ -438,7 +438,7 @@ def chat_stream(  # type: ignore[valid-type]
             last = payload.messages[-1] if payload.messages else None
 
             # 1) MindsDB passthrough (/sql ...) or NL→SQL mode
-            if last and last.role == "user" and last.content.strip().casefold().startswith("/sql "):
+            if last and last.role == "user" and extract_sql_command(last.content) is not None:
                 prov = "mindsdb-sql"
                 yield _sse("meta", {"request_id": trace_id, "provider": prov, "model": model, "conversation_id": conversation_id})
                 q: "queue.Queue[tuple[str, dict] | tuple[str, object]]" = queue.Queue()
@@ -571,6 +571,7 @@ def chat_stream(  # type: ignore[valid-type]
 
                 th = threading.Thread(target=worker, daemon=True)
                 th.start()
+                streamed = False
                 while True:
                     item = q.get()
                     if not isinstance(item, tuple) or len(item) != 2:
@@ -578,6 +579,12 @@ def chat_stream(  # type: ignore[valid-type]
                     kind, data = item
                     if kind == "__final__":
                         break
+                    if kind == "token":
+                        # Writer tokens go straight to the UI; the full reply is persisted once below
+                        streamed = True
+                        seq += 1
+                        yield _sse("delta", {"seq": seq, "content": data["delta"]})
+                        continue
                     try:
                         if kind != "anim":
                             if anim_mode in {"sql", "true"}:
@@ -601,7 +608,8 @@ def chat_stream(  # type: ignore[valid-type]
                     text = resp.reply or ""
                 else:
                     text = ""
-                for line in text.splitlines(True):
+                # 'done' carries content_full, so a streamed reply is not re-sent line by line
+                for line in () if streamed else text.splitlines(True):
                     if not line:
                         continue
                     seq += 1
@@ -11,7 +11,7 @@ from ....core.database import get_session
 from ....models.user import User
 from ....repositories.conversation_repository import ConversationRepository
 from ....core.security import get_current_user, user_is_admin
-from ....integrations.mindsdb_client import MindsDBClient
+from ....integrations.mindsdb_client import get_mindsdb_client
 from ....core.config import settings
 from ....utils.rows import normalize_rows
 from ....utils.text import sanitize_title
@@ -245,8 +245,7 @@ def get_message_dataset(  # type: ignore[valid-type]
         log.warning("Invalid SQL for dataset: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
-    client = MindsDBClient(base_url=settings.mindsdb_base_url, token=settings.mindsdb_token)
-    data = client.sql(s)
+    data = get_mindsdb_client().sql(s)
 
     # Normaliser le résultat (inspiré de ChatService._normalize_result)
     rows: list[Any] = []
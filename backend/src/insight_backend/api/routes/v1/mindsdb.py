@@ -5,8 +5,7 @@ from typing import Any
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
-from ....core.config import settings
-from ....integrations.mindsdb_client import MindsDBClient
+from ....integrations.mindsdb_client import get_mindsdb_client
 from ....services.mindsdb_sync import sync_all_tables
 
 
@@ -27,14 +26,10 @@ class SyncResponse(BaseModel):
     uploaded: list[str] = Field(default_factory=list)
 
 
-def _client() -> MindsDBClient:
-    return MindsDBClient(base_url=settings.mindsdb_base_url, token=settings.mindsdb_token)
-
-
 @router.post("/sql", response_model=SqlResponse)
 def run_sql(payload: SqlRequest) -> SqlResponse:  # type: ignore[valid-type]
     try:
-        data = _client().sql(payload.query)
+        data = get_mindsdb_client().sql(payload.query)
         return SqlResponse(ok=True, raw=data)
     except Exception as e:  # pragma: no cover - network/remote failure
         raise HTTPException(status_code=502, detail=f"MindsDB SQL failed: {e}")
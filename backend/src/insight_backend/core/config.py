@@ -28,6 +28,10 @@ class Settings(BaseSettings):
     data_root: str = Field("../data", alias="DATA_ROOT")
     vector_store_path: str = Field("../data/vector_store", alias="VECTOR_STORE_PATH")
     tables_dir: str = Field("../data", alias="DATA_TABLES_DIR")
+    # Processes used to compute full table overviews in parallel (1 = sequential)
+    overview_workers: int = Field(1, alias="OVERVIEW_WORKERS")
+    # Full overviews kept in memory per (file mtime/size, filters); 0 disables the cache
+    overview_cache_max_entries: int = Field(64, alias="OVERVIEW_CACHE_MAX_ENTRIES")
     # Default path fixed: 'dictionary' (not 'dictionnary')
     data_dictionary_dir: str = Field("../data/dictionary", alias="DATA_DICTIONARY_DIR")
     # Cap for injected data dictionary JSON in prompts
@@ -60,6 +64,10 @@ class Settings(BaseSettings):
     retrieval_max_tokens: int = Field(220, alias="RETRIEVAL_MAX_TOKENS")
     retrieval_inject_analyst: bool = Field(True, alias="RETRIEVAL_INJECT_ANALYST")
 
+    # Exact-match cache for final LLM replies (rédaction, mise en avant); 0 disables
+    llm_cache_ttl_s: float = Field(1800.0, alias="LLM_CACHE_TTL_S")
+    llm_cache_max_entries: int = Field(256, alias="LLM_CACHE_MAX_ENTRIES")
+
     # Loop (résumés hebdo/mensuels)
     loop_max_tickets: int = Field(60, alias="LOOP_MAX_TICKETS")
     loop_ticket_text_max_chars: int = Field(360, alias="LOOP_TICKET_TEXT_MAX_CHARS")
@@ -70,6 +78,7 @@ class Settings(BaseSettings):
     loop_max_tokens: int = Field(1024, alias="LOOP_MAX_TOKENS")
     loop_max_tickets_per_call: int = Field(400, alias="LOOP_MAX_TICKETS_PER_CALL")
     loop_max_input_chars: int = Field(300000, alias="LOOP_MAX_INPUT_CHARS")
+    loop_workers: int = Field(1, alias="LOOP_WORKERS")
     ticket_context_workers: int = Field(1, alias="TICKET_CONTEXT_WORKERS")
     ticket_context_direct_max_chars: int = Field(100000, alias="TICKET_CONTEXT_DIRECT_MAX_CHARS")
 
@@ -125,6 +134,8 @@ class Settings(BaseSettings):
     evidence_limit_default: int = Field(100, alias="EVIDENCE_LIMIT_DEFAULT")
     agent_output_max_rows: int = Field(200, alias="AGENT_OUTPUT_MAX_ROWS")
     agent_output_max_columns: int = Field(20, alias="AGENT_OUTPUT_MAX_COLUMNS")
+    # Rows sent in SSE `rows` events for intermediate exploration steps (answer stays complete)
+    events_row_preview: int = Field(20, alias="EVENTS_ROW_PREVIEW")
 
     # Exclusions / validation caps
     max_excluded_tables: int = Field(1000, alias="MAX_EXCLUDED_TABLES")
@@ -174,6 +185,20 @@ class Settings(BaseSettings):
             raise ValueError(f"{info.field_name.upper()} must be > 0")
         return int(v)
 
+    @field_validator("loop_workers")
+    @classmethod
+    def _validate_loop_workers(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("LOOP_WORKERS must be > 0")
+        return int(v)
+
+    @field_validator("overview_workers")
+    @classmethod
+    def _validate_overview_workers(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("OVERVIEW_WORKERS must be > 0")
+        return int(v)
+
     @field_validator("ticket_context_workers")
     @classmethod
     def _validate_ticket_context_workers(cls, v: int) -> int:
@@ -195,7 +220,7 @@ class Settings(BaseSettings):
             raise ValueError("LLM_MAX_TOKENS must be > 0")
         return int(v)
 
-    @field_validator("agent_output_max_rows", "agent_output_max_columns")
+    @field_validator("agent_output_max_rows", "agent_output_max_columns", "events_row_preview")
     @classmethod
     def _validate_agent_output_caps(cls, v: int, info: ValidationInfo) -> int:
         if v <= 0:
@@ -222,6 +247,8 @@ class Settings(BaseSettings):
 
     # NL→SQL multi‑agent (always enabled)
     nl2sql_satisfaction_min_rows: int = Field(1, alias="NL2SQL_SATISFACTION_MIN_ROWS")
+    # Rows kept per exploration evidence entry re-sent to the agents each round
+    nl2sql_max_rows_per_evidence: int = Field(20, alias="NL2SQL_MAX_ROWS_PER_EVIDENCE")
 
     @property
     def allowed_origins(self) -> List[str]:
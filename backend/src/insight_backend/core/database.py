@@ -29,6 +29,7 @@ def init_database() -> None:
 
     Base.metadata.create_all(bind=engine)
     _ensure_conversation_indexes()
+    _ensure_loop_indexes()
     _ensure_conversation_settings_column()
     _ensure_user_password_reset_column()
     _ensure_user_settings_column()
@@ -271,6 +272,20 @@ def _ensure_conversation_indexes() -> None:
     log.info("Conversation composite indexes ensured.")
 
 
+def _ensure_loop_indexes() -> None:
+    """Ensure the composite index behind the "latest summary per kind" query exists.
+
+    Matches the ROW_NUMBER() partition/order used by LoopRepository.list_latest_summaries.
+    """
+    stmt = (
+        "CREATE INDEX IF NOT EXISTS ix_loop_summaries_cfg_kind_start "
+        "ON loop_summaries (config_id, kind, period_start DESC, id DESC)"
+    )
+    with engine.begin() as conn:
+        conn.execute(text(stmt))
+    log.info("Loop summaries composite index ensured.")
+
+
 def _ensure_conversation_settings_column() -> None:
     """Ensure a JSON settings column exists on conversations for per-conversation prefs.
 
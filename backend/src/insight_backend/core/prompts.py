@@ -63,6 +63,12 @@ def _extract_placeholders(template: str) -> list[str]:
     return sorted({m.group(1) for m in _PLACEHOLDER_RE.finditer(template)})
 
 
+@lru_cache(maxsize=256)
+def _template_segments(template: str) -> tuple[str, ...]:
+    """Template découpé une seule fois: textes fixes aux indices pairs, variables aux indices impairs."""
+    return tuple(_PLACEHOLDER_RE.split(template))
+
+
 class PromptStore:
     def __init__(self, path: Path) -> None:
         self.path = path
@@ -92,11 +98,10 @@ class PromptStore:
         if missing:
             raise KeyError(f"Variables manquantes pour '{key}': {', '.join(missing)}")
 
-        def _replace(match: re.Match[str]) -> str:
-            name = match.group(1)
-            return str(variables[name])
-
-        return _PLACEHOLDER_RE.sub(_replace, entry.template)
+        parts = list(_template_segments(entry.template))
+        for idx in range(1, len(parts), 2):
+            parts[idx] = str(variables[parts[idx]])
+        return "".join(parts)
 
     def update_template(self, key: str, template: str) -> PromptEntry:
         raw = self._read_raw()
@@ -118,9 +123,11 @@ class PromptStore:
         return self.get(key)
 
     def _load_catalog(self) -> PromptCatalog:
-        if not self.path.exists():
-            raise FileNotFoundError(f"Fichier de prompts introuvable: {self.path}")
-        mtime = self.path.stat().st_mtime
+        # Un seul stat() par lecture: appelé à chaque get()/render() des agents
+        try:
+            mtime = self.path.stat().st_mtime
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Fichier de prompts introuvable: {self.path}") from None
         if self._cache is not None and self._cache_mtime == mtime:
             return self._cache
         raw = self._read_raw()
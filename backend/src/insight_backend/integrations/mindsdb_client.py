@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import httpx
 
@@ -70,3 +72,31 @@ class MindsDBClient:
         resp = self.client.post(url, headers={**self._headers(), "Content-Type": "application/json"}, json=payload)
         resp.raise_for_status()
         return resp.json()
+
+    def sql_batch(self, queries: List[str]) -> List[Dict[str, Any]]:
+        """Execute several SQL queries, returning results in input order.
+
+        The REST endpoint runs one statement per call, so the queries are
+        dispatched concurrently over the shared connection pool rather than
+        joined with ``;``. The first failing query raises, as with ``sql``.
+        """
+        if len(queries) <= 1:
+            return [self.sql(q) for q in queries]
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            return list(executor.map(self.sql, queries))
+
+
+@lru_cache
+def get_mindsdb_client() -> MindsDBClient:
+    """Process-wide client so chat turns reuse pooled TCP/TLS connections.
+
+    ``httpx.Client`` is thread-safe; do not ``close()`` it from request code.
+    """
+    return MindsDBClient(base_url=settings.mindsdb_base_url, token=settings.mindsdb_token)
+
+
+def close_mindsdb_client() -> None:
+    """Release the shared client's connections (application shutdown)."""
+    if get_mindsdb_client.cache_info().currsize:
+        get_mindsdb_client().close()
+        get_mindsdb_client.cache_clear()
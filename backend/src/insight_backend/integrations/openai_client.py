@@ -8,6 +8,8 @@ from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional
 
 import httpx
+from pydantic_core import from_json, to_json
+
 from ..core.config import resolve_project_path, settings
 
 
@@ -67,7 +69,8 @@ def _extract_response_text(payload: Dict[str, Any]) -> Optional[str]:
     return content if isinstance(content, str) else None
 
 
-def _collect_stream_content(payload: Dict[str, Any], parts: List[str]) -> None:
+def collect_stream_content(payload: Dict[str, Any], parts: List[str]) -> None:
+    """Append the text deltas of an SSE chat chunk to ``parts``."""
     choices = payload.get("choices")
     if not isinstance(choices, list):
         return
@@ -87,6 +90,7 @@ class OpenAICompatibleClient:
 
     Works with vLLM's OpenAI server and providers that expose the same schema.
     Only implements what we need now to keep the surface small.
+    Request and response bodies go through pydantic_core's JSON (Rust) codec.
     """
 
     def __init__(self, *, base_url: str, api_key: Optional[str] = None, timeout_s: float = 30.0):
@@ -119,7 +123,7 @@ class OpenAICompatibleClient:
         }
         log.debug("POST %s model=%s", url, model)
         try:
-            resp = self.client.post(url, headers=headers, json=payload)
+            resp = self.client.post(url, headers=headers, content=to_json(payload))
             resp.raise_for_status()
         except httpx.ConnectError as exc:
             _append_llm_trace({**trace, "error": str(exc)})
@@ -163,7 +167,7 @@ class OpenAICompatibleClient:
             _append_llm_trace({**trace, "error": str(exc)})
             log.error("LLM backend request failed for %s: %s", url, exc)
             raise OpenAIBackendError("Erreur lors de l'appel au backend LLM.") from exc
-        data = resp.json()
+        data = from_json(resp.content)
         trace["response"] = _extract_response_text(data)
         _append_llm_trace(trace)
         return data
@@ -177,7 +181,7 @@ class OpenAICompatibleClient:
         payload.update(params)
         log.debug("POST %s model=%s (embeddings, batch=%d)", url, model, len(inputs))
         try:
-            resp = self.client.post(url, headers=headers, json=payload)
+            resp = self.client.post(url, headers=headers, content=to_json(payload))
             resp.raise_for_status()
         except httpx.ConnectError as exc:
             log.error("Embedding backend unreachable at %s: %s", url, exc)
@@ -210,7 +214,7 @@ class OpenAICompatibleClient:
         except httpx.HTTPError as exc:
             log.error("Embedding backend request failed for %s: %s", url, exc)
             raise OpenAIBackendError("Erreur lors de l'appel au backend d'embeddings.") from exc
-        data = resp.json()
+        data = from_json(resp.content)
         try:
             items = data["data"]
         except Exception as exc:  # pragma: no cover - defensive
@@ -260,7 +264,7 @@ class OpenAICompatibleClient:
         content_parts: List[str] = []
         log.debug("STREAM %s model=%s", url, model)
         try:
-            with self.client.stream("POST", url, headers=headers, json=payload) as resp:
+            with self.client.stream("POST", url, headers=headers, content=to_json(payload)) as resp:
                 resp.raise_for_status()
                 for line in resp.iter_lines():
                     if not line:
@@ -272,11 +276,11 @@ class OpenAICompatibleClient:
                     if data == "[DONE]":
                         break
                     try:
-                        chunk = json.loads(data)
+                        chunk = from_json(data)
                     except Exception as exc:  # pragma: no cover - defensive parsing
                         log.error("Invalid SSE chunk: %s", exc)
                         continue
-                    _collect_stream_content(chunk, content_parts)
+                    collect_stream_content(chunk, content_parts)
                     yield chunk
         except httpx.ConnectError as exc:
             trace["response"] = "".join(content_parts) if content_parts else None
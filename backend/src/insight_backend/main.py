@@ -6,6 +6,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from .core.config import settings, assert_secure_configuration
 from .core.logging import configure_logging
 from .core.database import init_database, session_scope
+from .integrations.mindsdb_client import close_mindsdb_client
 from .api.routes.v1.health import router as health_router
 from .api.routes.v1.chat import router as chat_router
 from .api.routes.v1.data import router as data_router
@@ -21,6 +22,9 @@ from .api.routes.v1.prompts import router as prompts_router
 from .api.routes.v1.tickets import router as tickets_router
 from .repositories.user_repository import UserRepository
 from .services.auth_service import AuthService
+from .services.data_service import close_overview_pool
+from .services.looper_agent import close_looper_clients
+from .services.mcp_chart_service import close_chart_agents
 
 
 configure_logging(settings.log_level)
@@ -71,6 +75,16 @@ def create_app() -> FastAPI:
             if created:
                 log.info("Default admin user created: %s", settings.admin_username)
 
+    @app.on_event("shutdown")
+    def _shutdown() -> None:
+        close_mindsdb_client()
+        close_looper_clients()
+        close_overview_pool()
+
+    @app.on_event("shutdown")
+    async def _shutdown_chart_agents() -> None:
+        await close_chart_agents()
+
     return app
 
 
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 import csv
-from typing import Iterable, List, Dict, Any
+from typing import Iterable, Iterator, List, Dict, Any
 import logging
 
 
 log = logging.getLogger("insight.repositories.data")
 
 
+# Header cache across requests; (mtime_ns, size) in the key invalidates rewritten files
+@lru_cache(maxsize=512)
+def _read_header(path: str, delimiter: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        try:
+            return tuple(next(reader))
+        except StopIteration:
+            return ()
+
+
 @dataclass
 class DataRepository:
     """Accès aux données (système de fichiers, S3, DB, etc.).
@@ -62,51 +74,61 @@ class DataRepository:
             raise FileNotFoundError(f"Table introuvable: {table_name}")
 
         delimiter = "," if path.suffix.lower() == ".csv" else "\t"
-        with path.open("r", newline="", encoding="utf-8") as f:
-            reader = csv.reader(f, delimiter=delimiter)
-            try:
-                header = next(reader)
-            except StopIteration:
-                header = []
+        stat = path.stat()
+        header = _read_header(str(path), delimiter, stat.st_mtime_ns, stat.st_size)
 
         cols = [(h, None) for h in header]
         log.info("Schéma table '%s' (%d colonnes)", table_name, len(cols))
         return cols
 
     def read_rows(self, table_name: str, *, columns: Iterable[str] | None = None) -> List[Dict[str, Any]]:
+        return list(self.iter_rows(table_name, columns=columns))
+
+    def iter_rows(self, table_name: str, *, columns: Iterable[str] | None = None) -> Iterator[Dict[str, Any]]:
+        """Lignes de la table, lues au fil de l'eau (le fichier reste ouvert pendant l'itération).
+
+        La table est résolue immédiatement: ``FileNotFoundError`` est levée à l'appel,
+        pas à la première itération.
+        """
         path = self._resolve_table_path(table_name)
         if path is None:
             raise FileNotFoundError(f"Table introuvable: {table_name}")
+        return self._iter_rows_at(path, columns=list(columns) if columns else None)
+
+    def _iter_rows_at(self, path: Path, *, columns: list[str] | None) -> Iterator[Dict[str, Any]]:
         delimiter = "," if path.suffix.lower() == ".csv" else "\t"
+        count = 0
+        wanted: list[str] | None = None
         with path.open("r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f, delimiter=delimiter)
-            wanted: list[str] | None = None
             if columns:
-                header = reader.fieldnames or []
+                reader = csv.reader(f, delimiter=delimiter)
+                header = next(reader, [])
                 lookup = {col.casefold(): col for col in header}
+                # Dernière occurrence d'un nom, comme csv.DictReader
+                position = {name: idx for idx, name in enumerate(header)}
                 wanted = []
-                seen: set[str] = set()
                 for col in columns:
-                    key = (col or "").casefold()
-                    target = lookup.get(key)
-                    if target and target not in seen:
+                    # Nom exact d'abord (`ID` et `id` peuvent coexister), sinon sans casse
+                    target = col if col in position else lookup.get((col or "").casefold())
+                    if target and target not in wanted:
                         wanted.append(target)
-                        seen.add(target)
-
-            rows: list[dict[str, Any]] = []
-            for row in reader:
-                if not row:
-                    continue
-                mapping = dict(row)
-                if wanted is not None:
-                    filtered = {name: mapping.get(name) for name in wanted}
-                    rows.append(filtered)
-                else:
-                    rows.append(mapping)
+                # Projection: seules les colonnes demandées sont converties en dict
+                picks = [(name, position[name]) for name in wanted]
+                for raw in reader:
+                    if not raw:
+                        continue
+                    width = len(raw)
+                    count += 1
+                    yield {name: raw[idx] if idx < width else None for name, idx in picks}
+            else:
+                for row in csv.DictReader(f, delimiter=delimiter):
+                    if not row:
+                        continue
+                    count += 1
+                    yield dict(row)
         log.info(
             "Chargé %d lignes depuis %s%s",
-            len(rows),
+            count,
             path.name,
             f" (colonnes filtrées: {wanted})" if wanted is not None else "",
         )
-        return rows
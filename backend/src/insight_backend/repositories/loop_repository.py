@@ -4,6 +4,7 @@ import logging
 from datetime import datetime, date
 from typing import Iterable, Literal
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from ..models.loop import LoopConfig, LoopSummary
@@ -20,22 +21,29 @@ class LoopRepository:
         self.session = session
 
     # --- Config --------------------------------------------------------
-    def list_configs(self) -> list[LoopConfig]:
-        items = (
-            self.session.query(LoopConfig)
-            .order_by(LoopConfig.updated_at.desc(), LoopConfig.id.desc())
-            .all()
-        )
+    def list_configs(self, *, allowed_tables: Iterable[str] | None = None) -> list[LoopConfig]:
+        query = self.session.query(LoopConfig)
+        casefold_lookup: set[str] | None = None
+        if allowed_tables is not None:
+            names = list(allowed_tables)
+            if not names:
+                return []
+            if all(name.isascii() for name in names):
+                # Filtre insensible à la casse poussé en SQL plutôt que côté Python
+                lookup = {name.lower() for name in names}
+                query = query.filter(func.lower(LoopConfig.table_name).in_(lookup))
+            else:
+                # lower() de SQLite ne replie que l'ASCII ("Équipe" != "équipe"): casefold Python
+                casefold_lookup = {name.casefold() for name in names}
+        items = query.order_by(LoopConfig.updated_at.desc(), LoopConfig.id.desc()).all()
+        if casefold_lookup is not None:
+            items = [config for config in items if config.table_name.casefold() in casefold_lookup]
         log.debug("Loaded %d loop configs", len(items))
         return items
 
     def get_config_by_table(self, table_name: str) -> LoopConfig | None:
-        lookup = table_name.casefold()
-        items = self.list_configs()
-        for config in items:
-            if config.table_name.casefold() == lookup:
-                return config
-        return None
+        items = self.list_configs(allowed_tables=[table_name])
+        return items[0] if items else None
 
     def get_config_by_id(self, config_id: int) -> LoopConfig | None:
         return self.session.query(LoopConfig).filter(LoopConfig.id == config_id).first()
@@ -125,3 +133,33 @@ class LoopRepository:
         )
         log.debug("Loaded %d loop summaries (kind=%s, config_id=%s)", len(items), kind, config_id)
         return items
+
+    def list_latest_summaries(self, *, config_ids: Iterable[int]) -> dict[int, dict[str, LoopSummary]]:
+        """Dernier résumé par (config, kind), en une seule requête."""
+        ids = list(config_ids)
+        if not ids:
+            return {}
+        rank = (
+            func.row_number()
+            .over(
+                partition_by=(LoopSummary.config_id, LoopSummary.kind),
+                order_by=(LoopSummary.period_start.desc(), LoopSummary.id.desc()),
+            )
+            .label("rank")
+        )
+        ranked = (
+            self.session.query(LoopSummary.id.label("id"), rank)
+            .filter(LoopSummary.config_id.in_(ids))
+            .subquery()
+        )
+        items = (
+            self.session.query(LoopSummary)
+            .join(ranked, LoopSummary.id == ranked.c.id)
+            .filter(ranked.c.rank == 1)
+            .all()
+        )
+        latest: dict[int, dict[str, LoopSummary]] = {}
+        for item in items:
+            latest.setdefault(item.config_id, {})[item.kind] = item
+        log.debug("Loaded %d latest loop summaries (configs=%d)", len(items), len(ids))
+        return latest
@@ -1,14 +1,22 @@
+import contextvars
 import logging
 import json
 import re
+import threading
 
-from sqlglot import parse_one, exp
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+
+from sqlglot import Dialect, parse_one, exp
+from sqlglot.generator import Generator
 from pathlib import Path
 from typing import Protocol, Callable, Dict, Any, Iterable, List
 
 from ..schemas.chat import ChatRequest, ChatResponse, ChatMessage
 from ..core.config import settings, resolve_project_path
-from ..integrations.mindsdb_client import MindsDBClient
+from ..integrations.mindsdb_client import MindsDBClient, get_mindsdb_client
 from ..repositories.data_repository import DataRepository
 from ..repositories.dictionary_repository import DataDictionaryRepository
 from .nl2sql_service import NL2SQLService
@@ -22,21 +30,69 @@ log = logging.getLogger("insight.services.chat")
 # Maximum exploration steps per round for NL→SQL explorer
 NL2SQL_EXPLORE_MAX_STEPS = 3
 
+# Static user-facing messages
+_HIGHLIGHT_PREFIX = "Mise en avant : "
+_MSG_NO_EFFECTIVE_TABLES = (
+    "Aucune table active pour vos requêtes après application des exclusions. "
+    "Réactivez des tables dans le panneau ‘Données utilisées’."
+)
+_MSG_EXPLORATION_DISABLED = (
+    "Exploration désactivée: aucun tour autorisé avec les plafonds d'agents actuels. "
+    "Ajustez AGENT_MAX_REQUESTS pour 'explorateur'/'analyste' ou relancez la requête."
+)
+_MSG_NO_SATISFYING_ANSWER = (
+    "Impossible de produire une réponse satisfaisante après l'exploration. "
+    "Affinez votre question ou vérifiez les données disponibles."
+)
+_MSG_EMPTY_ANSWER = "Je n'ai pas pu formuler de réponse à partir des résultats."
+
+# '/sql <query>' passthrough command; matched on the prefix only (no full-message casefold)
+_SQL_COMMAND_RE = re.compile(r"\s*/sql ", re.IGNORECASE)
+
+
+def extract_sql_command(text: str) -> str | None:
+    """Return the SQL of a ``/sql <query>`` message, or ``None`` for regular messages."""
+    match = _SQL_COMMAND_RE.match(text)
+    if match is None:
+        return None
+    return text[match.end():].strip() or None
+
+
+_WS_RE = re.compile(r"\s+")
+
 
 def _preview_text(text: str, *, limit: int = 160) -> str:
     """Return a single-line preview capped at ``limit`` characters."""
-    compact = " ".join(text.split())
+    compact = _WS_RE.sub(" ", text).strip()
     if len(compact) <= limit:
         return compact
     cutoff = max(limit - 3, 1)
     return f"{compact[:cutoff]}..."
 
 
-def _serialize_dico_compact(dico: Dict[str, Any], *, limit: int) -> tuple[str, bool, int, int]:
+def _emit_rows(
+    events: Callable[[str, Dict[str, Any]], None],
+    payload: Dict[str, Any],
+    *,
+    full: bool,
+) -> None:
+    """Emit a ``rows`` event; intermediate steps only carry a row preview.
+
+    ``row_count`` keeps the real size and ``truncated`` flags a shortened payload.
+    """
+    rows = payload.get("rows") or []
+    cap = settings.events_row_preview
+    if not full and len(rows) > cap:
+        payload = {**payload, "rows": rows[:cap], "truncated": True}
+    events("rows", payload)
+
+
+def _serialize_dico_compact(dico: Dict[str, Any], *, limit: int, max_cols: int) -> tuple[str, bool, int, int]:
     """Return a JSON string for ``dico`` within ``limit`` chars when possible.
 
     Falls back to a compact subset while keeping valid JSON. Returns a tuple
     of (json_str, truncated_flag, kept_tables, kept_cols_per_table_max).
+    ``max_cols`` is the widest table of ``dico``, counted by the caller's own pass.
     """
     def _dumps(obj: Any) -> str:
         return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
@@ -44,7 +100,7 @@ def _serialize_dico_compact(dico: Dict[str, Any], *, limit: int) -> tuple[str, b
     raw = _dumps(dico)
     if len(raw) <= limit:
         # no truncation
-        return raw, False, len(dico), max((len(v.get("columns", [])) for v in dico.values()), default=0)
+        return raw, False, len(dico), max_cols
 
     # Try progressively smaller subsets: fewer columns per table, then fewer tables
     tables = list(dico.items())
@@ -75,6 +131,214 @@ def _serialize_dico_compact(dico: Dict[str, Any], *, limit: int) -> tuple[str, b
     return _dumps({}), True, 0, 0
 
 
+_SELECT_STAR_RE = re.compile(r"\bselect\s+\*", re.IGNORECASE)
+_LIMIT_RE = re.compile(r"\blimit\b", re.IGNORECASE)
+# Whitespace, comments and opening parentheses that may precede the leading keyword
+_SQL_LEADING_NOISE_RE = re.compile(r"(?:\s+|\(|--[^\n]*(?:\n|$)|/\*.*?\*/)*", re.DOTALL)
+_GENERATOR_LOCAL = threading.local()
+
+
+def _sql_generator() -> Generator:
+    """Per-thread default-dialect generator (instances keep per-call state, so they are not shared)."""
+    generator = getattr(_GENERATOR_LOCAL, "generator", None)
+    if generator is None:
+        generator = _GENERATOR_LOCAL.generator = Dialect.get_or_raise(None).generator()
+    return generator
+
+
+# Follow-up questions re-run the same final SQL: derived evidence queries are
+# pure functions of (sql, limit) and are shared across requests
+@lru_cache(maxsize=512)
+def _derive_evidence_sql_cached(sql: str, limit: int) -> str | None:
+    try:
+        # Only SELECT / WITH … SELECT qualify: reject anything else before parsing
+        start = _SQL_LEADING_NOISE_RE.match(sql).end()  # type: ignore[union-attr]
+        if not sql[start : start + 6].lower().startswith(("select", "with")):
+            return None
+
+        # If already SELECT * then just ensure LIMIT.
+        if _SELECT_STAR_RE.search(sql):
+            return sql if _LIMIT_RE.search(sql) else f"{sql} LIMIT {limit}"
+
+        node = parse_one(sql, read=None)  # autodetect dialect, tolerant parser
+
+        # Reject DML/DDL early
+        if isinstance(node, (exp.Insert, exp.Update, exp.Delete, exp.Alter, exp.Drop, exp.Create)):
+            return None
+
+        # Handle SELECT (optionally with WITH ... CTEs)
+        select_node: exp.Select | None = None
+        if isinstance(node, exp.Select):
+            select_node = node
+        elif isinstance(node, exp.With) and isinstance(node.this, exp.Select):
+            select_node = node.this
+        # Skip set operations (UNION/INTERSECT/EXCEPT): non-trivial to preserve semantics safely
+        elif isinstance(node, (exp.Union, exp.Intersect, exp.Except)):
+            return None
+
+        if not select_node:
+            return None
+
+        from_ = select_node.args.get("from_")
+        if from_ is None:
+            # No FROM → nothing to select as evidence
+            return None
+        # Build the node directly with FROM / WHERE / CTEs moved over (the parsed tree is
+        # private to this call, no copies needed) and a LIMIT cap
+        base_select = exp.Select(
+            expressions=[exp.Star()],
+            from_=from_,
+            where=select_node.args.get("where"),
+            with_=select_node.args.get("with_"),
+            limit=exp.Limit(expression=exp.Literal.number(limit)),
+        )
+
+        # Render back to SQL (defaults to standard dialect)
+        return _sql_generator().generate(base_select)
+    except Exception:  # pragma: no cover - defensive
+        log.warning("_derive_evidence_sql failed", exc_info=True)
+        return None
+
+
+# Result column sets repeat across a session: the column-only part of the evidence
+# spec is cached, the (mutable) spec itself is assembled per call
+@lru_cache(maxsize=256)
+def _evidence_columns_profile(columns: tuple[str, ...]) -> tuple[str, tuple[tuple[str, str], ...], bool, bool]:
+    """Return (pk, display items, has ticket column, has feedback column) for ``columns``."""
+    # lowercased name -> actual column (first wins); candidates below are lowercase literals
+    cols_map: dict[str, str] = {}
+    has_ticket = has_feedback = False
+    for c in columns:
+        lowered = c.lower()
+        cols_map.setdefault(lowered, c)
+        has_ticket = has_ticket or "ticket" in lowered
+        has_feedback = has_feedback or "feedback" in lowered
+
+    def pick(*candidates: str) -> str | None:
+        for c in candidates:
+            found = cols_map.get(c)
+            if found is not None:
+                return found
+        return None
+
+    pk = pick("ticket_id", "feedback_id", "id", "pk") or (columns[0] if columns else "id")
+    display = tuple(
+        (key, col)
+        for key, col in (
+            ("title", pick("title", "subject", "name")),
+            ("status", pick("status", "state")),
+            ("created_at", pick("created_at", "createdat", "date", "timestamp", "createdon", "created")),
+        )
+        if col
+    )
+    return pk, display, has_ticket, has_feedback
+
+
+class _RequestSQLCache:
+    """Per-request memoization of MindsDB results keyed by the exact SQL text.
+
+    Identical statements issued across exploration rounds, the final answer and
+    the evidence panel are served from memory instead of a new HTTP round-trip.
+    A statement already running in another thread (evidence prefetch) is awaited
+    rather than sent again; a failed call is not cached and the waiter retries it.
+    """
+
+    def __init__(self, client: MindsDBClient):
+        self._client = client
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def sql(self, query: str) -> Dict[str, Any]:
+        key = query.strip()
+        with self._lock:
+            cached = self._results.get(key)
+            pending = self._pending.get(key) if cached is None else None
+            owner = cached is None and pending is None
+            if owner:
+                pending = self._pending[key] = Future()
+        if cached is not None:
+            log.debug("MindsDB SQL served from request cache: %s", _preview_text(key, limit=200))
+            return cached
+        if not owner:
+            try:
+                return pending.result()  # type: ignore[union-attr]
+            except Exception:
+                return self.sql(query)
+        try:
+            result = self._client.sql(query)
+        except BaseException as exc:
+            self._settle([key], [pending], error=exc)  # type: ignore[list-item]
+            raise
+        self._settle([key], [pending], results=[result])  # type: ignore[list-item]
+        return result
+
+    def sql_batch(self, queries: List[str]) -> List[Dict[str, Any]]:
+        keys = [q.strip() for q in queries]
+        with self._lock:
+            owned = [k for k in dict.fromkeys(keys) if k not in self._results and k not in self._pending]
+            futures = [self._pending.setdefault(k, Future()) for k in owned]
+        if owned:
+            try:
+                results = self._client.sql_batch(owned)
+            except BaseException as exc:
+                self._settle(owned, futures, error=exc)
+                raise
+            self._settle(owned, futures, results=results)
+        # Statements started elsewhere are awaited one by one
+        return [self._results[k] if k in self._results else self.sql(k) for k in keys]
+
+    def _settle(
+        self,
+        keys: List[str],
+        futures: List[Future],
+        *,
+        results: List[Dict[str, Any]] | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        with self._lock:
+            for idx, key in enumerate(keys):
+                if results is not None:
+                    self._results[key] = results[idx]
+                self._pending.pop(key, None)
+        for idx, future in enumerate(futures):
+            if results is not None:
+                future.set_result(results[idx])
+            else:
+                future.set_exception(error)  # type: ignore[arg-type]
+
+
+class _EvidenceBuffer:
+    """Exploration evidence deduplicated by SQL text, with rows capped per entry.
+
+    Every round re-sends the evidence to the agents; identical statements are
+    kept once and only the first ``max_rows`` rows are retained (``row_count``
+    keeps the real size).
+    """
+
+    def __init__(self, *, max_rows: int):
+        self.max_rows = max_rows
+        self._items: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, *, purpose: str, sql: str, columns: list[Any], rows: list[Any]) -> None:
+        key = str(sql).strip()
+        if key in self._items:
+            return
+        self._items[key] = {
+            "purpose": purpose,
+            "sql": sql,
+            "columns": columns,
+            "rows": rows[: self.max_rows],
+            "row_count": len(rows),
+        }
+
+    def to_list(self) -> list[Dict[str, Any]]:
+        return list(self._items.values())
+
+
 class ChatEngine(Protocol):
     def run(self, payload: ChatRequest) -> ChatResponse:  # type: ignore[valid-type]
         ...
@@ -136,7 +400,7 @@ class ChatService:
         except Exception as exc:
             message = _preview_text(str(exc), limit=160)
             log.error("Retrieval agent failed: %s", message)
-            return [], f"Mise en avant : synthèse indisponible ({message})."
+            return [], f"{_HIGHLIGHT_PREFIX}synthèse indisponible ({message})."
 
     def _format_retrieval_highlight(
         self,
@@ -146,7 +410,7 @@ class ChatService:
         error: str | None = None,
     ) -> str:
         """Compat wrapper kept for tests; delegates to RetrievalAgent where possible."""
-        prefix = "Mise en avant : "
+        prefix = _HIGHLIGHT_PREFIX
         if error:
             return f"{prefix}récupération indisponible ({error})."
         if not payload:
@@ -177,13 +441,12 @@ class ChatService:
 
     @staticmethod
     def _append_highlight(base: str, highlight: str) -> str:
-        base_stripped = (base or "").rstrip()
-        highlight_stripped = (highlight or "").strip()
-        if not highlight_stripped:
-            return base_stripped
-        if not base_stripped:
-            return highlight_stripped
-        return f"{base_stripped}\n\n{highlight_stripped}"
+        # isspace() checks avoid building stripped copies that would be discarded
+        if not highlight or highlight.isspace():
+            return (base or "").rstrip()
+        if not base or base.isspace():
+            return highlight.strip()
+        return f"{base.rstrip()}\n\n{highlight.strip()}"
 
     def completion(
         self,
@@ -214,8 +477,8 @@ class ChatService:
         # If the last user message starts with '/sql ', execute it against MindsDB and return the result.
         if payload.messages:
             last = payload.messages[-1]
-            if last.role == "user" and last.content.strip().casefold().startswith("/sql "):
-                sql = last.content.strip()[5:]
+            sql = extract_sql_command(last.content) if last.role == "user" else None
+            if sql is not None:
                 log.info(
                     "ChatService.mindsdb passthrough: sql_preview=\"%s\"",
                     _preview_text(sql, limit=200),
@@ -225,8 +488,15 @@ class ChatService:
                         events("sql", {"sql": sql})
                     except Exception:  # pragma: no cover - defensive
                         pass
-                client = MindsDBClient(base_url=settings.mindsdb_base_url, token=settings.mindsdb_token)
-                data = client.sql(sql)
+                client = _RequestSQLCache(get_mindsdb_client())
+                # Prefetch the evidence query beside the user's one; _emit_evidence then reads
+                # it from the request cache (a failed prefetch is not cached and is retried there)
+                derived = self._derive_evidence_sql(sql) if events else None
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    # `SELECT * … LIMIT n` is its own evidence query: nothing to prefetch
+                    if derived and derived.strip() != sql.strip():
+                        executor.submit(client.sql, derived)
+                    data = client.sql(sql)
                 # Normalize using a single canonical helper
                 columns, rows = self._normalize_result(data)
 
@@ -252,14 +522,12 @@ class ChatService:
                 )
 
                 if rows and columns:
-                    header = " | ".join(str(c) for c in columns)
+                    header = " | ".join(map(str, columns))
                     lines = [header, "-" * len(header)]
-                    for r in rows[:50]:
-                        if isinstance(r, dict):
-                            line = " | ".join(str(r.get(c)) for c in columns)
-                        else:
-                            line = " | ".join(str(v) for v in r)
-                        lines.append(line)
+                    lines.extend(
+                        " | ".join(map(str, map(r.get, columns) if isinstance(r, dict) else r))
+                        for r in rows[:50]
+                    )
                     text = "\n".join(lines)
                 else:
                     # Error forwarding
@@ -284,18 +552,24 @@ class ChatService:
                 # Build schema from local CSV headers
                 repo = DataRepository(tables_dir=Path(settings.tables_dir))
                 tables = repo.list_tables()
-                # 1) Appliquer les permissions (si non‑admin)
-                allowed_lookup = {name.casefold() for name in allowed_tables} if allowed_tables is not None else None
-                if allowed_lookup is not None:
-                    tables = [name for name in tables if name.casefold() in allowed_lookup]
-                # 2) Appliquer les exclusions demandées par l'utilisateur (par conversation/requête)
+                # 1) Permissions (si non‑admin) et 2) exclusions demandées par l'utilisateur
+                # (par conversation/requête), appliquées en une passe (casefold une fois par table)
+                allowed_lookup = (
+                    frozenset(name.casefold() for name in allowed_tables) if allowed_tables is not None else None
+                )
                 exclude_raw = meta.get("exclude_tables")
-                exclude_lookup: set[str] = set()
+                exclude_lookup: frozenset[str] = frozenset()
                 if isinstance(exclude_raw, (list, tuple)):
-                    for item in exclude_raw:
-                        if isinstance(item, str) and item.strip():
-                            exclude_lookup.add(item.strip().casefold())
-                effective_tables = [name for name in tables if name.casefold() not in exclude_lookup]
+                    exclude_lookup = frozenset(
+                        item.casefold()
+                        for item in map(str.strip, (x for x in exclude_raw if isinstance(x, str)))
+                        if item
+                    )
+                effective_tables = [
+                    name
+                    for name, folded in zip(tables, map(str.casefold, tables))
+                    if (allowed_lookup is None or folded in allowed_lookup) and folded not in exclude_lookup
+                ]
                 # Synchroniser l'UI (stream): publier les tables effectivement actives
                 if events:
                     try:
@@ -304,17 +578,17 @@ class ChatService:
                         log.debug("Failed to emit effective_tables meta", exc_info=True)
                 # Si aucune table, bloquer explicitement le flux NL→SQL (pas de fallback)
                 if not effective_tables:
-                    message = (
-                        "Aucune table active pour vos requêtes après application des exclusions. "
-                        "Réactivez des tables dans le panneau ‘Données utilisées’."
-                    )
-                    log.info(
-                        "NL2SQL aborted: no effective tables (allowed=%s, exclude=%s)",
-                        sorted(list(allowed_lookup or set())),
-                        sorted(list(exclude_lookup)),
-                    )
+                    if log.isEnabledFor(logging.INFO):
+                        log.info(
+                            "NL2SQL aborted: no effective tables (allowed=%s, exclude=%s)",
+                            sorted(allowed_lookup or ()),
+                            sorted(exclude_lookup),
+                        )
                     return self._log_completion(
-                        ChatResponse(reply=message, metadata={"provider": "nl2sql-acl", "effective_tables": []}),
+                        ChatResponse(
+                            reply=_MSG_NO_EFFECTIVE_TABLES,
+                            metadata={"provider": "nl2sql-acl", "effective_tables": []},
+                        ),
                         context="completion denied (no effective tables)",
                     )
                 tables = effective_tables
@@ -332,15 +606,18 @@ class ChatService:
                     try:
                         # Log if PII columns are present in the prompt material
                         pii_hits: list[str] = []
+                        max_cols = 0
                         for t, spec in dico.items():
-                            for c in spec.get("columns", []):
+                            columns = spec.get("columns", [])
+                            max_cols = max(max_cols, len(columns))
+                            for c in columns:
                                 if bool(c.get("pii")):
                                     pii_hits.append(f"{t}.{c.get('name')}")
                         if pii_hits:
                             log.warning("PII columns included in dictionary: %s", pii_hits)
 
                         blob, truncated, kept_tables, kept_cols = _serialize_dico_compact(
-                            dico, limit=max(1, settings.data_dictionary_max_chars)
+                            dico, limit=max(1, settings.data_dictionary_max_chars), max_cols=max_cols
                         )
                         if truncated:
                             log.warning(
@@ -355,21 +632,24 @@ class ChatService:
                     except Exception as e:
                         log.error("Failed to serialize data dictionary JSON: %s", e, exc_info=True)
                 nl2sql = NL2SQLService()
-                log.info(
-                    "NL2SQL tables selected: %s (allowed=%s)",
-                    tables,
-                    sorted(list(allowed_lookup or set())) if allowed_lookup is not None else "<admin/all>",
-                )
-                log.info(
-                    "NL2SQL question prepared: raw=\"%s\" enriched_preview=\"%s\"",
-                    _preview_text(raw_question, limit=200),
-                    _preview_text(contextual_question_with_dico, limit=200),
-                )
-                client = MindsDBClient(base_url=settings.mindsdb_base_url, token=settings.mindsdb_token)
-                
+                # Sorting the ACL and compacting the dictionary-enriched question are only
+                # worth doing when the records are emitted
+                if log.isEnabledFor(logging.INFO):
+                    log.info(
+                        "NL2SQL tables selected: %s (allowed=%s)",
+                        tables,
+                        sorted(allowed_lookup) if allowed_lookup is not None else "<admin/all>",
+                    )
+                    log.info(
+                        "NL2SQL question prepared: raw=\"%s\" enriched_preview=\"%s\"",
+                        _preview_text(raw_question, limit=200),
+                        _preview_text(contextual_question_with_dico, limit=200),
+                    )
+                client = _RequestSQLCache(get_mindsdb_client())
+
                 # Multi‑agent mode is always enabled
                 if True:
-                    evidence: list[dict[str, object]] = []
+                    evidence = _EvidenceBuffer(max_rows=max(1, settings.nl2sql_max_rows_per_evidence))
                     last_columns: list[Any] = []
                     last_rows: list[Any] = []
                     # Derive exploration rounds from per-agent budgets (explorateur/analyste)
@@ -402,234 +682,254 @@ class ChatService:
                             pass
                     if rounds <= 0:
                         # No exploration rounds allowed by current budgets (e.g., cap set to 0)
-                        message = (
-                            "Exploration désactivée: aucun tour autorisé avec les plafonds d'agents actuels. "
-                            "Ajustez AGENT_MAX_REQUESTS pour 'explorateur'/'analyste' ou relancez la requête."
-                        )
                         return self._log_completion(
                             ChatResponse(
-                                reply=f"{message}\n{self._llm_diag()}",
+                                reply=f"{_MSG_EXPLORATION_DISABLED}\n{self._llm_diag()}",
                                 metadata={"provider": "nl2sql-multiagent-empty", "rounds_used": 0},
                             ),
                             context="completion done (nl2sql-multiagent-no-round)",
                         )
 
-                    for r in range(1, rounds + 1):
-                        try:
-                            observations = None
-                            if evidence:
-                                # Keep a compact summary for prompt control
-                                try:
-                                    observations = f"Evidence so far: {len(evidence)} items."
-                                except Exception:
-                                    observations = None
-                            plan = nl2sql.explore(
-                                question=contextual_question_with_dico,
-                                schema=schema,
-                                max_steps=NL2SQL_EXPLORE_MAX_STEPS,
-                                observations=observations,
-                            )
-                            log.info("NL2SQL explore round %d: %d queries", r, len(plan))
-                            if events:
-                                try:
-                                    events("plan", {"round": r, "steps": plan, "purpose": "explore"})
-                                except Exception:  # pragma: no cover
-                                    pass
-                        except AgentBudgetExceeded:
-                            # Bubble up so API can convert to 429
-                            raise
-                        except Exception as e:
-                            log.error("NL2SQL explore failed (round %d): %s", r, e)
-                            return self._log_completion(
-                                ChatResponse(
-                                    reply=f"Échec de l'exploration (tour {r}): {e}\n{self._llm_diag()}",
-                                    metadata={"provider": "nl2sql-explore"},
-                                ),
-                                context="completion done (nl2sql-explore-error)",
-                            )
-                        # Execute exploration queries
-                        for idx, item in enumerate(plan, start=1):
-                            sql = item["sql"]
-                            purpose = item.get("purpose", "explore")
-                            log.info("MindsDB SQL (explore r=%d step=%d) [%s]: %s", r, idx, purpose or "explore", _preview_text(str(sql), limit=200))
-                            if events:
-                                try:
-                                    events("sql", {"sql": sql, "purpose": "explore", "round": r, "step": idx})
-                                except Exception:
-                                    log.warning("Failed to emit sql event (explore)", exc_info=True)
-                            data = client.sql(sql)
-                            columns, rows = self._normalize_result(data)
-                            if events:
-                                try:
-                                    events(
-                                        "rows",
-                                        {
-                                            "round": r,
-                                            "step": idx,
-                                            "purpose": "explore",
-                                            "columns": columns,
-                                            "rows": rows,
-                                            "row_count": len(rows),
-                                        },
-                                    )
-                                except Exception:
-                                    log.warning("Failed to emit rows event (explore)", exc_info=True)
-                            evidence.append({"purpose": purpose or "explore", "sql": sql, "columns": columns, "rows": rows})
-                            if columns and rows:
-                                last_columns = columns
-                                last_rows = rows
-
-                        # Ask Explorateur to propose chart axes based on evidence (optional)
-                        try:
-                            axes = nl2sql.propose_axes(
-                                question=contextual_question,  # pas de dico nécessaire ici (pas de génération SQL)
-                                schema=schema,
-                                evidence=evidence,
-                                max_items=3,
-                            )
-                            log.info("Axes proposés (r=%d): %s", r, axes)
-                            if events:
-                                try:
-                                    events("meta", {"axes_suggestions": axes, "round": r})
-                                except Exception:
-                                    log.warning("Failed to emit axes suggestions", exc_info=True)
-                        except AgentBudgetExceeded:
-                            # Bubble up so API can convert to 429
-                            raise
-                        except Exception as e:
-                            log.warning("Proposition d'axes indisponible: %s", e)
-
-                        # Ask Analyst to produce final SQL using evidence
-                        try:
-                            final_sql = nl2sql.generate_with_evidence(
-                                question=contextual_question_with_dico,
-                                schema=schema,
-                                evidence=evidence,
-                            )
-                        except AgentBudgetExceeded:
-                            # Bubble up so API can convert to 429
-                            raise
-                        except Exception as e:
-                            log.error("NL2SQL analyst failed to generate SQL: %s", e)
-                            return self._log_completion(
-                                ChatResponse(
-                                    reply=f"Échec de la génération SQL (analyste): {e}\n{self._llm_diag()}",
-                                    metadata={"provider": "nl2sql-analyst"},
-                                ),
-                                context="completion done (nl2sql-analyst-error)",
-                            )
-                        log.info("MindsDB SQL (final): %s", _preview_text(str(final_sql), limit=200))
-                        if events:
+                    # Evidence panel jobs run beside the answer path; leaving the block waits
+                    # for them so their events are sent before the response completes.
+                    with ThreadPoolExecutor(max_workers=1) as evidence_executor:
+                        for r in range(1, rounds + 1):
                             try:
-                                events("sql", {"sql": final_sql, "purpose": "answer", "round": r})
-                            except Exception:
-                                log.warning("Failed to emit sql event (final)", exc_info=True)
-                        result = client.sql(final_sql)
-                        fcols, frows = self._normalize_result(result)
-                        if events:
-                            try:
-                                events(
-                                    "rows",
-                                    {
-                                        "purpose": "answer",
-                                        "round": r,
-                                        "columns": fcols,
-                                        "rows": frows,
-                                        "row_count": len(frows),
-                                    },
+                                observations = None
+                                if evidence:
+                                    # Keep a compact summary for prompt control
+                                    try:
+                                        observations = f"Evidence so far: {len(evidence)} items."
+                                    except Exception:
+                                        observations = None
+                                plan = nl2sql.explore(
+                                    question=contextual_question_with_dico,
+                                    schema=schema,
+                                    max_steps=NL2SQL_EXPLORE_MAX_STEPS,
+                                    observations=observations,
                                 )
-                            except Exception:
-                                log.warning("Failed to emit rows event (final)", exc_info=True)
-                        # Emit evidence for the side panel based on the final result or last non-empty exploration
-                        self._emit_evidence(
-                            events=events,
-                            client=client,
-                            label_hint=raw_question,
-                            base_sql=final_sql,
-                            fallback_columns=last_columns,
-                            fallback_rows=last_rows,
-                        )
-                        if len(frows) >= min_rows:
-                            ev_for_answer = evidence + [
-                                {"purpose": "answer", "sql": final_sql, "columns": fcols, "rows": frows}
-                            ]
-                            # Optionally ask the analyst to draft a SQL-only answer and inject
-                            # it into the retrieval question to guide investigation.
-                            analyst_preview: str | None = None
-                            if settings.retrieval_inject_analyst:
-                                try:
-                                    limit = get_limit("analyste")
-                                    count = get_count("analyste")
-                                    # We already consumed one 'analyste' for generate_with_evidence. Only call
-                                    # synthesize if it won't exceed the cap (when a cap is configured).
-                                    if limit is None or (count + 1) <= limit:
-                                        analyst_preview = nl2sql.synthesize(
-                                            question=contextual_question,
-                                            evidence=ev_for_answer,
-                                        ).strip() or None
-                                    else:
-                                        log.info("Skip analyst preview for retrieval due to cap (%d/%d)", count, limit)
-                                except Exception as e:
-                                    log.warning("Analyst preview unavailable for retrieval injection: %s", e)
-
-                            retrieval_question = contextual_question
-                            if analyst_preview:
-                                retrieval_question = (
-                                    f"{contextual_question}\n\nRéponse analyste (SQL): {analyst_preview}"
-                                )
-                            retrieval_payload, highlight_text = self._retrieve_context(
-                                question=retrieval_question,
-                                events=events,
-                                round_label=r,
-                            )
-                            try:
-                                answer = nl2sql.write(
-                                    question=contextual_question,
-                                    evidence=ev_for_answer,
-                                    retrieval_context=retrieval_payload,
-                                ).strip()
-                                reply_text = answer or "Je n'ai pas pu formuler de réponse à partir des résultats."
-                                metadata = {
-                                    "provider": "nl2sql-multiagent",
-                                    "rounds_used": r,
-                                    "sql": final_sql,
-                                    "agents": ["explorateur", "analyste", "retrieval", "redaction"],
-                                    "retrieval_rows": retrieval_payload,
-                                }
+                                log.info("NL2SQL explore round %d: %d queries", r, len(plan))
+                                if events:
+                                    try:
+                                        events("plan", {"round": r, "steps": plan, "purpose": "explore"})
+                                    except Exception:  # pragma: no cover
+                                        pass
+                            except AgentBudgetExceeded:
+                                # Bubble up so API can convert to 429
+                                raise
+                            except Exception as e:
+                                log.error("NL2SQL explore failed (round %d): %s", r, e)
                                 return self._log_completion(
                                     ChatResponse(
-                                        reply=reply_text,
-                                        metadata=metadata,
+                                        reply=f"Échec de l'exploration (tour {r}): {e}\n{self._llm_diag()}",
+                                        metadata={"provider": "nl2sql-explore"},
                                     ),
-                                    context="completion done (nl2sql-multiagent)",
+                                    context="completion done (nl2sql-explore-error)",
+                                )
+                            # Execute exploration queries in one batch; events keep the plan order
+                            for idx, item in enumerate(plan, start=1):
+                                sql = item["sql"]
+                                purpose = item.get("purpose", "explore")
+                                log.info("MindsDB SQL (explore r=%d step=%d) [%s]: %s", r, idx, purpose or "explore", _preview_text(str(sql), limit=200))
+                                if events:
+                                    try:
+                                        events("sql", {"sql": sql, "purpose": "explore", "round": r, "step": idx})
+                                    except Exception:
+                                        log.warning("Failed to emit sql event (explore)", exc_info=True)
+                            results = client.sql_batch([item["sql"] for item in plan])
+                            for idx, (item, data) in enumerate(zip(plan, results), start=1):
+                                sql = item["sql"]
+                                purpose = item.get("purpose", "explore")
+                                columns, rows = self._normalize_result(data)
+                                if events:
+                                    try:
+                                        _emit_rows(
+                                            events,
+                                            {
+                                                "round": r,
+                                                "step": idx,
+                                                "purpose": "explore",
+                                                "columns": columns,
+                                                "rows": rows,
+                                                "row_count": len(rows),
+                                            },
+                                            full=False,
+                                        )
+                                    except Exception:
+                                        log.warning("Failed to emit rows event (explore)", exc_info=True)
+                                evidence.add(purpose=purpose or "explore", sql=sql, columns=columns, rows=rows)
+                                if columns and rows:
+                                    last_columns = columns
+                                    last_rows = rows
+
+                            evidence_items = evidence.to_list()
+                            # Explorateur (axes) and Analyste (final SQL) only read the evidence:
+                            # run both LLM calls concurrently, then report in the usual order.
+                            with ThreadPoolExecutor(max_workers=2) as executor:
+                                axes_future = executor.submit(
+                                    contextvars.copy_context().run,
+                                    nl2sql.propose_axes,
+                                    question=contextual_question,  # pas de dico nécessaire ici (pas de génération SQL)
+                                    schema=schema,
+                                    evidence=evidence_items,
+                                    max_items=3,
+                                )
+                                final_future = executor.submit(
+                                    contextvars.copy_context().run,
+                                    nl2sql.generate_with_evidence,
+                                    question=contextual_question_with_dico,
+                                    schema=schema,
+                                    evidence=evidence_items,
                                 )
+                            try:
+                                axes = axes_future.result()
+                                log.info("Axes proposés (r=%d): %s", r, axes)
+                                if events:
+                                    try:
+                                        events("meta", {"axes_suggestions": axes, "round": r})
+                                    except Exception:
+                                        log.warning("Failed to emit axes suggestions", exc_info=True)
+                            except AgentBudgetExceeded:
+                                # Bubble up so API can convert to 429
+                                raise
+                            except Exception as e:
+                                log.warning("Proposition d'axes indisponible: %s", e)
+
+                            try:
+                                final_sql = final_future.result()
                             except AgentBudgetExceeded:
                                 # Bubble up so API can convert to 429
                                 raise
                             except Exception as e:
-                                error_reply = f"Échec de la synthèse finale (rédaction): {e}\n{self._llm_diag()}"
+                                log.error("NL2SQL analyst failed to generate SQL: %s", e)
                                 return self._log_completion(
                                     ChatResponse(
-                                        reply=error_reply,
-                                        metadata={
-                                            "provider": "nl2sql-multiagent-synth",
-                                            "retrieval_rows": retrieval_payload,
-                                        },
+                                        reply=f"Échec de la génération SQL (analyste): {e}\n{self._llm_diag()}",
+                                        metadata={"provider": "nl2sql-analyst"},
                                     ),
-                                    context="completion done (nl2sql-multiagent-synth-error)",
+                                    context="completion done (nl2sql-analyst-error)",
                                 )
-                        # Not satisfied; continue another explore round if available
-                    # After all rounds, no satisfactory result
-                    return self._log_completion(
-                        ChatResponse(
-                            reply=(
-                                "Impossible de produire une réponse satisfaisante après l'exploration. "
-                                "Affinez votre question ou vérifiez les données disponibles.\n" + self._llm_diag()
+                            log.info("MindsDB SQL (final): %s", _preview_text(str(final_sql), limit=200))
+                            if events:
+                                try:
+                                    events("sql", {"sql": final_sql, "purpose": "answer", "round": r})
+                                except Exception:
+                                    log.warning("Failed to emit sql event (final)", exc_info=True)
+                            # Evidence for the side panel (derived detail query, or the last non-empty
+                            # exploration) is derived, fetched and emitted while the answer proceeds
+                            if events:
+                                evidence_executor.submit(
+                                    self._emit_evidence,
+                                    events=events,
+                                    client=client,
+                                    label_hint=raw_question,
+                                    base_sql=final_sql,
+                                    fallback_columns=last_columns,
+                                    fallback_rows=last_rows,
+                                )
+                            result = client.sql(final_sql)
+                            fcols, frows = self._normalize_result(result)
+                            if events:
+                                try:
+                                    _emit_rows(
+                                        events,
+                                        {
+                                            "purpose": "answer",
+                                            "round": r,
+                                            "columns": fcols,
+                                            "rows": frows,
+                                            "row_count": len(frows),
+                                        },
+                                        full=True,
+                                    )
+                                except Exception:
+                                    log.warning("Failed to emit rows event (final)", exc_info=True)
+                            if len(frows) >= min_rows:
+                                ev_for_answer = evidence_items + [
+                                    {"purpose": "answer", "sql": final_sql, "columns": fcols, "rows": frows}
+                                ]
+                                # Optionally ask the analyst to draft a SQL-only answer and inject
+                                # it into the retrieval question to guide investigation.
+                                analyst_preview: str | None = None
+                                if settings.retrieval_inject_analyst:
+                                    try:
+                                        limit = get_limit("analyste")
+                                        count = get_count("analyste")
+                                        # We already consumed one 'analyste' for generate_with_evidence. Only call
+                                        # synthesize if it won't exceed the cap (when a cap is configured).
+                                        if limit is None or (count + 1) <= limit:
+                                            analyst_preview = nl2sql.synthesize(
+                                                question=contextual_question,
+                                                evidence=ev_for_answer,
+                                            ).strip() or None
+                                        else:
+                                            log.info("Skip analyst preview for retrieval due to cap (%d/%d)", count, limit)
+                                    except Exception as e:
+                                        log.warning("Analyst preview unavailable for retrieval injection: %s", e)
+
+                                retrieval_question = contextual_question
+                                if analyst_preview:
+                                    retrieval_question = (
+                                        f"{contextual_question}\n\nRéponse analyste (SQL): {analyst_preview}"
+                                    )
+                                retrieval_payload, highlight_text = self._retrieve_context(
+                                    question=retrieval_question,
+                                    events=events,
+                                    round_label=r,
+                                )
+                                try:
+                                    writer_kwargs = {
+                                        "question": contextual_question,
+                                        "evidence": ev_for_answer,
+                                        "retrieval_context": retrieval_payload,
+                                    }
+                                    if events:
+                                        parts: List[str] = []
+                                        for chunk in nl2sql.write_stream(**writer_kwargs):
+                                            parts.append(chunk)
+                                            events("token", {"delta": chunk, "round": r})
+                                        answer = "".join(parts).strip()
+                                    else:
+                                        answer = nl2sql.write(**writer_kwargs).strip()
+                                    reply_text = answer or _MSG_EMPTY_ANSWER
+                                    metadata = {
+                                        "provider": "nl2sql-multiagent",
+                                        "rounds_used": r,
+                                        "sql": final_sql,
+                                        "agents": ["explorateur", "analyste", "retrieval", "redaction"],
+                                        "retrieval_rows": retrieval_payload,
+                                    }
+                                    return self._log_completion(
+                                        ChatResponse(
+                                            reply=reply_text,
+                                            metadata=metadata,
+                                        ),
+                                        context="completion done (nl2sql-multiagent)",
+                                    )
+                                except AgentBudgetExceeded:
+                                    # Bubble up so API can convert to 429
+                                    raise
+                                except Exception as e:
+                                    error_reply = f"Échec de la synthèse finale (rédaction): {e}\n{self._llm_diag()}"
+                                    return self._log_completion(
+                                        ChatResponse(
+                                            reply=error_reply,
+                                            metadata={
+                                                "provider": "nl2sql-multiagent-synth",
+                                                "retrieval_rows": retrieval_payload,
+                                            },
+                                        ),
+                                        context="completion done (nl2sql-multiagent-synth-error)",
+                                    )
+                            # Not satisfied; continue another explore round if available
+                        # After all rounds, no satisfactory result
+                        return self._log_completion(
+                            ChatResponse(
+                                reply=f"{_MSG_NO_SATISFYING_ANSWER}\n{self._llm_diag()}",
+                                metadata={"provider": "nl2sql-multiagent-empty"},
                             ),
-                            metadata={"provider": "nl2sql-multiagent-empty"},
-                        ),
-                        context="completion done (nl2sql-multiagent-empty)",
-                    )
+                            context="completion done (nl2sql-multiagent-empty)",
+                        )
 
         # If no user message was found, fall back to the engine.
         response = self.engine.run(payload)
@@ -647,18 +947,21 @@ class ChatService:
         if not question:
             return "", ""
 
-        history: list[str] = []
-        for msg in messages[:-1]:
+        # Only the last 8 turns are kept: walk backwards and stop once they are collected
+        history: list[tuple[str, str]] = []
+        for msg in islice(reversed(messages), 1, None):
+            if msg.role == "system":
+                continue
             text = msg.content.strip()
             if not text:
                 continue
-            if msg.role == "system":
-                continue
             speaker = "User" if msg.role == "user" else "Assistant"
-            history.append(f"{speaker}: {text}")
+            history.append((speaker, text))
+            if len(history) == 8:
+                break
         if not history:
             return question, question
-        context = "\n".join(history[-8:])
+        context = "\n".join(f"{speaker}: {text}" for speaker, text in reversed(history))
         enriched = (
             "Conversation history (keep implicit references consistent):\n"
             f"{context}\n"
@@ -673,34 +976,20 @@ class ChatService:
         a generic panel for any entity. We pick commonly used field names when present.
         """
         cols_lc = [str(c) for c in columns]
-        cols_set = {c.casefold() for c in cols_lc}
-        def pick(*candidates: str) -> str | None:
-            for c in candidates:
-                if c.casefold() in cols_set:
-                    return c
-            return None
+        pk, display, has_ticket, has_feedback = _evidence_columns_profile(tuple(cols_lc))
 
         # Label guessing based on hint/columns (transparent; only used for labeling)
         label = "Éléments"
-        text = (label_hint or "").casefold()
-        if "ticket" in text or any("ticket" in c for c in cols_set):
+        text = (label_hint or "").lower()
+        if "ticket" in text or has_ticket:
             label = "Tickets"
-        elif "feedback" in text or any("feedback" in c for c in cols_set):
+        elif "feedback" in text or has_feedback:
             label = "Feedback"
 
-        pk = pick("ticket_id", "feedback_id", "id", "pk") or (cols_lc[0] if cols_lc else "id")
-        created_at = pick("created_at", "createdAt", "date", "timestamp", "createdon", "created")
-        status = pick("status", "state")
-        title = pick("title", "subject", "name")
-
         spec: dict[str, Any] = {
             "entity_label": label,
             "pk": pk,
-            "display": {
-                **({"title": title} if title else {}),
-                **({"status": status} if status else {}),
-                **({"created_at": created_at} if created_at else {}),
-            },
+            "display": dict(display),
             "columns": cols_lc,
             "limit": settings.evidence_limit_default,
         }
@@ -720,26 +1009,19 @@ class ChatService:
                 columns = data.get("result", {}).get("columns") or data.get("columns") or columns
 
         columns_list = [str(col) for col in (columns or [])]
-        rows_list = list(rows or [])
-
-        max_rows = settings.agent_output_max_rows
-        if max_rows and len(rows_list) > max_rows:
-            rows_list = rows_list[:max_rows]
+        # Copy only the rows that survive the cap
+        rows_list = list(islice(rows or (), settings.agent_output_max_rows or None))
 
         max_cols = settings.agent_output_max_columns
         if max_cols and columns_list and len(columns_list) > max_cols:
             columns_list = columns_list[:max_cols]
-
-            def _trim_row(row: Any) -> Any:
-                if isinstance(row, dict):
-                    return {col: row.get(col) for col in columns_list}
-                if isinstance(row, list):
-                    return row[: len(columns_list)]
-                if isinstance(row, tuple):
-                    return row[: len(columns_list)]
-                return row
-
-            rows_list = [_trim_row(row) for row in rows_list]
+            keep = tuple(columns_list)
+            # Rows of one payload share a shape: pick the trimmer once from the first row
+            first = rows_list[0] if rows_list else None
+            if isinstance(first, dict):
+                rows_list = [dict(zip(keep, map(row.get, keep))) for row in rows_list]
+            elif isinstance(first, (list, tuple)):
+                rows_list = list(map(itemgetter(slice(len(keep))), rows_list))
 
         return columns_list, rows_list
 
@@ -754,67 +1036,15 @@ class ChatService:
         - Skip set operations (UNION / INTERSECT / EXCEPT) to avoid producing
           misleading evidence; the regular table payload remains available.
         """
-        try:
-            if limit is None:
-                limit = settings.evidence_limit_default
-            s = (sql or "").strip()
-            if not s:
-                return None
-
-            # If already SELECT * then just ensure LIMIT.
-            if re.search(r"\bselect\s+\*", s, re.I):
-                return s if re.search(r"\blimit\b", s, re.I) else f"{s} LIMIT {limit}"
-
-            node = parse_one(s, read=None)  # autodetect dialect, tolerant parser
-
-            # Reject DML/DDL early
-            if isinstance(node, (exp.Insert, exp.Update, exp.Delete, exp.Alter, exp.Drop, exp.Create)):
-                return None
-
-            # Handle SELECT (optionally with WITH ... CTEs)
-            select_node: exp.Select | None = None
-            if isinstance(node, exp.Select):
-                select_node = node
-            elif isinstance(node, exp.With) and isinstance(node.this, exp.Select):
-                select_node = node.this
-            # Skip set operations (UNION/INTERSECT/EXCEPT): non-trivial to preserve semantics safely
-            elif isinstance(node, (exp.Union, exp.Intersect, exp.Except)):
-                return None
-
-            if not select_node:
-                return None
-
-            # Clone FROM / WHERE (keep CTEs if any)
-            base_select = exp.select("*")
-            if select_node.args.get("from") is not None:
-                base_select.set("from", select_node.args["from"].copy())
-            else:
-                # No FROM → nothing to select as evidence
-                return None
-
-            if select_node.args.get("where") is not None:
-                base_select.set("where", select_node.args["where"].copy())
-
-            # Preserve CTEs
-            if select_node.args.get("with") is not None:
-                base_select.set("with", select_node.args["with"].copy())
-
-            # Ensure a LIMIT cap
-            if base_select.args.get("limit") is None:
-                base_select.set("limit", exp.Limit(expression=exp.Literal.number(limit)))
-
-            # Render back to SQL (defaults to standard dialect)
-            derived = base_select.sql()
-            return derived
-        except Exception:  # pragma: no cover - defensive
-            log.warning("_derive_evidence_sql failed", exc_info=True)
-            return None
+        if limit is None:
+            limit = settings.evidence_limit_default
+        return _derive_evidence_sql_cached((sql or "").strip(), limit)
 
     def _emit_evidence(
         self,
         *,
         events: Callable[[str, Dict[str, Any]], None] | None,
-        client: MindsDBClient,
+        client: MindsDBClient | _RequestSQLCache,
         label_hint: str,
         base_sql: str | None = None,
         fallback_columns: list[Any] | None = None,
@@ -832,9 +1062,7 @@ class ChatService:
         try:
             ev_cols: list[Any] = []
             ev_rows: list[Any] = []
-            derived: str | None = None
-            if base_sql:
-                derived = self._derive_evidence_sql(base_sql)
+            derived = self._derive_evidence_sql(base_sql) if base_sql else None
             if derived:
                 try:
                     events("sql", {"sql": derived, "purpose": "evidence"})
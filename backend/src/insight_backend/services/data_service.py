@@ -1,10 +1,24 @@
+import hashlib
+import heapq
 import logging
-from collections import Counter
+import multiprocessing
+from array import array
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import compress, islice
+from operator import itemgetter
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Collection, Iterable, Mapping
+from typing import BinaryIO, Collection, Iterable, Iterator, Mapping
 import csv
+import io
+import mmap
+import os
+import re
+import threading
 
 from ..schemas.data import (
     IngestResponse,
@@ -34,13 +48,20 @@ TABLE_TITLES: dict[str, str] = {
 }
 
 MAX_VALUES_PER_FIELD = 30
+EXPLORE_INDEX_MAX_ENTRIES = 8
+# Raw per-column histograms kept for incremental rescans (unfiltered overviews only)
+OVERVIEW_SCAN_MAX_ENTRIES = 8
+OVERVIEW_BATCH_ROWS = 10_000
 DATE_CONFIDENCE_RATIO = 0.55
 DATE_FIELD_HINT = "date"
+# Columns only hinted as dates stop parsing when almost nothing parses
+DATE_PROBE_MIN_VALUES = 200
+DATE_PROBE_MIN_RATIO = 0.05
 CATEGORY_COLUMN_NAME = "Category"
 SUB_CATEGORY_COLUMN_NAME = "Sub Category"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColumnRoles:
     date_field: str | None = None
     category_field: str | None = None
@@ -51,35 +72,269 @@ class ColumnRoles:
 def _clean_text(value: object | None) -> str | None:
     if value is None:
         return None
-    text = str(value).strip()
+    # CSV cells are already `str`: skip the str() call for them
+    text = (value if value.__class__ is str else str(value)).strip()
     return text or None
 
 
-def _normalize_date(value: object | None) -> str | None:
-    text = _clean_text(value)
-    if not text:
+def _parse_slash_date(text: str) -> date | None:
+    """`dd/mm/yyyy`, `dd/mm/yy` (pivot 69 comme `%y`) ou `yyyy/mm/dd`."""
+    parts = text.split("/")
+    if len(parts) != 3 or not all(part.isascii() and part.isdigit() for part in parts):
         return None
-    candidates = [
-        text.replace(" ", "T"),
-        text,
-    ]
-    for raw in candidates:
+    first, month, last = parts
+    if len(month) > 2:
+        return None
+    if len(first) == 4 and len(last) <= 2:
+        year, day = int(first), int(last)
+    elif len(first) <= 2 and len(last) == 4:
+        year, day = int(last), int(first)
+    elif len(first) <= 2 and len(last) == 2:
+        short = int(last)
+        year, day = (2000 + short if short < 69 else 1900 + short), int(first)
+    else:
+        return None
+    try:
+        return date(year, int(month), day)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=200_000)
+def _normalize_date(text: str) -> str | None:
+    """Normalise une date déjà nettoyée (`_clean_text`) en `YYYY-MM-DD`."""
+    for raw in (text.replace(" ", "T"), text):
         try:
-            dt = datetime.fromisoformat(raw)
-            return dt.date().isoformat()
+            return datetime.fromisoformat(raw).date().isoformat()
         except ValueError:
-            pass
-        for fmt in ("%d/%m/%Y", "%d/%m/%y", "%Y/%m/%d"):
+            continue
+    parsed = _parse_slash_date(text)
+    if parsed is None:
+        log.debug("Impossible de parser la date %r", text)
+        return None
+    return parsed.isoformat()
+
+
+def _iter_rows(reader: Iterable[list[str]], width: int) -> Iterator[list[str | None]]:
+    """Lignes positionnelles avec la sémantique de `csv.DictReader` (lignes vides ignorées, `None` si absente)."""
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            row.extend([None] * (width - len(row)))
+        yield row
+
+
+def _iter_decoded_lines(handle: BinaryIO) -> Iterator[str]:
+    """Lignes physiques décodées, lues une à une pour que `handle.tell()` reste exact."""
+    for line in iter(handle.readline, b""):
+        yield line.decode("utf-8")
+
+
+_BARE_CR = re.compile(rb"\r(?!\n)")
+
+
+def _iter_csv_rows(handle: BinaryIO, delimiter: str, *, start: int = 0) -> Iterator[list[str]]:
+    """Lignes comme `csv.reader`; sans guillemets ni `\\r` isolé, découpe directe du mmap.
+
+    Lit à partir de l'octet `start`; une fois épuisé, `handle` est positionné après la
+    dernière ligne lue.
+    """
+    try:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:  # fichier vide
+        return
+    with mapped:
+        if mapped.find(b'"', start) != -1 or _BARE_CR.search(mapped, start):
+            handle.seek(start)
+            text_handle = io.TextIOWrapper(handle, encoding="utf-8", newline="")
             try:
-                dt = datetime.strptime(raw, fmt)
-                return dt.date().isoformat()
-            except ValueError:
-                continue
-    log.debug("Impossible de parser la date %r", text)
-    return None
+                yield from csv.reader(text_handle, delimiter=delimiter)
+            finally:
+                if not handle.closed:
+                    text_handle.detach()  # the caller owns `handle`
+            return
+        mapped.seek(start)
+        for line in iter(mapped.readline, b""):
+            text = line.decode("utf-8")
+            if text.endswith("\r\n"):
+                text = text[:-2]
+            elif text.endswith("\n"):
+                text = text[:-1]
+            yield text.split(delimiter) if text else []
+        handle.seek(len(mapped))
+
+
+def _read_rows_at(
+    path: Path, offsets: Iterable[int], *, delimiter: str, width: int
+) -> list[list[str | None]]:
+    """Relit uniquement les enregistrements CSV débutant aux positions (octets) données."""
+    rows: list[list[str | None]] = []
+    with path.open("rb") as handle:
+        for position in offsets:
+            handle.seek(position)
+            row = next(csv.reader(_iter_decoded_lines(handle), delimiter=delimiter), [])
+            rows.extend(_iter_rows([row], width))
+    return rows
 
 
 @dataclass
+class ExplorePairIndex:
+    """Lignes d'un couple (Category, Sub Category), stockées en colonnes parallèles."""
+
+    offsets: array = field(default_factory=lambda: array("q"))
+    dates: list[str | None] = field(default_factory=list)
+    sort_keys: list[str] = field(default_factory=list)
+
+
+def _build_explore_index(
+    path: Path, *, delimiter: str, category_idx: int, sub_category_idx: int, date_idx: int
+) -> dict[tuple[str, str], ExplorePairIndex]:
+    """Position de chaque ligne par couple (Category, Sub Category), dans l'ordre du fichier."""
+    index: dict[tuple[str, str], ExplorePairIndex] = {}
+    # Unparsed date texts repeat across rows: keep one object per distinct value
+    # (normalized dates are already shared through the `_normalize_date` LRU)
+    interned: dict[str, str] = {}
+    with path.open("rb") as handle:
+        reader = csv.reader(_iter_decoded_lines(handle), delimiter=delimiter)
+        if next(reader, None) is None:
+            return index
+        width = max(category_idx, sub_category_idx, date_idx) + 1
+        while True:
+            position = handle.tell()
+            raw_row = next(reader, None)
+            if raw_row is None:
+                break
+            for row in _iter_rows([raw_row], width):
+                # Per-row hot path: cells are `str | None`, `_clean_text` inlined
+                raw = row[category_idx]
+                cat_value = raw.strip() if raw else None
+                raw = row[sub_category_idx]
+                sub_value = raw.strip() if raw else None
+                if not cat_value or not sub_value:
+                    continue
+                raw = row[date_idx] if date_idx >= 0 else None
+                date_text = (raw.strip() or None) if raw else None
+                normalized_value = _normalize_date(date_text) if date_text else None
+                if date_text and not normalized_value:
+                    date_text = interned.setdefault(date_text, date_text)
+                pair = index.get((cat_value, sub_value))
+                if pair is None:
+                    pair = index[(cat_value, sub_value)] = ExplorePairIndex()
+                pair.offsets.append(position)
+                pair.dates.append(normalized_value)
+                pair.sort_keys.append(normalized_value or date_text or "")
+    return index
+
+
+SCAN_DIGEST_CHUNK_BYTES = 1 << 20
+
+
+def _prefix_digest(handle: BinaryIO, size: int) -> bytes:
+    """Empreinte BLAKE2b des `size` premiers octets du fichier."""
+    digest = hashlib.blake2b(digest_size=32)
+    handle.seek(0)
+    remaining = size
+    while remaining > 0:
+        chunk = handle.read(min(SCAN_DIGEST_CHUNK_BYTES, remaining))
+        if not chunk:
+            break
+        digest.update(chunk)
+        remaining -= len(chunk)
+    return digest.digest()
+
+
+@dataclass(slots=True)
+class OverviewScan:
+    """Comptages bruts d'un overview complet, prolongeables quand le fichier grossit par ajout."""
+
+    headers: list[str]
+    column_idxs: list[int]
+    date_idx: int
+    category_idx: int
+    sub_category_idx: int
+    date_from: str | None
+    date_to: str | None
+    total_rows: int = 0
+    date_min: str | None = None
+    date_max: str | None = None
+    raw_counts: list[Counter[str | None]] = field(default_factory=list)
+    raw_pairs: Counter[tuple[str | None, str | None]] = field(default_factory=Counter)
+    # Raw date cell -> normalized date, reused for repeated cells and by the
+    # date column accumulator
+    dates_by_raw: dict[str | None, str | None] = field(default_factory=dict)
+    size: int = 0
+    # Empreinte de tout le contenu déjà compté ([0, size)) et fin de ligne finale
+    digest: bytes = b""
+    ends_with_newline: bool = False
+
+    def __post_init__(self) -> None:
+        if not self.raw_counts:
+            self.raw_counts = [Counter() for _ in self.column_idxs]
+
+    def consume(self, rows: Iterator[list[str | None]]) -> None:
+        # Per-column reductions run on batches: Counter.update() tallies raw cells in C.
+        # Date work (normalization, min/max, range filter) runs once per distinct raw
+        # cell; rows are then filtered with `compress`, without per-row branches.
+        date_idx = self.date_idx
+        date_from, date_to = self.date_from, self.date_to
+        filter_dates = bool(date_from or date_to)
+        dates_by_raw = self.dates_by_raw
+        in_range: dict[str | None, bool] = {}
+        while batch := list(islice(rows, OVERVIEW_BATCH_ROWS)):
+            columns = list(zip(*batch))
+            if date_idx >= 0:
+                date_column = columns[date_idx]
+                distinct = set(date_column)
+                for raw_date in distinct.difference(dates_by_raw):
+                    # inlined `_clean_text`
+                    date_text = (raw_date.strip() or None) if raw_date else None
+                    normalized_date = _normalize_date(date_text) if date_text else None
+                    dates_by_raw[raw_date] = normalized_date
+                    if normalized_date:
+                        if self.date_min is None or normalized_date < self.date_min:
+                            self.date_min = normalized_date
+                        if self.date_max is None or normalized_date > self.date_max:
+                            self.date_max = normalized_date
+
+                if filter_dates:
+                    for raw_date in distinct.difference(in_range):
+                        normalized_date = dates_by_raw[raw_date]
+                        in_range[raw_date] = not (
+                            normalized_date is None
+                            or (date_from and normalized_date < date_from)
+                            or (date_to and normalized_date > date_to)
+                        )
+                    batch = list(compress(batch, map(in_range.__getitem__, date_column)))
+                    if not batch:
+                        continue
+                    columns = list(zip(*batch))
+
+            self.total_rows += len(batch)
+            for idx, counts in zip(self.column_idxs, self.raw_counts):
+                counts.update(columns[idx])
+            if self.category_idx >= 0 and self.sub_category_idx >= 0:
+                self.raw_pairs.update(zip(columns[self.category_idx], columns[self.sub_category_idx]))
+
+    def mark_end(self, handle: BinaryIO) -> None:
+        """Mémorise la fin lue et l'empreinte de tout le contenu déjà compté."""
+        self.size = handle.tell()
+        handle.seek(max(self.size - 1, 0))
+        self.ends_with_newline = handle.read(1) == b"\n"
+        self.digest = _prefix_digest(handle, self.size)
+
+    def can_resume(self, handle: BinaryIO, size: int) -> bool:
+        """Vrai si le fichier n'a fait que grossir par lignes complètes depuis la lecture.
+
+        Tout le préfixe déjà compté est relu et comparé à son empreinte: une ligne
+        modifiée n'importe où force une relecture complète.
+        """
+        if size < self.size or not self.ends_with_newline:
+            return False
+        return _prefix_digest(handle, self.size) == self.digest
+
+
+@dataclass(slots=True)
 class FieldAccumulator:
     name: str
     raw_counter: Counter[str] = field(default_factory=Counter)
@@ -87,6 +342,19 @@ class FieldAccumulator:
     non_null: int = 0
     parsed_dates: int = 0
     parse_dates: bool = True
+    probe_dates: bool = False
+
+    def _check_date_probe(self) -> None:
+        """Abandonne l'analyse des dates d'une colonne sondée qui n'en contient presque pas."""
+        if (
+            self.probe_dates
+            and self.non_null >= DATE_PROBE_MIN_VALUES
+            and self.parsed_dates < self.non_null * DATE_PROBE_MIN_RATIO
+        ):
+            self.parse_dates = False
+            self.probe_dates = False
+            self.parsed_dates = 0
+            self.date_counter.clear()
 
     def add(self, value: object | None) -> None:
         text = _clean_text(value)
@@ -100,9 +368,40 @@ class FieldAccumulator:
             if normalized_date:
                 self.parsed_dates += 1
                 self.date_counter[normalized_date] += 1
+            self._check_date_probe()
 
         self.raw_counter[text] += 1
 
+    def add_counts(
+        self,
+        counts: Mapping[str | None, int],
+        *,
+        normalized_dates: Mapping[str | None, str | None] | None = None,
+    ) -> None:
+        """Équivaut à `add` répété `count` fois pour chaque valeur brute.
+
+        `normalized_dates` (valeur brute -> date normalisée) évite de reparser
+        les dates déjà normalisées par l'appelant.
+        """
+        for value, count in counts.items():
+            text = _clean_text(value)
+            if text is None:
+                continue
+
+            self.non_null += count
+
+            if self.parse_dates:
+                if normalized_dates is not None and value in normalized_dates:
+                    normalized_date = normalized_dates[value]
+                else:
+                    normalized_date = _normalize_date(text)
+                if normalized_date:
+                    self.parsed_dates += count
+                    self.date_counter[normalized_date] += count
+                self._check_date_probe()
+
+            self.raw_counter[text] += count
+
     def build_breakdown(self, *, total_rows: int) -> FieldBreakdown:
         """Convert the accumulated values into a serializable breakdown."""
 
@@ -115,20 +414,15 @@ class FieldAccumulator:
                 kind = "date"
                 counter = self.date_counter
 
+        # Top-K selection: one extra item tells whether the list was truncated
         if kind == "date":
-            items = sorted(counter.items(), key=lambda item: item[0])
-            if len(items) > MAX_VALUES_PER_FIELD:
-                items = items[-MAX_VALUES_PER_FIELD:]
-                truncated = True
-            else:
-                truncated = False
+            items = heapq.nlargest(MAX_VALUES_PER_FIELD + 1, counter.items(), key=itemgetter(0))
+            truncated = len(items) > MAX_VALUES_PER_FIELD
+            items = items[:MAX_VALUES_PER_FIELD][::-1]
         else:
-            items = sorted(counter.items(), key=lambda item: (-item[1], item[0]))
-            if len(items) > MAX_VALUES_PER_FIELD:
-                items = items[:MAX_VALUES_PER_FIELD]
-                truncated = True
-            else:
-                truncated = False
+            items = heapq.nsmallest(MAX_VALUES_PER_FIELD + 1, counter.items(), key=lambda item: (-item[1], item[0]))
+            truncated = len(items) > MAX_VALUES_PER_FIELD
+            items = items[:MAX_VALUES_PER_FIELD]
 
         counts = [ValueCount(label=label, count=count) for label, count in items]
         missing_values = max(total_rows - self.non_null, 0)
@@ -145,11 +439,162 @@ class FieldAccumulator:
         )
 
 
+# Pool partagé entre appels (et instances): les workers ne sont lancés qu'une fois
+_overview_pool: ProcessPoolExecutor | None = None
+_overview_pool_workers = 0
+_overview_pool_lock = threading.Lock()
+
+
+def _get_overview_pool(workers: int) -> ProcessPoolExecutor:
+    global _overview_pool, _overview_pool_workers
+    with _overview_pool_lock:
+        if _overview_pool is None or _overview_pool_workers != workers:
+            if _overview_pool is not None:
+                _overview_pool.shutdown(wait=False, cancel_futures=True)
+            # "spawn": the app is a threaded server, a forked child could inherit locks
+            # held by other threads (logging, caches) and deadlock
+            _overview_pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _overview_pool_workers = workers
+        return _overview_pool
+
+
+def _discard_overview_pool(pool: ProcessPoolExecutor) -> None:
+    global _overview_pool
+    with _overview_pool_lock:
+        if _overview_pool is pool:
+            _overview_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def close_overview_pool() -> None:
+    """Arrête les workers d'overview partagés (arrêt de l'application)."""
+    global _overview_pool
+    with _overview_pool_lock:
+        pool, _overview_pool = _overview_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _compute_table_overview_standalone(
+    repo: DataRepository, kwargs: dict[str, object]
+) -> DataSourceOverview | None:
+    """Point d'entrée picklable pour calculer un overview dans un processus worker.
+
+    Le service est jetable: l'état de reprise (`OverviewScan`) reste dans le worker et
+    n'est jamais réutilisé. Avec `OVERVIEW_WORKERS > 1`, un fichier qui grossit est
+    donc relu entièrement (seul le cache de résultats, côté parent, s'applique).
+    """
+    return DataService(repo=repo)._compute_table_overview(**kwargs)
+
+
 class DataService:
     """Gère l’ingestion et la préparation des données."""
 
     def __init__(self, repo: DataRepository | None = None):
         self.repo = repo or DataRepository(tables_dir=Path(settings.tables_dir))
+        self._overview_cache: OrderedDict[tuple, DataSourceOverview] = OrderedDict()
+        self._overview_cache_lock = threading.Lock()
+        self._overview_scans: OrderedDict[tuple, OverviewScan] = OrderedDict()
+        self._explore_indexes: OrderedDict[tuple, dict[tuple[str, str], ExplorePairIndex]] = OrderedDict()
+        self._explore_index_lock = threading.Lock()
+
+    def _get_explore_index(
+        self,
+        path: Path,
+        *,
+        delimiter: str,
+        category_idx: int,
+        sub_category_idx: int,
+        date_idx: int,
+    ) -> dict[tuple[str, str], ExplorePairIndex]:
+        """Index d'exploration en mémoire, reconstruit quand le fichier change (mtime/taille)."""
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size, category_idx, sub_category_idx, date_idx)
+        with self._explore_index_lock:
+            index = self._explore_indexes.get(key)
+            if index is not None:
+                self._explore_indexes.move_to_end(key)
+                return index
+        index = _build_explore_index(
+            path,
+            delimiter=delimiter,
+            category_idx=category_idx,
+            sub_category_idx=sub_category_idx,
+            date_idx=date_idx,
+        )
+        log.debug("Index explore construit pour %s (couples=%d)", path.name, len(index))
+        with self._explore_index_lock:
+            self._explore_indexes[key] = index
+            while len(self._explore_indexes) > EXPLORE_INDEX_MAX_ENTRIES:
+                self._explore_indexes.popitem(last=False)
+        return index
+
+    def _take_overview_scan(self, key: tuple) -> OverviewScan | None:
+        """Retire l'état de lecture du cache: un seul appel le prolonge à la fois."""
+        with self._overview_cache_lock:
+            return self._overview_scans.pop(key, None)
+
+    def _store_overview_scan(self, key: tuple, scan: OverviewScan) -> None:
+        if settings.overview_cache_max_entries <= 0:
+            return
+        with self._overview_cache_lock:
+            self._overview_scans[key] = scan
+            while len(self._overview_scans) > OVERVIEW_SCAN_MAX_ENTRIES:
+                self._overview_scans.popitem(last=False)
+
+    def _overview_cache_key(self, kwargs: Mapping[str, object]) -> tuple | None:
+        """Clé d'un overview complet: fichier (chemin, mtime, taille) + paramètres de calcul."""
+        table_name = str(kwargs["table_name"])
+        path = self.repo._resolve_table_path(table_name)
+        if path is None:
+            return None
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        roles = kwargs["column_roles"]
+        roles_key = (
+            (
+                roles.date_field,
+                roles.category_field,
+                roles.sub_category_field,
+                tuple(roles.ticket_context_fields or ()),
+            )
+            if isinstance(roles, ColumnRoles)
+            else None
+        )
+        return (
+            str(path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            frozenset(kwargs["hidden_fields"] or ()),  # type: ignore[arg-type]
+            kwargs["include_hidden_fields"],
+            roles_key,
+            kwargs["date_from"],
+            kwargs["date_to"],
+            kwargs["explorer_enabled"],
+        )
+
+    def _get_cached_overview(self, key: tuple) -> DataSourceOverview | None:
+        with self._overview_cache_lock:
+            cached = self._overview_cache.get(key)
+            if cached is None:
+                return None
+            self._overview_cache.move_to_end(key)
+        # Callers may mutate the response: never hand out the cached instance
+        return cached.model_copy(deep=True)
+
+    def _store_cached_overview(self, key: tuple, overview: DataSourceOverview) -> None:
+        max_entries = settings.overview_cache_max_entries
+        if max_entries <= 0:
+            return
+        with self._overview_cache_lock:
+            self._overview_cache[key] = overview.model_copy(deep=True)
+            self._overview_cache.move_to_end(key)
+            while len(self._overview_cache) > max_entries:
+                self._overview_cache.popitem(last=False)
 
     def ingest(self, *, path: str | None = None, bytes_: bytes | None = None) -> IngestResponse:  # type: ignore[valid-type]
         raise NotImplementedError
@@ -196,8 +641,10 @@ class DataService:
             table_names = [name for name in table_names if name.casefold() in allowed_set]
             log.debug("Filtered overview tables with permissions (count=%d)", len(table_names))
 
-        normalized_from = _normalize_date(date_from) if date_from else None
-        normalized_to = _normalize_date(date_to) if date_to else None
+        from_text = _clean_text(date_from)
+        normalized_from = _normalize_date(from_text) if from_text else None
+        to_text = _clean_text(date_to)
+        normalized_to = _normalize_date(to_text) if to_text else None
         if date_from and not normalized_from:
             raise ValueError("Paramètre 'date_from' invalide (format attendu ISO 8601).")
         if date_to and not normalized_to:
@@ -231,13 +678,15 @@ class DataService:
             table_names = [name for name in table_names if _is_enabled(name)]
             log.debug("Filtered overview tables for explorer flag (count=%d)", len(table_names))
 
-        sources: list[DataSourceOverview] = []
+        # Slots keep the table order; full scans are filled in once computed
+        slots: list[DataSourceOverview | None] = []
+        jobs: list[tuple[int, dict[str, object]]] = []
         for name in table_names:
             hidden_for_table = hidden_lookup.get(name.casefold(), set())
             enabled_for_table = _is_enabled(name)
             if include_disabled_sources and skip_overview_for_disabled and not enabled_for_table:
                 roles = roles_lookup.get(name.casefold())
-                sources.append(
+                slots.append(
                     DataSourceOverview(
                         source=name,
                         title=TABLE_TITLES.get(name, name),
@@ -253,19 +702,70 @@ class DataService:
                     )
                 )
                 continue
-            overview = self._compute_table_overview(
-                table_name=name,
-                hidden_fields=hidden_for_table,
-                include_hidden_fields=include_hidden_fields,
-                column_roles=roles_lookup.get(name.casefold()),
-                date_from=normalized_from,
-                date_to=normalized_to,
-                explorer_enabled=enabled_for_table,
-                lightweight=lightweight,
-                headers_only=headers_only,
-            )
-            if overview:
-                sources.append(overview)
+            kwargs: dict[str, object] = {
+                "table_name": name,
+                "hidden_fields": hidden_for_table,
+                "include_hidden_fields": include_hidden_fields,
+                "column_roles": roles_lookup.get(name.casefold()),
+                "date_from": normalized_from,
+                "date_to": normalized_to,
+                "explorer_enabled": enabled_for_table,
+                "lightweight": lightweight,
+                "headers_only": headers_only,
+            }
+            slots.append(None)
+            jobs.append((len(slots) - 1, kwargs))
+
+        # Full scans are cached per file state; lightweight/headers_only only read the header
+        cache_keys: dict[int, tuple] = {}
+        if settings.overview_cache_max_entries > 0 and not (lightweight or headers_only):
+            pending: list[tuple[int, dict[str, object]]] = []
+            for slot, kwargs in jobs:
+                key = self._overview_cache_key(kwargs)
+                cached = self._get_cached_overview(key) if key else None
+                if cached is not None:
+                    slots[slot] = cached
+                    continue
+                if key:
+                    cache_keys[slot] = key
+                pending.append((slot, kwargs))
+            log.debug("Overview cache: hits=%d, misses=%d", len(jobs) - len(pending), len(pending))
+            jobs = pending
+
+        workers = max(1, int(settings.overview_workers))
+        # lightweight/headers_only only read the header line: not worth a process
+        parallel = workers > 1 and len(jobs) > 1 and not (lightweight or headers_only)
+        log.debug(
+            "Overview: mode=%s (tables=%d, workers=%d)",
+            "parallèle" if parallel else "séquentiel",
+            len(jobs),
+            workers,
+        )
+        if parallel:
+            # Incompatible avec la reprise incrémentale (OverviewScan): voir
+            # `_compute_table_overview_standalone`
+            executor = _get_overview_pool(workers)
+            try:
+                futures = [
+                    (slot, executor.submit(_compute_table_overview_standalone, self.repo, kwargs))
+                    for slot, kwargs in jobs
+                ]
+                for slot, future in futures:
+                    slots[slot] = future.result()
+            except BrokenProcessPool:
+                # Worker mort: le prochain appel repart d'un pool neuf
+                _discard_overview_pool(executor)
+                raise
+        else:
+            for slot, kwargs in jobs:
+                slots[slot] = self._compute_table_overview(**kwargs)  # type: ignore[arg-type]
+
+        for slot, key in cache_keys.items():
+            overview = slots[slot]
+            if overview is not None:
+                self._store_cached_overview(key, overview)
+
+        sources = [overview for overview in slots if overview]
 
         return DataOverviewResponse(generated_at=datetime.now(timezone.utc), sources=sources)
 
@@ -394,16 +894,13 @@ class DataService:
             )
 
         delimiter = "," if path.suffix.lower() == ".csv" else "\t"
-        total_rows = 0
-        date_min: str | None = None
-        date_max: str | None = None
         date_from_norm = date_from
         date_to_norm = date_to
 
         category_pairs: Counter[tuple[str, str]] = Counter()
-        with path.open("r", newline="", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle, delimiter=delimiter)
-            headers = reader.fieldnames or []
+        with path.open("rb") as handle:
+            reader = _iter_csv_rows(handle, delimiter)
+            headers = next(reader, [])
             if not headers:
                 log.info("Aucune colonne détectée pour %s, rien à afficher.", table_name)
                 return DataSourceOverview(
@@ -458,34 +955,58 @@ class DataService:
                 return None
 
             accumulators = {
-                name: FieldAccumulator(name=name, parse_dates=name == date_field)
+                name: FieldAccumulator(
+                    name=name,
+                    parse_dates=name == date_field or DATE_FIELD_HINT in name.lower(),
+                    probe_dates=name != date_field,
+                )
                 for name in headers
             }
-
-            for row in reader:
-                normalized_date = _normalize_date(row.get(date_field)) if date_field else None
-                if normalized_date:
-                    if date_min is None or normalized_date < date_min:
-                        date_min = normalized_date
-                    if date_max is None or normalized_date > date_max:
-                        date_max = normalized_date
-
-                if date_from_norm or date_to_norm:
-                    if normalized_date is None:
-                        continue
-                    if date_from_norm and normalized_date < date_from_norm:
-                        continue
-                    if date_to_norm and normalized_date > date_to_norm:
-                        continue
-
-                total_rows += 1
-                for name, acc in accumulators.items():
-                    acc.add(row.get(name))
-                if category_field and sub_category_field:
-                    category_value = _clean_text(row.get(category_field))
-                    sub_category_value = _clean_text(row.get(sub_category_field))
-                    if category_value and sub_category_value:
-                        category_pairs[(category_value, sub_category_value)] += 1
+            # Duplicate headers resolve to the last column, as with DictReader
+            column_index = {name: idx for idx, name in enumerate(headers)}
+            # Only the unfiltered overview of a file keeps its raw counts: each scan
+            # holds a full histogram per column
+            resumable = not (date_from_norm or date_to_norm)
+            scan_key = (
+                str(path),
+                tuple(headers),
+                date_field,
+                category_field,
+                sub_category_field,
+            )
+            size = os.fstat(handle.fileno()).st_size
+            scan = self._take_overview_scan(scan_key) if resumable else None
+            if scan is not None and scan.can_resume(handle, size):
+                log.debug("Overview %s : reprise après %d octets (taille=%d)", table_name, scan.size, size)
+                reader = _iter_csv_rows(handle, delimiter, start=scan.size)
+            else:
+                if scan is not None:
+                    # `can_resume` moved `handle`: restart below the header
+                    reader = _iter_csv_rows(handle, delimiter)
+                    next(reader, None)
+                scan = OverviewScan(
+                    headers=headers,
+                    column_idxs=[column_index[name] for name in accumulators],
+                    date_idx=column_index[date_field] if date_field else -1,
+                    category_idx=column_index[category_field] if category_field else -1,
+                    sub_category_idx=column_index[sub_category_field] if sub_category_field else -1,
+                    date_from=date_from_norm,
+                    date_to=date_to_norm,
+                )
+            scan.consume(_iter_rows(reader, len(headers)))
+            if resumable:
+                scan.mark_end(handle)
+                self._store_overview_scan(scan_key, scan)
+
+        total_rows = scan.total_rows
+        date_min, date_max = scan.date_min, scan.date_max
+        for acc, counts in zip(accumulators.values(), scan.raw_counts):
+            acc.add_counts(counts, normalized_dates=scan.dates_by_raw)
+        for (raw_category, raw_sub_category), count in scan.raw_pairs.items():
+            category_value = _clean_text(raw_category)
+            sub_category_value = _clean_text(raw_sub_category)
+            if category_value and sub_category_value:
+                category_pairs[(category_value, sub_category_value)] += count
 
         fields = [acc.build_breakdown(total_rows=total_rows) for acc in accumulators.values()]
         hidden_set = set(hidden_fields or [])
@@ -570,22 +1091,19 @@ class DataService:
             raise FileNotFoundError(f"Table introuvable: {table_name}")
 
         delimiter = "," if path.suffix.lower() == ".csv" else "\t"
-        matching_rows = 0
-        matched_rows: list[dict[str, str | int | float | bool | None]] = []
 
-        normalized_from = _normalize_date(date_from) if date_from else None
-        normalized_to = _normalize_date(date_to) if date_to else None
+        from_text = _clean_text(date_from)
+        normalized_from = _normalize_date(from_text) if from_text else None
+        to_text = _clean_text(date_to)
+        normalized_to = _normalize_date(to_text) if to_text else None
         if date_from and not normalized_from:
             raise ValueError("Paramètre 'date_from' invalide (format attendu ISO 8601).")
         if date_to and not normalized_to:
             raise ValueError("Paramètre 'date_to' invalide (format attendu ISO 8601).")
 
-        date_domain_min: str | None = None
-        date_domain_max: str | None = None
-
         with path.open("r", newline="", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle, delimiter=delimiter)
-            headers = reader.fieldnames or []
+            reader = csv.reader(handle, delimiter=delimiter)
+            headers = next(reader, [])
             if not headers:
                 log.info("Aucune colonne détectée pour %s, rien à explorer.", table_name)
                 return TableExplorePreview(
@@ -650,38 +1168,44 @@ class DataService:
                 if date_column is None:
                     raise ValueError("Colonne de date introuvable pour appliquer tri/filtre.")
 
-            for row in reader:
-                cat_value = _clean_text(row.get(category_column))
-                sub_value = _clean_text(row.get(sub_category_column))
-                if cat_value == category and sub_value == sub_category:
-                    normalized_value = _normalize_date(row.get(date_column)) if date_column else None
-                    if normalized_value:
-                        if date_domain_min is None or normalized_value < date_domain_min:
-                            date_domain_min = normalized_value
-                        if date_domain_max is None or normalized_value > date_domain_max:
-                            date_domain_max = normalized_value
-
-                    if date_column and (normalized_from or normalized_to):
-                        if normalized_value is None:
-                            continue
-                        if normalized_from and normalized_value < normalized_from:
-                            continue
-                        if normalized_to and normalized_value > normalized_to:
-                            continue
-                    matching_rows += 1
-                    matched_rows.append(row)  # type: ignore[arg-type]
+            column_index = {name: idx for idx, name in enumerate(headers)}
+            category_idx = column_index[category_column]
+            sub_category_idx = column_index[sub_category_column]
+            date_idx = column_index[date_column] if date_column else -1
+
+        index = self._get_explore_index(
+            path,
+            delimiter=delimiter,
+            category_idx=category_idx,
+            sub_category_idx=sub_category_idx,
+            date_idx=date_idx,
+        )
+        pair = index.get((category, sub_category)) or ExplorePairIndex()
+        dates = pair.dates
+        date_domain_min = min(filter(None, dates), default=None)
+        date_domain_max = max(filter(None, dates), default=None)
+
+        # Work on row positions only; the preview page is read back from the file
+        if date_column and (normalized_from or normalized_to):
+            selected = [
+                pos
+                for pos, value in enumerate(dates)
+                if value is not None
+                and not (normalized_from and value < normalized_from)
+                and not (normalized_to and value > normalized_to)
+            ]
+        else:
+            selected = list(range(len(dates)))
+        matching_rows = len(selected)
 
         if sort_direction and date_column:
-            def _sort_key(row: Mapping[str, object | None]) -> str:
-                normalized = _normalize_date(row.get(date_column))
-                if normalized:
-                    return normalized
-                fallback = _clean_text(row.get(date_column))
-                return fallback or ""
-
-            matched_rows.sort(key=_sort_key, reverse=sort_direction == "desc")
+            selected.sort(key=pair.sort_keys.__getitem__, reverse=sort_direction == "desc")
 
-        preview_rows = matched_rows[offset : offset + limit]
+        page = [pair.offsets[pos] for pos in selected[offset : offset + limit]]
+        preview_rows = [
+            dict(zip(headers, row))
+            for row in _read_rows_at(path, page, delimiter=delimiter, width=len(headers))
+        ]
 
         log.info(
             "Explore table %s pour Category=%s, Sub Category=%s : lignes=%d, aperçu=%d (offset=%d, limit=%d, sort_date=%s, date_from=%s, date_to=%s)",
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from functools import lru_cache
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, List
+
+from ..core.config import settings
+
+
+log = logging.getLogger("insight.services.llm_cache")
+
+
+class LLMResponseCache:
+    """Exact-match, TTL-bounded cache for final LLM replies.
+
+    Keys are SHA-256 digests of (role, model, messages): a hit requires the same
+    question *and* the same SQL/retrieval material, so a reply is never reused
+    against different data.
+    """
+
+    def __init__(self, *, ttl_s: float, max_entries: int):
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_s > 0 and self.max_entries > 0
+
+    @staticmethod
+    def key(*, role: str, model: str, messages: List[Dict[str, Any]]) -> str:
+        raw = json.dumps([role, model, messages], ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        if not self.enabled or not value:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_s, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache
+def get_llm_cache() -> LLMResponseCache:
+    cache = LLMResponseCache(ttl_s=settings.llm_cache_ttl_s, max_entries=settings.llm_cache_max_entries)
+    log.info(
+        "LLM response cache: %s (ttl_s=%s, max_entries=%d)",
+        "enabled" if cache.enabled else "disabled",
+        settings.llm_cache_ttl_s,
+        settings.llm_cache_max_entries,
+    )
+    return cache
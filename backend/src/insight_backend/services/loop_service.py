@@ -1,8 +1,17 @@
 from __future__ import annotations
 
 import calendar
+import contextvars
+import heapq
 import logging
+import re
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache, partial
+from itertools import accumulate
 from typing import Any, Dict, Iterable, List, Tuple
 
 from fastapi import HTTPException, status
@@ -16,6 +25,78 @@ from ..models.loop import LoopConfig, LoopSummary
 
 log = logging.getLogger("insight.services.loop")
 
+# Formats acceptés (mêmes largeurs que strptime: jour/mois/heures sur 1 ou 2 chiffres):
+# %Y-%m-%d, %Y-%m-%d %H:%M:%S, %Y-%m-%dT%H:%M:%S, %Y/%m/%d, %d/%m/%Y; sinon ISO 8601.
+_DATE_RE = re.compile(
+    r"(\d{4})-(\d{1,2})-(\d{1,2})(?:[ T](\d{1,2}):(\d{1,2}):(\d{1,2}))?"
+    r"|(\d{4})/(\d{1,2})/(\d{1,2})"
+    r"|(\d{1,2})/(\d{1,2})/(\d{4})",
+    re.ASCII,
+)
+
+
+def _match_date(text: str) -> date | None:
+    match = _DATE_RE.fullmatch(text)
+    if match is None:
+        return None
+    groups = match.groups()
+    if groups[0] is not None:
+        year, month, day = groups[0], groups[1], groups[2]
+        if groups[3] is not None:
+            if int(groups[3]) > 23 or int(groups[4]) > 59 or int(groups[5]) > 59:
+                return None
+    elif groups[6] is not None:
+        year, month, day = groups[6], groups[7], groups[8]
+    else:
+        day, month, year = groups[9], groups[10], groups[11]
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+# Sentinelle: valeur brute pas encore analysée (None signifie « date invalide »)
+_UNPARSED = object()
+
+
+@lru_cache(maxsize=100_000)
+def _parse_date_text(text: str) -> date | None:
+    """Parse une date déjà nettoyée; mémorisé car les tickets partagent souvent le même jour."""
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":
+        # Forme la plus courante (AAAA-MM-JJ): parseur C dédié, sans passer par la regex
+        try:
+            return date.fromisoformat(text)
+        except ValueError:
+            pass
+    parsed = _match_date(text)
+    if parsed is not None:
+        return parsed
+    try:
+        return datetime.fromisoformat(text).date()
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
+class LoopEntries:
+    """Tickets préparés en colonnes parallèles (indice i = un ticket), triés par date décroissante."""
+
+    texts: list[str] = field(default_factory=list)
+    dates: list[date] = field(default_factory=list)
+    ticket_ids: list[Any] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+
+@dataclass(slots=True)
+class LoopBuckets:
+    """Indices des tickets par jour, semaine ISO et mois, construits en une seule passe."""
+
+    days: defaultdict[date, list[int]] = field(default_factory=lambda: defaultdict(list))
+    weeks: defaultdict[tuple[int, int], list[int]] = field(default_factory=lambda: defaultdict(list))
+    months: defaultdict[tuple[int, int], list[int]] = field(default_factory=lambda: defaultdict(list))
+
 
 class LoopService:
     def __init__(
@@ -32,15 +113,14 @@ class LoopService:
     def get_overview(
         self, *, allowed_tables: Iterable[str] | None = None
     ) -> list[tuple[LoopConfig, list[LoopSummary], list[LoopSummary], list[LoopSummary]]]:
-        configs = self.repo.list_configs()
-        if allowed_tables is not None:
-            allowed_lookup = {name.casefold() for name in allowed_tables}
-            configs = [config for config in configs if config.table_name.casefold() in allowed_lookup]
+        configs = self.repo.list_configs(allowed_tables=allowed_tables)
+        latest = self.repo.list_latest_summaries(config_ids=[config.id for config in configs])
         items: list[tuple[LoopConfig, list[LoopSummary], list[LoopSummary], list[LoopSummary]]] = []
         for config in configs:
-            daily = self.repo.list_by_kind(kind="daily", config_id=config.id)[:1]
-            weekly = self.repo.list_by_kind(kind="weekly", config_id=config.id)[:1]
-            monthly = self.repo.list_by_kind(kind="monthly", config_id=config.id)[:1]
+            by_kind = latest.get(config.id, {})
+            daily = [by_kind["daily"]] if "daily" in by_kind else []
+            weekly = [by_kind["weekly"]] if "weekly" in by_kind else []
+            monthly = [by_kind["monthly"]] if "monthly" in by_kind else []
             items.append((config, daily, weekly, monthly))
         return items
 
@@ -69,15 +149,12 @@ class LoopService:
     def regenerate(
         self, *, table_name: str | None = None
     ) -> list[tuple[LoopConfig, list[LoopSummary], list[LoopSummary], list[LoopSummary]]]:
-        configs = self.repo.list_configs()
-        if table_name:
-            lookup = table_name.casefold()
-            configs = [config for config in configs if config.table_name.casefold() == lookup]
-            if not configs:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Aucune configuration loop trouvée pour la table {table_name}.",
-                )
+        configs = self.repo.list_configs(allowed_tables=[table_name] if table_name else None)
+        if table_name and not configs:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Aucune configuration loop trouvée pour la table {table_name}.",
+            )
 
         if not configs:
             raise HTTPException(
@@ -94,7 +171,10 @@ class LoopService:
         self, config: LoopConfig
     ) -> tuple[LoopConfig, list[LoopSummary], list[LoopSummary], list[LoopSummary]]:
         try:
-            rows = self.data_repo.read_rows(config.table_name)
+            rows = self.data_repo.iter_rows(
+                config.table_name,
+                columns=[config.text_column, config.date_column, "ticket_id", "id", "ref"],
+            )
         except FileNotFoundError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
@@ -105,35 +185,36 @@ class LoopService:
                 detail=f"Aucun ticket exploitable pour la table {config.table_name}.",
             )
 
-        daily_groups = self._group_by_day(entries)
-        weekly_groups = self._group_by_week(entries)
-        monthly_groups = self._group_by_month(entries)
+        buckets = self._bucketize(entries)
+        daily_groups = self._group_by_day(buckets)
+        weekly_groups = self._group_by_week(buckets)
+        monthly_groups = self._group_by_month(buckets)
         if not daily_groups and not weekly_groups and not monthly_groups:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Impossible de constituer des groupes journaliers, hebdomadaires ou mensuels avec les données présentes pour {config.table_name}.",
             )
 
-        payloads: list[dict] = []
-        for group in daily_groups:
-            content = self._summarize_group(group, kind="daily")
-            payloads.append(content)
-        for group in weekly_groups:
-            content = self._summarize_group(group, kind="weekly")
-            payloads.append(content)
-
-        for group in monthly_groups:
-            content = self._summarize_group(group, kind="monthly")
-            payloads.append(content)
+        groups = [("daily", group) for group in daily_groups]
+        groups += [("weekly", group) for group in weekly_groups]
+        groups += [("monthly", group) for group in monthly_groups]
+        payloads = self._summarize_groups(entries, groups)
 
         saved = self.repo.replace_summaries(config=config, items=payloads)
         now = datetime.now(timezone.utc)
         self.repo.touch_generated(config_id=config.id, ts=now)
 
-        daily = [item for item in saved if item.kind == "daily"][:1]
-        weekly = [item for item in saved if item.kind == "weekly"][:1]
-        monthly = [item for item in saved if item.kind == "monthly"][:1]
-        return config, daily, weekly, monthly
+        # Premier résumé de chaque type, en une passe qui s'arrête dès les trois trouvés
+        first: dict[str, list[LoopSummary]] = {"daily": [], "weekly": [], "monthly": []}
+        missing = len(first)
+        for item in saved:
+            bucket = first.get(item.kind)
+            if bucket is not None and not bucket:
+                bucket.append(item)
+                missing -= 1
+                if not missing:
+                    break
+        return config, first["daily"], first["weekly"], first["monthly"]
 
     # --- Helpers -------------------------------------------------------
     def _validate_columns(self, *, table_name: str, text_column: str, date_column: str) -> None:
@@ -151,26 +232,59 @@ class LoopService:
                 detail=f"Colonnes manquantes dans {table_name}: {', '.join(missing)}",
             )
 
-    def _prepare_entries(self, *, rows: List[Dict[str, Any]], text_column: str, date_column: str) -> List[Dict[str, Any]]:
-        entries: list[dict[str, Any]] = []
+    def _prepare_entries(self, *, rows: Iterable[Dict[str, Any]], text_column: str, date_column: str) -> LoopEntries:
+        texts: list[str] = []
+        dates: list[date] = []
+        ticket_ids: list[Any] = []
+        # Les valeurs brutes se répètent (même jour): une analyse par valeur distincte
+        dates_by_raw: dict[Any, Any] = {}
+        # Clé de tri entière (ordinal) calculée une fois par date distincte
+        ordinal_by_date: dict[date, int] = {}
+        ordinals: list[int] = []
+        invalid_count = 0
+        invalid_samples: list[Any] = []
+        # Alias locaux: la boucle tourne une fois par ligne de la table
+        parse = self._parse_date
+        known_date = dates_by_raw.get
+        add_text = texts.append
+        add_date = dates.append
+        add_ordinal = ordinals.append
+        add_ticket_id = ticket_ids.append
         for row in rows:
-            text_raw = row.get(text_column)
-            text_value = str(text_raw).strip() if text_raw is not None else ""
+            get = row.get
+            text_raw = get(text_column)
+            if text_raw is None:
+                continue
+            text_value = (text_raw if type(text_raw) is str else str(text_raw)).strip()
             if not text_value:
                 continue
-            dt = self._parse_date(row.get(date_column))
+            raw_date = get(date_column)
+            dt = known_date(raw_date, _UNPARSED)
+            if dt is _UNPARSED:
+                dt = dates_by_raw[raw_date] = parse(raw_date)
+                if dt and dt not in ordinal_by_date:
+                    ordinal_by_date[dt] = dt.toordinal()
             if not dt:
-                log.warning("Ligne ignorée: date invalide (%r)", row.get(date_column))
+                invalid_count += 1
+                if len(invalid_samples) < 5:
+                    invalid_samples.append(raw_date)
                 continue
-            ticket_id = row.get("ticket_id") or row.get("id") or row.get("ref")
-            entries.append(
-                {
-                    "text": text_value,
-                    "date": dt,
-                    "ticket_id": ticket_id,
-                }
+            add_text(text_value)
+            add_date(dt)
+            add_ordinal(ordinal_by_date[dt])
+            add_ticket_id(get("ticket_id") or get("id") or get("ref"))
+        if invalid_count:
+            log.warning(
+                "Lignes ignorées: date invalide (%d lignes, exemples: %r)",
+                invalid_count,
+                invalid_samples,
             )
-        entries.sort(key=lambda item: item["date"], reverse=True)
+        order = sorted(range(len(dates)), key=ordinals.__getitem__, reverse=True)
+        entries = LoopEntries(
+            texts=[texts[i] for i in order],
+            dates=[dates[i] for i in order],
+            ticket_ids=[ticket_ids[i] for i in order],
+        )
         log.info("Tickets préparés pour loop: %d", len(entries))
         return entries
 
@@ -184,26 +298,32 @@ class LoopService:
         text = str(raw).strip()
         if not text:
             return None
-        # Essais restreints pour rester explicites sur les formats acceptés
-        for fmt in ("%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%Y/%m/%d", "%d/%m/%Y", "%Y-%m-%dT%H:%M:%S"):
-            try:
-                return datetime.strptime(text, fmt).date()
-            except ValueError:
-                continue
-        try:
-            return datetime.fromisoformat(text).date()
-        except ValueError:
-            return None
-
-    def _group_by_week(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        buckets: dict[tuple[int, int], list[dict[str, Any]]] = {}
-        for item in entries:
-            d: date = item["date"]
-            iso = d.isocalendar()
-            key = (iso.year, iso.week)
-            buckets.setdefault(key, []).append(item)
+        return _parse_date_text(text)
+
+    # Les groupes référencent les tickets par indice dans `LoopEntries`
+    def _bucketize(self, entries: LoopEntries) -> LoopBuckets:
+        buckets = LoopBuckets()
+        days, weeks, months = buckets.days, buckets.weeks, buckets.months
+        day_items: list[int] = []
+        week_items: list[int] = []
+        month_items: list[int] = []
+        previous: date | None = None
+        for idx, d in enumerate(entries.dates):
+            # Entrées triées par date: jour, semaine et mois ne changent qu'entre deux dates distinctes
+            if d != previous:
+                iso = d.isocalendar()
+                day_items = days[d]
+                week_items = weeks[(iso.year, iso.week)]
+                month_items = months[(d.year, d.month)]
+                previous = d
+            day_items.append(idx)
+            week_items.append(idx)
+            month_items.append(idx)
+        return buckets
+
+    def _group_by_week(self, buckets: LoopBuckets) -> List[Dict[str, Any]]:
         groups: list[dict[str, Any]] = []
-        for (year, week), items in buckets.items():
+        for (year, week), items in buckets.weeks.items():
             start = date.fromisocalendar(year, week, 1)
             end = start + timedelta(days=6)
             groups.append(
@@ -218,14 +338,9 @@ class LoopService:
         limit = max(1, int(settings.loop_max_weeks))
         return groups[:limit]
 
-    def _group_by_month(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        buckets: dict[tuple[int, int], list[dict[str, Any]]] = {}
-        for item in entries:
-            d: date = item["date"]
-            key = (d.year, d.month)
-            buckets.setdefault(key, []).append(item)
+    def _group_by_month(self, buckets: LoopBuckets) -> List[Dict[str, Any]]:
         groups: list[dict[str, Any]] = []
-        for (year, month), items in buckets.items():
+        for (year, month), items in buckets.months.items():
             start = date(year, month, 1)
             last_day = calendar.monthrange(year, month)[1]
             end = date(year, month, last_day)
@@ -241,130 +356,201 @@ class LoopService:
         limit = max(1, int(settings.loop_max_months))
         return groups[:limit]
 
-    def _group_by_day(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        buckets: dict[date, list[dict[str, Any]]] = {}
-        for item in entries:
-            buckets.setdefault(item["date"], []).append(item)
-
-        if not buckets:
+    def _group_by_day(self, buckets: LoopBuckets) -> List[Dict[str, Any]]:
+        days = buckets.days
+        if not days:
             return []
 
         limit = max(1, int(settings.loop_max_days))
         today = date.today()
-        ordered_dates = sorted(buckets.keys(), reverse=True)
-        if today in buckets:
-            ordered_dates = [today] + [d for d in ordered_dates if d != today]
-        selected = ordered_dates[:limit]
+        selected = heapq.nlargest(limit, days)
+        # Le jour courant passe en tête s'il a des tickets (dates futures possibles dans les exports)
+        if today in days and selected[0] != today:
+            if today in selected:
+                selected.remove(today)
+            else:
+                selected.pop()
+            selected.insert(0, today)
 
         groups: list[dict[str, Any]] = []
         for current in selected:
-            items = sorted(buckets.get(current, []), key=lambda item: item["date"], reverse=True)
             groups.append(
                 {
                     "label": current.isoformat(),
                     "start": current,
                     "end": current,
-                    "items": items,
+                    # Un seul jour par groupe: l'ordre des entrées est déjà le bon
+                    "items": days[current],
                 }
             )
 
         return groups
 
-    def _format_context(self, items: List[Dict[str, Any]]) -> Tuple[List[str], bool]:
+    def _format_context(self, entries: LoopEntries, items: List[int]) -> Tuple[str, int, bool]:
+        """Bloc de tickets prêt pour le prompt: (texte, nombre de lignes, tronqué)."""
         cap = max(1, int(settings.loop_max_tickets))
         max_chars = max(32, int(settings.loop_ticket_text_max_chars))
         trimmed = items[:cap]
+        texts = entries.texts
+        dates = entries.dates
+        ticket_ids = entries.ticket_ids
         lines: list[str] = []
         for idx, item in enumerate(trimmed, start=1):
-            text = item["text"]
+            text = texts[item]
             if len(text) > max_chars:
                 text = text[: max_chars - 1] + "…"
-            prefix = f"{item['date'].isoformat()}"
-            ticket_id = item.get("ticket_id")
+            ticket_id = ticket_ids[item]
             if ticket_id:
-                prefix = f"{prefix} #{ticket_id}"
-            lines.append(f"{idx}. {prefix} — {text}")
-        return lines, len(items) > cap
+                lines.append(f"{idx}. {dates[item].isoformat()} #{ticket_id} — {text}")
+            else:
+                lines.append(f"{idx}. {dates[item].isoformat()} — {text}")
+        return "\n".join(lines), len(lines), len(items) > cap
 
-    def _chunk_items(self, items: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    def _chunk_items(self, entries: LoopEntries, items: List[int]) -> List[List[int]]:
         max_tickets = max(1, int(settings.loop_max_tickets_per_call))
         max_chars = max(1000, int(settings.loop_max_input_chars))
-        chunks: list[list[Dict[str, Any]]] = []
-        current: list[Dict[str, Any]] = []
-        current_chars = 0
-
-        def _ticket_cost(item: dict[str, Any]) -> int:
-            text = str(item.get("text") or "")
-            return min(len(text), settings.loop_ticket_text_max_chars)
-
-        for item in items:
-            cost = _ticket_cost(item)
-            if current and (len(current) >= max_tickets or (current_chars + cost) > max_chars):
-                chunks.append(current)
-                current = []
-                current_chars = 0
-            current.append(item)
-            current_chars += cost
-
-        if current:
-            chunks.append(current)
+        text_cap = settings.loop_ticket_text_max_chars
+        total = len(items)
+        if total <= max_tickets and total * text_cap <= max_chars:
+            # Même au plafond de caractères par ticket, tout tient dans un seul appel
+            return [items]
+        texts = entries.texts
+        # Coûts cumulés: chaque borne de chunk se trouve par bisection au lieu d'un test par ticket
+        cumulative = list(accumulate(min(len(texts[item]), text_cap) for item in items))
+        if total <= max_tickets and (not cumulative or cumulative[-1] <= max_chars):
+            return [items]
+        chunks: list[list[int]] = []
+        start = 0
+        while start < total:
+            budget = (cumulative[start - 1] if start else 0) + max_chars
+            end = bisect_right(cumulative, budget, start, min(total, start + max_tickets))
+            # Un ticket seul plus long que le budget forme son propre chunk
+            end = max(end, start + 1)
+            chunks.append(items[start:end])
+            start = end
 
         return chunks or [items]
 
-    def _summarize_group(self, group: Dict[str, Any], *, kind: str) -> dict:
+    def _summarize_group(self, entries: LoopEntries, group: Dict[str, Any], *, kind: str) -> dict:
+        return self._summarize_groups(entries, [(kind, group)])[0]
+
+    def _summarize_groups(
+        self, entries: LoopEntries, groups: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[dict]:
+        chunk_calls = [self._chunk_calls(entries, group, kind=kind) for kind, group in groups]
+        contents = self._run_summaries(groups, chunk_calls)
+        payloads: list[dict] = []
+        for (kind, group), content in zip(groups, contents):
+            items = group["items"]
+            payloads.append(
+                {
+                    "kind": kind,
+                    "period_label": group["label"],
+                    "period_start": group["start"],
+                    "period_end": group["end"],
+                    "ticket_count": len(items),
+                    "content": content
+                    if items
+                    else "Aucun ticket enregistré sur cette période. Aucun suivi requis.",
+                }
+            )
+        return payloads
+
+    def _chunk_calls(self, entries: LoopEntries, group: Dict[str, Any], *, kind: str) -> List[Dict[str, Any]]:
         items = group["items"]
         if not items:
-            return {
-                "kind": kind,
-                "period_label": group["label"],
-                "period_start": group["start"],
-                "period_end": group["end"],
-                "ticket_count": 0,
-                "content": "Aucun ticket enregistré sur cette période. Aucun suivi requis.",
-            }
-        chunks = self._chunk_items(items)
-        partial_summaries: list[str] = []
-
+            return []
+        chunks = self._chunk_items(entries, items)
+        calls: list[dict[str, Any]] = []
         for idx, chunk in enumerate(chunks, start=1):
-            lines, truncated = self._format_context(chunk)
+            block, count, truncated = self._format_context(entries, chunk)
             if truncated:
                 log.warning(
                     "Context %s %s tronqué à %d tickets (chunk=%d/%d total_chunk_tickets=%d)",
                     kind,
                     group["label"],
-                    len(lines),
+                    count,
                     idx,
                     len(chunks),
                     len(chunk),
                 )
-            partial = self.agent.summarize(
-                period_label=f"{group['label']} (part {idx}/{len(chunks)})",
-                period_start=group["start"],
-                period_end=group["end"],
-                tickets=lines,
-                total_tickets=len(chunk),
-            )
-            partial_summaries.append(partial)
-
-        if len(partial_summaries) == 1:
-            final_content = partial_summaries[0]
-        else:
-            tickets = [
-                f"Synthèse partielle {i+1}/{len(partial_summaries)} : {text}"
-                for i, text in enumerate(partial_summaries)
-            ]
-            final_content = self.agent.summarize(
-                period_label=f"{group['label']} (fusion)",
-                period_start=group["start"],
-                period_end=group["end"],
-                tickets=tickets,
-                total_tickets=len(items),
+            calls.append(
+                {
+                    "period_label": f"{group['label']} (part {idx}/{len(chunks)})",
+                    "period_start": group["start"],
+                    "period_end": group["end"],
+                    "tickets_block": block,
+                    "ticket_count": count,
+                    "total_tickets": len(chunk),
+                }
             )
+        return calls
+
+    def _fusion_call(self, group: Dict[str, Any], partials: List[str]) -> Dict[str, Any]:
+        block = "\n".join(
+            f"Synthèse partielle {i+1}/{len(partials)} : {text}" for i, text in enumerate(partials)
+        )
         return {
-            "kind": kind,
-            "period_label": group["label"],
+            "period_label": f"{group['label']} (fusion)",
             "period_start": group["start"],
             "period_end": group["end"],
-            "ticket_count": len(items),
-            "content": final_content,
+            "tickets_block": block,
+            "ticket_count": len(partials),
+            "total_tickets": len(group["items"]),
         }
+
+    def _run_summaries(
+        self, groups: List[Tuple[str, Dict[str, Any]]], chunk_calls: List[List[Dict[str, Any]]]
+    ) -> List[str | None]:
+        """Contenu final par groupe (None pour un groupe sans ticket)."""
+        contents: list[str | None] = [None] * len(groups)
+        partials: list[list[str | None]] = [[None] * len(calls) for calls in chunk_calls]
+        workers = max(1, int(settings.loop_workers))
+        total_calls = sum(len(calls) for calls in chunk_calls)
+        if workers <= 1 or total_calls <= 1:
+            for gi, ((_, group), calls) in enumerate(zip(groups, chunk_calls)):
+                done = [self.agent.summarize(**call) for call in calls]
+                if len(done) == 1:
+                    contents[gi] = done[0]
+                elif done:
+                    contents[gi] = self.agent.summarize(**self._fusion_call(group, done))
+            return contents
+
+        log.info("Loop: %d appels LLM en parallèle (workers=%d)", total_calls, workers)
+        with ThreadPoolExecutor(max_workers=min(workers, total_calls)) as executor:
+
+            def _submit(call: Dict[str, Any]) -> Future[str]:
+                # Contexte copié par tâche: les limites AGENT_MAX_REQUESTS restent appliquées
+                return executor.submit(contextvars.copy_context().run, partial(self.agent.summarize, **call))
+
+            pending: dict[Future[str], tuple[int, int | None]] = {}
+            for gi, calls in enumerate(chunk_calls):
+                for ci, call in enumerate(calls):
+                    pending[_submit(call)] = (gi, ci)
+            remaining = [len(calls) for calls in chunk_calls]
+            try:
+                while pending:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        gi, ci = pending.pop(future)
+                        result = future.result()
+                        if ci is None:
+                            contents[gi] = result
+                            continue
+                        partials[gi][ci] = result
+                        remaining[gi] -= 1
+                        if remaining[gi]:
+                            continue
+                        # Fusion lancée dès que les chunks du groupe sont prêts,
+                        # sans attendre les autres groupes
+                        group_partials = [text for text in partials[gi] if text is not None]
+                        if len(group_partials) == 1:
+                            contents[gi] = group_partials[0]
+                        else:
+                            pending[_submit(self._fusion_call(groups[gi][1], group_partials))] = (gi, None)
+            except BaseException:
+                # Comme en séquentiel: arrêt au premier échec, les appels encore en file
+                # sont annulés (seuls ceux déjà lancés se terminent)
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+        return contents
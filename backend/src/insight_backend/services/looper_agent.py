@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import logging
+import threading
 from datetime import date
-from typing import List
 
 from ..core.agent_limits import check_and_increment
 from ..core.config import settings
@@ -12,6 +12,30 @@ from ..integrations.openai_client import OpenAICompatibleClient, OpenAIBackendEr
 
 log = logging.getLogger("insight.services.looper")
 
+# Clients partagés par (base_url, api_key): les connexions TCP/TLS restent ouvertes entre appels
+_clients: dict[tuple[str, str | None], OpenAICompatibleClient] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(base_url: str, api_key: str | None) -> OpenAICompatibleClient:
+    """Client réutilisé d'un appel à l'autre; ``httpx.Client`` est thread-safe, ne pas le fermer ici."""
+    key = (base_url, api_key)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = OpenAICompatibleClient(base_url=base_url, api_key=api_key, timeout_s=settings.openai_timeout_s)
+            _clients[key] = client
+        return client
+
+
+def close_looper_clients() -> None:
+    """Ferme les clients partagés du looper (arrêt de l'application)."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
 
 class LooperAgent:
     """Agent dédié aux résumés journaliers/hebdomadaires/mensuels des tickets."""
@@ -22,10 +46,12 @@ class LooperAgent:
         period_label: str,
         period_start: date,
         period_end: date,
-        tickets: List[str],
+        tickets_block: str,
+        ticket_count: int,
         total_tickets: int,
     ) -> str:
-        if not tickets:
+        """Résume un bloc de tickets déjà formaté (une ligne par ticket, ``ticket_count`` lignes)."""
+        if not tickets_block or ticket_count <= 0:
             raise ValueError("Aucun ticket fourni au looper.")
         if settings.llm_mode not in {"local", "api"}:
             raise RuntimeError("LLM_MODE doit être 'local' ou 'api' pour le looper.")
@@ -47,26 +73,25 @@ class LooperAgent:
             raise RuntimeError("Backend LLM non configuré pour le looper.")
 
         max_tokens = min(int(settings.loop_max_tokens), int(settings.llm_max_tokens))
-        client = OpenAICompatibleClient(base_url=base_url, api_key=api_key, timeout_s=settings.openai_timeout_s)
+        client = _get_client(base_url, api_key)
 
         store = get_prompt_store()
         system_prompt = store.get("looper_system").template
-        formatted = "\n".join(tickets)
         user_prompt = store.render(
             "looper_user",
             {
                 "period_label": period_label,
                 "period_start": period_start.isoformat(),
                 "period_end": period_end.isoformat(),
-                "ticket_count": len(tickets),
+                "ticket_count": ticket_count,
                 "total_tickets": total_tickets,
-                "formatted": formatted,
+                "formatted": tickets_block,
             },
         )
 
         log.info(
             "Looper summarizing %s tickets (provider=%s, period=%s)",
-            len(tickets),
+            ticket_count,
             provider,
             period_label,
         )
@@ -85,8 +110,6 @@ class LooperAgent:
             raise RuntimeError(f"LLM looper indisponible: {exc}") from exc
         except Exception as exc:  # pragma: no cover - defensive
             raise RuntimeError(f"Erreur lors de la synthèse looper: {exc}") from exc
-        finally:
-            client.close()
 
         try:
             choice = response["choices"][0]
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import codecs
 import os
 import sys
 from contextlib import asynccontextmanager
 from functools import lru_cache
+from itertools import chain, islice, repeat
 from dataclasses import dataclass
-from typing import Any, AsyncIterator, Dict, Iterable, List, TextIO, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, TextIO, Tuple
 
 import logging
 import anyio
@@ -14,7 +16,8 @@ import anyio.lowlevel
 import httpx
 
 from openai.types.chat import ChatCompletion as OpenAIChatCompletion
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.exceptions import UnexpectedModelBehavior
 from pydantic_ai.mcp import MCPServerStdio
@@ -51,6 +54,27 @@ def _should_suppress_json_error(raw_line: str) -> bool:
     return "jsonrpc" not in text
 
 
+# Validateur construit une fois à l'import, réutilisé pour chaque ligne stdout du serveur MCP
+_JSONRPC_ADAPTER: TypeAdapter[Any] = TypeAdapter(mcp_types.JSONRPCMessage)
+
+
+def _is_stdout_noise(raw_line: str | bytes) -> bool:
+    """Ligne qui ne peut pas être un message JSON-RPC et serait de toute façon ignorée."""
+    text = raw_line.lstrip()
+    if isinstance(text, bytes):
+        if text.startswith((b"{", b"[")):
+            return False
+        return _should_suppress_json_error(text.decode("utf-8", "replace"))
+    return not text.startswith(("{", "[")) and _should_suppress_json_error(text)
+
+
+def _log_stdout_noise(raw_line: str | bytes) -> None:
+    text = raw_line if isinstance(raw_line, str) else raw_line.decode("utf-8", "replace")
+    preview = text.strip()
+    if preview:
+        _stdout_log.debug("Ignored MCP stdout noise: %s", preview[:200])
+
+
 @lru_cache
 def _openai_http_client(verify_ssl: bool) -> httpx.AsyncClient:
     timeout = httpx.Timeout(timeout=600, connect=5)
@@ -65,6 +89,7 @@ def _openai_http_client(verify_ssl: bool) -> httpx.AsyncClient:
 async def _filtered_stdio_client(
     server: mcp_stdio.StdioServerParameters,
     errlog: TextIO = sys.stderr,
+    on_process: Callable[[Any], None] | None = None,
 ) -> AsyncIterator[
     Tuple[
         MemoryObjectReceiveStream[SessionMessage | Exception],
@@ -93,12 +118,49 @@ async def _filtered_stdio_client(
         await read_stream_writer.aclose()
         await write_stream_reader.aclose()
         raise
+    if on_process is not None:
+        on_process(process)
+
+    # Flux UTF-8 (cas normal): découpage et validation directement sur les octets
+    utf8 = codecs.lookup(server.encoding).name == "utf-8"
+
+    async def dispatch_line(line: str | bytes) -> None:
+        if _is_stdout_noise(line):
+            # Logs du serveur sur stdout: pas de validation (ni d'exception) pour rien
+            _log_stdout_noise(line)
+            return
+        try:
+            message = _JSONRPC_ADAPTER.validate_json(line)
+        except Exception as exc:  # pragma: no cover - depends on external server
+            text = line if isinstance(line, str) else line.decode("utf-8", "replace")
+            if _should_suppress_json_error(text):
+                _log_stdout_noise(text)
+                return
+            _stdout_log.exception("Failed to parse JSONRPC message from server")
+            await read_stream_writer.send(exc)
+            return
+
+        session_message = SessionMessage(message)
+        await read_stream_writer.send(session_message)
 
     async def stdout_reader() -> None:
         assert process.stdout, "Opened process is missing stdout"
 
         try:
             async with read_stream_writer:
+                if utf8:
+                    # '\n' ne peut pas apparaître dans une séquence UTF-8 multi-octets
+                    pending = bytearray()
+                    async for chunk in process.stdout:
+                        pending += chunk
+                        start = 0
+                        while (end := pending.find(b"\n", start)) != -1:
+                            await dispatch_line(bytes(pending[start:end]))
+                            start = end + 1
+                        if start:
+                            del pending[:start]
+                    return
+
                 buffer = ""
                 async for chunk in TextReceiveStream(
                     process.stdout,
@@ -109,36 +171,29 @@ async def _filtered_stdio_client(
                     buffer = lines.pop()
 
                     for line in lines:
-                        try:
-                            message = mcp_types.JSONRPCMessage.model_validate_json(line)
-                        except Exception as exc:  # pragma: no cover - depends on external server
-                            if _should_suppress_json_error(line):
-                                preview = line.strip()
-                                if preview:
-                                    _stdout_log.debug("Ignored MCP stdout noise: %s", preview[:200])
-                                continue
-                            _stdout_log.exception("Failed to parse JSONRPC message from server")
-                            await read_stream_writer.send(exc)
-                            continue
-
-                        session_message = SessionMessage(message)
-                        await read_stream_writer.send(session_message)
+                        await dispatch_line(line)
         except anyio.ClosedResourceError:  # pragma: no cover - driven by transport shutdown
             await anyio.lowlevel.checkpoint()
 
     async def stdin_writer() -> None:
         assert process.stdin, "Opened process is missing stdin"
 
+        # pydantic sérialise déjà en UTF-8: pas de passage par str puis .encode() dans ce cas
         try:
             async with write_stream_reader:
                 async for session_message in write_stream_reader:
-                    payload = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
-                    await process.stdin.send(
-                        (payload + "\n").encode(
+                    if utf8:
+                        data = _JSONRPC_ADAPTER.dump_json(
+                            session_message.message, by_alias=True, exclude_none=True
+                        )
+                        data += b"\n"
+                    else:
+                        payload = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
+                        data = (payload + "\n").encode(
                             encoding=server.encoding,
                             errors=server.encoding_error_handler,
                         )
-                    )
+                    await process.stdin.send(data)
         except anyio.ClosedResourceError:  # pragma: no cover - driven by transport shutdown
             await anyio.lowlevel.checkpoint()
 
@@ -171,6 +226,16 @@ async def _filtered_stdio_client(
 
 
 class FilteredMCPServerStdio(MCPServerStdio):
+    _chart_process: Any = None
+
+    def process_exited(self) -> bool:
+        """Vrai si le sous-processus stdio lancé s'est terminé (serveur à remplacer)."""
+        process = self._chart_process
+        return process is not None and process.returncode is not None
+
+    def _remember_process(self, process: Any) -> None:
+        self._chart_process = process
+
     @asynccontextmanager
     async def client_streams(
         self,
@@ -186,7 +251,7 @@ class FilteredMCPServerStdio(MCPServerStdio):
             env=self.env,
             cwd=self.cwd,
         )
-        async with _filtered_stdio_client(server=server) as streams:
+        async with _filtered_stdio_client(server=server, on_process=self._remember_process) as streams:
             yield streams
 
 
@@ -206,7 +271,9 @@ class ChartAgentDeps:
 
     def trimmed_rows(self, limit: int | None = None) -> List[Dict[str, Any]]:
         cap = self.max_rows if limit is None else min(limit, self.max_rows)
-        return [dict(row) for row in self.dataset.rows[:cap]]
+        # Lignes déjà normalisées (dicts neufs) et seulement sérialisées en aval: pas de copie.
+        # Les consommateurs ne doivent pas les modifier.
+        return self.dataset.rows[:cap]
 
     def payload(self, limit: int | None = None) -> Dict[str, Any]:
         rows = self.trimmed_rows(limit)
@@ -230,10 +297,11 @@ class ChartAgentDeps:
             f"Lignes totales annoncées: {total}",
             f"Lignes transmises au modèle (limitées à {self.max_rows}): {provided}",
         ]
-        preview = self.payload(preview_limit)["rows"]
+        preview = self.trimmed_rows(preview_limit)
         if preview:
             lines.append("Aperçu des premières lignes (JSON):")
-            lines.append(json.dumps(preview, ensure_ascii=False))
+            # Sérialiseur Rust de pydantic (UTF-8, compact); gère aussi dates et Decimal
+            lines.append(to_json(preview).decode())
         if self.answer:
             lines.append("Synthèse NL→SQL fournie précédemment:")
             lines.append(self.answer.strip())
@@ -263,6 +331,86 @@ class LenientOpenAIChatModel(OpenAIChatModel):
         return super()._process_response(response)
 
 
+@lru_cache(maxsize=64)
+def _instruction_hints(tool_prefix: str | None, columns: Tuple[str, ...]) -> tuple[str, str]:
+    """Parties des instructions qui ne dépendent que du serveur et du schéma (7 colonnes max)."""
+    prefix_hint = (
+        f"Les outils du serveur MCP sont exposés sous le préfixe '{tool_prefix}_'."
+        if tool_prefix
+        else "Les outils du serveur MCP sont disponibles sans préfixe spécifique."
+    )
+    summary_cols = ", ".join(columns[:6])
+    if len(columns) > 6:
+        summary_cols += ", …"
+    return prefix_hint, summary_cols
+
+
+@dataclass
+class _CachedChartAgent:
+    """Agent MCP maintenu ouvert par une tâche dédiée (sous-processus stdio réutilisé)."""
+
+    agent: Agent[ChartAgentDeps, ChartAgentOutput]
+    server: FilteredMCPServerStdio
+    stop: asyncio.Event
+    task: asyncio.Task[None]
+
+    def alive(self) -> bool:
+        # Un sous-processus mort ne ferme pas le contexte de l'agent: on regarde aussi returncode
+        return not self.task.done() and not self.server.process_exited()
+
+    async def close(self) -> None:
+        self.stop.set()
+        try:
+            await self.task
+        except Exception:  # pragma: no cover - dépend du serveur MCP
+            log.warning("Arrêt du serveur MCP chart en erreur", exc_info=True)
+
+
+_agent_cache: dict[tuple[Any, ...], _CachedChartAgent] = {}
+_agent_cache_lock = asyncio.Lock()
+
+
+async def _open_chart_agent(
+    agent: Agent[ChartAgentDeps, ChartAgentOutput],
+    server: FilteredMCPServerStdio,
+) -> _CachedChartAgent:
+    """Démarre le serveur MCP de l'agent et le garde ouvert jusqu'à `close()`.
+
+    L'entrée et la sortie du contexte se font dans la même tâche: les task groups
+    anyio du client stdio refusent d'être fermés depuis une autre tâche (requête).
+    """
+    ready = asyncio.Event()
+    stop = asyncio.Event()
+
+    async def hold() -> None:
+        async with agent:
+            ready.set()
+            await stop.wait()
+
+    task = asyncio.create_task(hold(), name="mcp-chart-server")
+    waiter = asyncio.create_task(ready.wait())
+    await asyncio.wait({task, waiter}, return_when=asyncio.FIRST_COMPLETED)
+    if not ready.is_set():
+        waiter.cancel()
+        task.result()  # propage l'erreur de démarrage
+        raise ChartGenerationError("Le serveur MCP chart s'est arrêté au démarrage.")
+    return _CachedChartAgent(agent=agent, server=server, stop=stop, task=task)
+
+
+async def _evict_chart_agent(key: tuple[Any, ...], cached: _CachedChartAgent) -> None:
+    if _agent_cache.get(key) is cached:
+        del _agent_cache[key]
+    await cached.close()
+
+
+async def close_chart_agents() -> None:
+    """Arrête les serveurs MCP chart mis en cache (appelé à l'arrêt de l'application)."""
+    cached = list(_agent_cache.values())
+    _agent_cache.clear()
+    for entry in cached:
+        await entry.close()
+
+
 class ChartGenerationService:
     """Generates charts dynamically through the MCP chart server."""
 
@@ -289,8 +437,10 @@ class ChartGenerationService:
         if not dataset.rows:
             raise ChartGenerationError("Le résultat SQL est vide; impossible de générer un graphique.")
 
-        normalized_rows = self._normalize_rows(dataset.columns, dataset.rows)
-        limited_rows = normalized_rows[: self._DEFAULT_MAX_ROWS]
+        # Seules les premières lignes sont transmises à l'agent: inutile de normaliser le reste
+        limited_rows = self._normalize_rows(
+            dataset.columns, islice(dataset.rows, self._DEFAULT_MAX_ROWS)
+        )
         normalized_dataset = ChartDataset(
             sql=dataset.sql,
             columns=dataset.columns,
@@ -300,56 +450,33 @@ class ChartGenerationService:
             description=dataset.description,
         )
 
-        provider, model_name = self._build_provider()
-        env = os.environ.copy()
-        env.update(self._chart_spec.env or {})
-
-        server = FilteredMCPServerStdio(
-            self._chart_spec.command,
-            self._chart_spec.args,
-            env=env,
-            tool_prefix=self._chart_spec.name,
-            timeout=30,
-            read_timeout=300,
-        )
-
-        model = LenientOpenAIChatModel(model_name=model_name, provider=provider)
-        agent = Agent(
-            model,
-            name="mcp-chart",
-            instructions=self._base_instructions(self._chart_spec.name, normalized_dataset, answer),
-            deps_type=ChartAgentDeps,
-            output_type=ChartAgentOutput,
-            toolsets=[server],
-        )
-
-        @agent.tool
-        async def get_sql_result(ctx: RunContext[ChartAgentDeps]) -> Dict[str, Any]:  # type: ignore[no-untyped-def]
-            """Retourne les colonnes et lignes issues de la requête SQL exécutée en amont."""
-            return ctx.deps.payload()
-
-        @agent.instructions
-        async def sql_result_overview(ctx: RunContext[ChartAgentDeps]) -> str:  # type: ignore[no-untyped-def]
-            return ctx.deps.describe_dataset()
-
         deps = ChartAgentDeps(
             dataset=normalized_dataset,
             answer=answer,
             max_rows=self._DEFAULT_MAX_ROWS,
         )
 
+        base_url, model_name, api_key = self._llm_target()
+        spec = self._chart_spec
+        # L'environnement du serveur fait partie de la clé: il n'est copié qu'au démarrage
+        env_items = tuple(sorted((spec.env or {}).items()))
+        key = (spec.name, spec.command, tuple(spec.args), env_items, model_name, base_url)
+
         try:
-            async with agent:
-                # Enforce per-agent cap (mcp_chart)
-                check_and_increment("mcp_chart")
-                result = await agent.run(prompt, deps=deps)
+            cached = await self._get_agent(key, base_url, model_name, api_key)
+            # Enforce per-agent cap (mcp_chart)
+            check_and_increment("mcp_chart")
+            result = await cached.agent.run(prompt, deps=deps)
         except UnexpectedModelBehavior as exc:
             log.exception("Réponse LLM incompatible pour la génération de graphiques")
             raise ChartGenerationError(f"Réponse LLM incompatible: {exc}") from exc
-        except AgentBudgetExceeded:
-            # Bubble up so the API layer can return 429
+        except (AgentBudgetExceeded, ChartGenerationError):
+            # Bubble up so the API layer can return 429 / 502
             raise
         except Exception as exc:  # pragma: no cover - dépend des intégrations externes
+            # Le serveur partagé reste en place (autres requêtes en cours): seul un
+            # serveur arrêté (tâche finie ou sous-processus terminé) est remplacé,
+            # par `_get_agent` au prochain appel.
             log.exception("Échec lors de la génération de graphique via MCP")
             raise ChartGenerationError(str(exc)) from exc
 
@@ -379,7 +506,78 @@ class ChartGenerationService:
             "Serveur MCP 'chart' introuvable. Vérifiez MCP_CONFIG_PATH ou MCP_SERVERS_JSON."
         )
 
-    def _build_provider(self) -> tuple[OpenAIProvider, str]:
+    async def _get_agent(
+        self,
+        key: tuple[Any, ...],
+        base_url: str,
+        model_name: str,
+        api_key: str | None,
+    ) -> _CachedChartAgent:
+        cached = _agent_cache.get(key)
+        if cached is not None and cached.alive():
+            return cached
+        async with _agent_cache_lock:
+            cached = _agent_cache.get(key)
+            if cached is not None:
+                if cached.alive():
+                    return cached
+                await _evict_chart_agent(key, cached)
+            server = self._build_server()
+            agent = self._build_agent(self._build_provider(base_url, api_key), model_name, server)
+            cached = await _open_chart_agent(agent, server)
+            _agent_cache[key] = cached
+            log.info("Serveur MCP chart démarré (spec=%s, modèle=%s)", key[0], model_name)
+            return cached
+
+    def _build_server(self) -> FilteredMCPServerStdio:
+        spec = self._chart_spec
+        env = {**os.environ, **(spec.env or {})}
+
+        return FilteredMCPServerStdio(
+            spec.command,
+            spec.args,
+            env=env,
+            tool_prefix=spec.name,
+            timeout=30,
+            read_timeout=300,
+        )
+
+    def _build_agent(
+        self,
+        provider: OpenAIProvider,
+        model_name: str,
+        server: FilteredMCPServerStdio,
+    ) -> Agent[ChartAgentDeps, ChartAgentOutput]:
+        spec = self._chart_spec
+        model = LenientOpenAIChatModel(model_name=model_name, provider=provider)
+        agent = Agent(
+            model,
+            name="mcp-chart",
+            deps_type=ChartAgentDeps,
+            output_type=ChartAgentOutput,
+            toolsets=[server],
+        )
+        tool_prefix = spec.name
+
+        # Agent partagé entre requêtes: tout ce qui dépend du dataset passe par deps.
+        @agent.instructions
+        async def base_instructions(ctx: RunContext[ChartAgentDeps]) -> str:  # type: ignore[no-untyped-def]
+            return ChartGenerationService._base_instructions(
+                tool_prefix, ctx.deps.dataset, ctx.deps.answer
+            )
+
+        @agent.tool
+        async def get_sql_result(ctx: RunContext[ChartAgentDeps]) -> Dict[str, Any]:  # type: ignore[no-untyped-def]
+            """Retourne les colonnes et lignes issues de la requête SQL exécutée en amont."""
+            return ctx.deps.payload()
+
+        @agent.instructions
+        async def sql_result_overview(ctx: RunContext[ChartAgentDeps]) -> str:  # type: ignore[no-untyped-def]
+            return ctx.deps.describe_dataset()
+
+        return agent
+
+    def _llm_target(self) -> tuple[str, str, str | None]:
         if settings.llm_mode not in {"local", "api"}:
             raise ChartGenerationError("LLM_MODE doit valoir 'local' ou 'api'.")
 
@@ -396,7 +594,9 @@ class ChartGenerationService:
             raise ChartGenerationError(
                 "Configuration LLM incomplète pour la génération de graphiques."
             )
+        return base_url, model_name, api_key
 
+    def _build_provider(self, base_url: str, api_key: str | None) -> OpenAIProvider:
         verify_ssl = bool(settings.llm_verify_ssl)
         if not verify_ssl:
             log.warning(
@@ -405,28 +605,30 @@ class ChartGenerationService:
             )
 
         http_client = _openai_http_client(verify_ssl)
-        provider = OpenAIProvider(
+        return OpenAIProvider(
             base_url=base_url,
             api_key=api_key,
             http_client=http_client,
         )
-        return provider, model_name
 
     @staticmethod
     def _normalize_rows(columns: List[str], rows: Iterable[Any]) -> List[Dict[str, Any]]:
         normalized: List[Dict[str, Any]] = []
         headings = list(columns)
         fallback_key = headings[0] if headings else "value"
+        width = len(headings)
+        append = normalized.append
         for row in rows:
             if isinstance(row, dict):
-                normalized.append({col: row.get(col) for col in headings})
+                append(dict(zip(headings, map(row.get, headings))))
             elif isinstance(row, (list, tuple)):
-                normalized.append({
-                    col: row[idx] if idx < len(row) else None
-                    for idx, col in enumerate(headings)
-                })
+                if len(row) >= width:
+                    append(dict(zip(headings, row)))
+                else:
+                    # Ligne courte: colonnes manquantes complétées par None
+                    append(dict(zip(headings, chain(row, repeat(None)))))
             else:
-                normalized.append({fallback_key: row})
+                append({fallback_key: row})
         return normalized
 
     @staticmethod
@@ -435,15 +637,8 @@ class ChartGenerationService:
         dataset: ChartDataset,
         answer: str | None,
     ) -> str:
-        prefix_hint = (
-            f"Les outils du serveur MCP sont exposés sous le préfixe '{tool_prefix}_'."
-            if tool_prefix
-            else "Les outils du serveur MCP sont disponibles sans préfixe spécifique."
-        )
+        prefix_hint, summary_cols = _instruction_hints(tool_prefix, tuple(dataset.columns[:7]))
         total_rows = dataset.row_count if dataset.row_count is not None else len(dataset.rows)
-        summary_cols = ", ".join(dataset.columns[:6])
-        if len(dataset.columns) > 6:
-            summary_cols += ", …"
         answer_hint = f"\nSynthèse NL→SQL à respecter: {answer.strip()}" if answer else ""
         return get_prompt_store().render(
             "mcp_chart_base_instructions",
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import json
 import logging
+from array import array
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Protocol
+from typing import Protocol, Sequence
 
 import yaml
 
@@ -39,6 +42,17 @@ class EmbeddingConfig:
     batch_size: int
 
 
+# libyaml (C) si disponible: nettement plus rapide que le chargeur pur Python
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=16)
+def _read_config_yaml(path: str, mtime_ns: int) -> object:
+    """YAML parsé une fois par version du fichier (clé: chemin + mtime); lecture seule."""
+    with open(path, "r", encoding="utf-8") as fh:
+        return yaml.load(fh, Loader=_YAML_LOADER) or {}
+
+
 def load_embedding_config(raw_path: str | None) -> EmbeddingConfig | None:
     """Parse the YAML configuration describing MindsDB embedding columns."""
     if not settings.mindsdb_embeddings_enabled:
@@ -49,11 +63,12 @@ def load_embedding_config(raw_path: str | None) -> EmbeddingConfig | None:
         return None
 
     resolved = Path(resolve_project_path(raw_path))
-    if not resolved.exists():
-        raise FileNotFoundError(f"MindsDB embedding config not found: {resolved}")
+    try:
+        mtime_ns = resolved.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"MindsDB embedding config not found: {resolved}") from None
 
-    with resolved.open("r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh) or {}
+    data = _read_config_yaml(str(resolved), mtime_ns)
 
     if not isinstance(data, dict):
         raise ValueError("MindsDB embedding config must be a mapping at the top level.")
@@ -124,36 +139,48 @@ def default_embedding_model(configured: str | None) -> str:
     return candidate
 
 
+# Modèles locaux chargés une fois par processus: le chargement (poids, tokenizer) coûte
+# bien plus que l'encodage d'une question isolée.
+_models: dict[str, object] = {}
+_models_lock = threading.Lock()
+
+
+def _get_sentence_transformer(model_name: str):
+    with _models_lock:
+        model = _models.get(model_name)
+        if model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError as exc:  # pragma: no cover - import guard
+                raise RuntimeError(
+                    "Le mode d'embedding local nécessite le package 'sentence-transformers'."
+                    " Installez-le via 'uv add sentence-transformers'."
+                ) from exc
+            log.info("Initialisation du modèle d'embedding local: %s", model_name)
+            model = SentenceTransformer(model_name)
+            _models[model_name] = model
+        return model
+
+
 class _SentenceTransformerClient:
     def __init__(self, model_name: str):
-        try:
-            from sentence_transformers import SentenceTransformer
-        except ImportError as exc:  # pragma: no cover - import guard
-            raise RuntimeError(
-                "Le mode d'embedding local nécessite le package 'sentence-transformers'."
-                " Installez-le via 'uv add sentence-transformers'."
-            ) from exc
-
         self._model_name = model_name
-        log.info("Initialisation du modèle d'embedding local: %s", model_name)
-        self._model = SentenceTransformer(model_name)
+        self._model = _get_sentence_transformer(model_name)
 
     def embeddings(self, *, model: str, inputs: list[str]) -> list[list[float]]:
         if not inputs:
             return []
         vectors = self._model.encode(
             inputs,
+            # Un seul passage par lot reçu: la taille est pilotée par l'appelant (batch_size YAML)
+            batch_size=len(inputs),
             convert_to_numpy=True,
             show_progress_bar=False,
         )
-        processed: list[list[float]] = []
-        for vec in vectors:
-            if hasattr(vec, "tolist"):
-                raw = vec.tolist()  # type: ignore[assignment]
-            else:
-                raw = vec
-            processed.append([float(item) for item in raw])
-        return processed
+        if hasattr(vectors, "tolist"):
+            # ndarray 2D: une seule conversion en C vers des listes de float Python
+            return vectors.tolist()
+        return [[float(item) for item in vec] for vec in vectors]
 
     def close(self) -> None:  # pragma: no cover - nothing to clean explicitly
         return
@@ -182,13 +209,16 @@ def build_embedding_client(config: EmbeddingConfig) -> tuple[EmbeddingClient, st
     raise RuntimeError("EMBEDDING_MODE must be 'local' or 'api' to compute embeddings.")
 
 
-def normalise_embedding(value: object) -> Iterable[float]:
-    """Convert embedding payloads (list or JSON string) into a float iterator."""
+def normalise_embedding(value: object) -> Sequence[float]:
+    """Convert embedding payloads (list or JSON string) into a float sequence."""
     if isinstance(value, str):
         raw = json.loads(value)
     else:
         raw = value
     if not isinstance(raw, (list, tuple)):
         raise ValueError(f"Unexpected embedding payload: {type(raw)!r}")
-    for item in raw:
-        yield float(item)
+    try:
+        # Conversion numérique en C pour tout le vecteur (nombres JSON: cas nominal)
+        return array("d", raw)
+    except TypeError:
+        return array("d", [float(item) for item in raw])
@@ -2,17 +2,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import re
-from typing import Dict, List
+from typing import Dict, Iterator, List
 import json
 import logging
 
 from ..core.config import settings
 import sqlglot
 from sqlglot import exp
-from ..integrations.openai_client import OpenAICompatibleClient
+from ..integrations.openai_client import OpenAICompatibleClient, collect_stream_content
 from ..core.agent_limits import check_and_increment
 from ..core.prompts import get_prompt_store
 from ..repositories.data_repository import DataRepository
+from .llm_cache import get_llm_cache
 
 log = logging.getLogger("insight.services.nl2sql")
 
@@ -90,7 +91,7 @@ def _condense_evidence(
                     "sql": str(e.get("sql", ""))[:400] if isinstance(e, dict) else "",
                     "columns": cols,
                     "rows": trimmed_rows,
-                    "row_count": len(rows_list),
+                    "row_count": e.get("row_count", len(rows_list)) if isinstance(e, dict) else len(rows_list),
                 }
             )
         except Exception:  # pragma: no cover - defensive
@@ -693,7 +694,10 @@ class NL2SQLService:
                         "purpose": str(e.get("purpose", "")),
                         "sql": str(e.get("sql", ""))[:200],
                         "columns": e.get("columns", []),
-                        "row_count": len(e.get("rows", []) if isinstance(e.get("rows"), list) else []),
+                        "row_count": e.get(
+                            "row_count",
+                            len(e.get("rows", []) if isinstance(e.get("rows"), list) else []),
+                        ),
                     }
                     for e in (evidence or [])
                 ]
@@ -754,20 +758,13 @@ class NL2SQLService:
         return out
 
     # Writer agent: interpret results with Constat / Action / Question
-    def write(
+    def _writer_messages(
         self,
         *,
         question: str,
         evidence: List[Dict[str, object]],
-        retrieval_context: List[Dict[str, object]] | None = None,
-    ) -> str:
-        client, model = self._client_and_model()
-        log.info(
-            "NL2SQL.write(writer) start: question=\"%s\" evidence=%d retrieval=%d",
-            _preview(question, limit=200),
-            len(evidence),
-            len(retrieval_context or []),
-        )
+        retrieval_context: List[Dict[str, object]] | None,
+    ) -> List[Dict[str, str]]:
         system = get_prompt_store().get("nl2sql_writer_system").template
         payload = {
             "question": question,
@@ -781,22 +778,44 @@ class NL2SQLService:
         }
         if retrieval_context is not None:
             payload["retrieval_context"] = retrieval_context
+        return [
+            {"role": "system", "content": system},
+            {"role": "user", "content": json.dumps(payload, ensure_ascii=False)},
+        ]
+
+    def write(
+        self,
+        *,
+        question: str,
+        evidence: List[Dict[str, object]],
+        retrieval_context: List[Dict[str, object]] | None = None,
+    ) -> str:
+        client, model = self._client_and_model()
+        log.info(
+            "NL2SQL.write(writer) start: question=\"%s\" evidence=%d retrieval=%d",
+            _preview(question, limit=200),
+            len(evidence),
+            len(retrieval_context or []),
+        )
+        messages = self._writer_messages(question=question, evidence=evidence, retrieval_context=retrieval_context)
+        cache = get_llm_cache()
+        cache_key = cache.key(role="redaction", model=model, messages=messages)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            log.info("NL2SQL.write(writer) served from LLM cache: reply_preview=\"%s\"", _preview(cached, limit=200))
+            return cached
         # Enforce per-agent cap (redaction)
         check_and_increment("redaction")
-        payload_json = json.dumps(payload, ensure_ascii=False)
         log.info(
             "NL2SQL.write(writer) invoking LLM: model=%s max_tokens=%d payload_chars=%d",
             model,
             settings.llm_max_tokens,
-            len(payload_json),
+            len(messages[1]["content"]),
         )
         try:
             resp = client.chat_completions(
                 model=model,
-                messages=[
-                    {"role": "system", "content": system},
-                    {"role": "user", "content": payload_json},
-                ],
+                messages=messages,
                 temperature=0,
                 max_tokens=settings.llm_max_tokens,
             )
@@ -805,4 +824,53 @@ class NL2SQLService:
             raise
         reply = resp.get("choices", [{}])[0].get("message", {}).get("content", "")
         log.info("NL2SQL.write(writer) done: reply_preview=\"%s\"", _preview(reply, limit=200))
+        cache.set(cache_key, reply)
         return reply
+
+    def write_stream(
+        self,
+        *,
+        question: str,
+        evidence: List[Dict[str, object]],
+        retrieval_context: List[Dict[str, object]] | None = None,
+    ) -> Iterator[str]:
+        """Same as ``write`` but yields the reply chunk by chunk as the LLM produces it."""
+        client, model = self._client_and_model()
+        log.info(
+            "NL2SQL.write_stream(writer) start: question=\"%s\" evidence=%d retrieval=%d",
+            _preview(question, limit=200),
+            len(evidence),
+            len(retrieval_context or []),
+        )
+        messages = self._writer_messages(question=question, evidence=evidence, retrieval_context=retrieval_context)
+        cache = get_llm_cache()
+        cache_key = cache.key(role="redaction", model=model, messages=messages)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            log.info("NL2SQL.write_stream(writer) served from LLM cache: reply_preview=\"%s\"", _preview(cached, limit=200))
+            yield cached
+            return
+        check_and_increment("redaction")
+        log.info(
+            "NL2SQL.write_stream(writer) invoking LLM: model=%s max_tokens=%d payload_chars=%d",
+            model,
+            settings.llm_max_tokens,
+            len(messages[1]["content"]),
+        )
+        parts: List[str] = []
+        try:
+            for chunk in client.stream_chat_completions(
+                model=model,
+                messages=messages,
+                temperature=0,
+                max_tokens=settings.llm_max_tokens,
+            ):
+                seen = len(parts)
+                collect_stream_content(chunk, parts)
+                yield from filter(None, parts[seen:])
+        except Exception:
+            log.exception("NL2SQL.write_stream(writer) LLM call failed")
+            raise
+        reply = "".join(parts)
+        log.info("NL2SQL.write_stream(writer) done: reply_preview=\"%s\"", _preview(reply, limit=200))
+        cache.set(cache_key, reply)
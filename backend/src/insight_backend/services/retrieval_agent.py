@@ -7,6 +7,7 @@ from ..core.config import settings
 from ..core.agent_limits import check_and_increment
 from ..core.prompts import get_prompt_store
 from ..integrations.openai_client import OpenAICompatibleClient, OpenAIBackendError
+from .llm_cache import get_llm_cache
 from .retrieval_service import RetrievalService
 
 
@@ -116,17 +117,26 @@ class RetrievalAgent:
             },
         )
 
+        client, model = self._build_client()
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+        cache = get_llm_cache()
+        cache_key = cache.key(role="retrieval", model=model, messages=messages)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            client.close()
+            log.info("Retrieval highlight served from LLM cache")
+            return cached
+
         # Enforce per-agent cap (retrieval synthesis)
         check_and_increment("retrieval")
 
-        client, model = self._build_client()
         try:
             response = client.chat_completions(
                 model=model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
+                messages=messages,
                 temperature=float(settings.retrieval_temperature),
                 max_tokens=int(settings.retrieval_max_tokens),
             )
@@ -144,4 +154,5 @@ class RetrievalAgent:
         text = str(content).strip()
         if not text:
             raise RuntimeError("Réponse LLM vide pour la mise en avant.")
+        cache.set(cache_key, text)
         return text
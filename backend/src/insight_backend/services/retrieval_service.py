@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import math
+from array import array
 from dataclasses import dataclass
 from typing import Any, Iterable, List, Sequence
 
@@ -271,6 +272,7 @@ def _stringify(value: Any) -> str:
 def _to_tuple(vec: Iterable[float] | Sequence[float]) -> tuple[float, ...]:
     if isinstance(vec, tuple):
         return vec
-    if isinstance(vec, list):
-        return tuple(float(x) for x in vec)
-    return tuple(float(x) for x in vec)
+    if isinstance(vec, array):
+        # Déjà des float (normalise_embedding): copie directe sans conversion
+        return tuple(vec)
+    return tuple(map(float, vec))
@@ -516,7 +516,7 @@ class TicketContextService:
             seen.add(key)
             columns.append(name)
         entries = prepare_ticket_entries(
-            rows=self.data_repo.read_rows(
+            rows=self.data_repo.iter_rows(
                 config.table_name,
                 columns=columns,
             ),
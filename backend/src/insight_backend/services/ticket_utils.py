@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from datetime import date, datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
 from ..core.config import settings
 
@@ -33,7 +33,7 @@ def parse_ticket_date(raw: Any) -> date | None:
 
 def prepare_ticket_entries(
     *,
-    rows: List[Dict[str, Any]],
+    rows: Iterable[Dict[str, Any]],
     text_column: str,
     date_column: str,
 ) -> List[Dict[str, Any]]:
@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+from insight_backend.repositories.data_repository import DataRepository
+
+
+def test_get_schema_reflects_rewritten_file(tmp_path):
+    path = tmp_path / "tickets.csv"
+    path.write_text("id,title\n1,a\n", encoding="utf-8")
+    repo = DataRepository(tables_dir=tmp_path)
+
+    assert repo.get_schema("tickets") == [("id", None), ("title", None)]
+    assert repo.get_schema("tickets") == [("id", None), ("title", None)]
+
+    path.write_text("id,title,status\n1,a,open\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert [name for name, _ in repo.get_schema("tickets")] == ["id", "title", "status"]
+
+
+def test_get_schema_empty_file_has_no_columns(tmp_path):
+    (tmp_path / "empty.tsv").write_text("", encoding="utf-8")
+    repo = DataRepository(tables_dir=tmp_path)
+
+    assert repo.get_schema("empty") == []
+
+
+def test_iter_rows_projects_requested_columns(tmp_path):
+    (tmp_path / "tickets.csv").write_text("id,Title,body\n1,a,x\n\n2,b\n", encoding="utf-8")
+    repo = DataRepository(tables_dir=tmp_path)
+
+    rows = repo.iter_rows("tickets", columns=["title", "id", "missing", "ID"])
+
+    assert list(rows) == [{"Title": "a", "id": "1"}, {"Title": "b", "id": "2"}]
+    assert repo.read_rows("tickets") == [
+        {"id": "1", "Title": "a", "body": "x"},
+        {"id": "2", "Title": "b", "body": None},
+    ]
+
+
+def test_iter_rows_prefers_exact_header_over_casefold_match(tmp_path):
+    (tmp_path / "tickets.csv").write_text("id,ID,Title\n1,X-1,a\n", encoding="utf-8")
+    repo = DataRepository(tables_dir=tmp_path)
+
+    assert list(repo.iter_rows("tickets", columns=["id"])) == [{"id": "1"}]
+    assert list(repo.iter_rows("tickets", columns=["ID", "title"])) == [{"ID": "X-1", "Title": "a"}]
+
+
+def test_iter_rows_missing_table_raises_on_call(tmp_path):
+    repo = DataRepository(tables_dir=tmp_path)
+
+    with pytest.raises(FileNotFoundError):
+        repo.iter_rows("absente")
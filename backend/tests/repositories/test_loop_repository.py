@@ -0,0 +1,84 @@
+from datetime import date
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from insight_backend.core.database import Base
+from insight_backend.repositories.loop_repository import LoopRepository
+
+
+def _summary(kind: str, start: date, content: str) -> dict:
+    return {
+        "kind": kind,
+        "period_label": start.isoformat(),
+        "period_start": start,
+        "period_end": start,
+        "ticket_count": 1,
+        "content": content,
+    }
+
+
+def test_list_configs_filters_tables_case_insensitively():
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    session = Session()
+    try:
+        repo = LoopRepository(session)
+        tickets = repo.save_config(table_name="Tickets", text_column="text", date_column="date")
+        repo.save_config(table_name="incidents", text_column="text", date_column="date")
+        session.flush()
+
+        assert [c.id for c in repo.list_configs(allowed_tables=["TICKETS"])] == [tickets.id]
+        assert repo.list_configs(allowed_tables=[]) == []
+        assert len(repo.list_configs()) == 2
+        assert repo.get_config_by_table("tickets").id == tickets.id
+    finally:
+        session.close()
+
+
+def test_list_configs_matches_non_ascii_table_names():
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    session = Session()
+    try:
+        repo = LoopRepository(session)
+        equipe = repo.save_config(table_name="Équipe", text_column="text", date_column="date")
+        repo.save_config(table_name="tickets", text_column="text", date_column="date")
+        session.flush()
+
+        assert [c.id for c in repo.list_configs(allowed_tables=["équipe"])] == [equipe.id]
+        assert [c.id for c in repo.list_configs(allowed_tables=["ÉQUIPE", "absente"])] == [equipe.id]
+        assert repo.get_config_by_table("équipe").id == equipe.id
+    finally:
+        session.close()
+
+
+def test_list_latest_summaries_returns_top_one_per_kind():
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    session = Session()
+    try:
+        repo = LoopRepository(session)
+        first = repo.save_config(table_name="tickets", text_column="text", date_column="date")
+        second = repo.save_config(table_name="incidents", text_column="text", date_column="date")
+        repo.replace_summaries(
+            config=first,
+            items=[
+                _summary("daily", date(2024, 5, 1), "ancien"),
+                _summary("daily", date(2024, 5, 2), "récent"),
+                _summary("monthly", date(2024, 5, 1), "mois"),
+            ],
+        )
+        repo.replace_summaries(config=second, items=[_summary("weekly", date(2024, 4, 29), "semaine")])
+        session.flush()
+
+        latest = repo.list_latest_summaries(config_ids=[first.id, second.id])
+
+        assert {kind: s.content for kind, s in latest[first.id].items()} == {"daily": "récent", "monthly": "mois"}
+        assert {kind: s.content for kind, s in latest[second.id].items()} == {"weekly": "semaine"}
+        assert repo.list_latest_summaries(config_ids=[]) == {}
+    finally:
+        session.close()
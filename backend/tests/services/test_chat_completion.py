@@ -0,0 +1,217 @@
+import threading
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from insight_backend.core.config import settings
+from insight_backend.schemas.chat import ChatMessage, ChatRequest
+from insight_backend.services import chat_service as chat_module
+from insight_backend.services.chat_service import ChatService
+
+
+class DummyEngine:
+    def run(self, payload):  # pragma: no cover - not used here
+        raise NotImplementedError
+
+
+class FakeMindsDB:
+    calls: List[str] = []
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def sql(self, query: str) -> Dict[str, Any]:
+        FakeMindsDB.calls.append(query)
+        return {"type": "table", "column_names": ["status", "n"], "data": [["open", 3]]}
+
+    def sql_batch(self, queries: List[str]) -> List[Dict[str, Any]]:
+        return [self.sql(q) for q in queries]
+
+
+class FakeNL2SQL:
+    def explore(self, **_: Any) -> List[Dict[str, str]]:
+        return [
+            {"purpose": "count", "sql": "SELECT status, count(*) AS n FROM files.tickets GROUP BY status"},
+            {"purpose": "again", "sql": "SELECT status, count(*) AS n FROM files.tickets GROUP BY status"},
+        ]
+
+    def propose_axes(self, **_: Any) -> List[Dict[str, str]]:
+        return [{"x": "status", "y": "n", "agg": "sum", "chart": "bar", "reason": "r"}]
+
+    def generate_with_evidence(self, **_: Any) -> str:
+        return "SELECT status, count(*) AS n FROM files.tickets GROUP BY status"
+
+    def synthesize(self, **_: Any) -> str:
+        return "3 tickets ouverts"
+
+    def write(self, **kwargs: Any) -> str:
+        assert kwargs["evidence"]
+        return "  Il y a 3 tickets ouverts.  "
+
+    def write_stream(self, **kwargs: Any):
+        assert kwargs["evidence"]
+        yield from ("  Il y a ", "3 tickets", " ouverts.  ")
+
+
+@pytest.fixture
+def nl2sql_env(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    tables = tmp_path / "tables"
+    tables.mkdir()
+    (tables / "tickets.csv").write_text("status,title\nopen,a\n", encoding="utf-8")
+    monkeypatch.setattr(settings, "tables_dir", str(tables))
+    monkeypatch.setattr(settings, "data_dictionary_dir", str(tmp_path / "dictionary"))
+    monkeypatch.setattr(chat_module, "get_mindsdb_client", FakeMindsDB)
+    monkeypatch.setattr(chat_module, "NL2SQLService", FakeNL2SQL)
+    monkeypatch.setattr(
+        ChatService,
+        "_retrieve_context",
+        lambda self, **_: ([], "Mise en avant : rien"),
+    )
+    FakeMindsDB.calls = []
+    return tables
+
+
+def _collect() -> Tuple[List[Tuple[str, Dict[str, Any]]], Any]:
+    bucket: List[Tuple[str, Dict[str, Any]]] = []
+
+    def _events(kind: str, payload: Dict[str, Any]) -> None:
+        bucket.append((kind, payload))
+
+    return bucket, _events
+
+
+def test_completion_multiagent_flow_emits_ordered_events(nl2sql_env):
+    svc = ChatService(DummyEngine())
+    bucket, events = _collect()
+    payload = ChatRequest(messages=[ChatMessage(role="user", content="Combien de tickets ouverts ?")])
+
+    resp = svc.completion(payload, events=events)
+
+    assert resp.reply == "Il y a 3 tickets ouverts."
+    assert resp.metadata["provider"] == "nl2sql-multiagent"
+    explore_steps = [p["step"] for k, p in bucket if k == "rows" and p.get("purpose") == "explore"]
+    assert explore_steps == [1, 2]
+    purposes = [p.get("purpose") for k, p in bucket if k == "sql"]
+    assert purposes == ["explore", "explore", "answer", "evidence"]
+    assert any(k == "meta" and "axes_suggestions" in p for k, p in bucket)
+    # Identical exploration/final statements hit MindsDB once per request
+    assert len(FakeMindsDB.calls) == len(set(FakeMindsDB.calls))
+
+
+def test_completion_streams_writer_tokens_and_joins_reply(nl2sql_env):
+    svc = ChatService(DummyEngine())
+    bucket, events = _collect()
+    question = [ChatMessage(role="user", content="Combien de tickets ouverts ?")]
+
+    streamed = svc.completion(ChatRequest(messages=question), events=events)
+    plain = svc.completion(ChatRequest(messages=question))
+
+    tokens = [p for k, p in bucket if k == "token"]
+    assert [t["delta"] for t in tokens] == ["  Il y a ", "3 tickets", " ouverts.  "]
+    assert {t["round"] for t in tokens} == {1}
+    assert bucket[-1][0] == "token"
+    assert streamed.reply == plain.reply == "Il y a 3 tickets ouverts."
+
+
+def test_completion_sql_passthrough_formats_table(nl2sql_env):
+    svc = ChatService(DummyEngine())
+    payload = ChatRequest(messages=[ChatMessage(role="user", content="  /SQL SELECT * FROM files.tickets")])
+
+    resp = svc.completion(payload)
+
+    assert resp.metadata == {"provider": "mindsdb-sql"}
+    assert resp.reply.splitlines() == ["status | n", "----------", "open | 3"]
+
+
+def test_completion_sql_passthrough_fetches_evidence_once(nl2sql_env):
+    svc = ChatService(DummyEngine())
+    bucket, events = _collect()
+    payload = ChatRequest(messages=[ChatMessage(role="user", content="/sql SELECT status FROM files.tickets")])
+
+    svc.completion(payload, events=events)
+
+    assert sorted(FakeMindsDB.calls) == ["SELECT * FROM files.tickets LIMIT 100", "SELECT status FROM files.tickets"]
+    assert [p.get("purpose") for k, p in bucket if k == "sql"] == [None, "evidence"]
+    assert any(k == "rows" and p.get("purpose") == "evidence" for k, p in bucket)
+
+
+def test_completion_sql_passthrough_formats_dict_rows(nl2sql_env, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        FakeMindsDB,
+        "sql",
+        lambda self, query: {"columns": ["a", "b"], "rows": [{"a": 1, "b": None}, {"b": "x"}]},
+    )
+    svc = ChatService(DummyEngine())
+    payload = ChatRequest(messages=[ChatMessage(role="user", content="/sql SELECT a, b FROM files.t")])
+
+    resp = svc.completion(payload)
+
+    assert resp.reply.splitlines() == ["a | b", "-----", "1 | None", "None | x"]
+
+
+def test_completion_applies_permissions_and_exclusions_case_insensitively(nl2sql_env):
+    (nl2sql_env / "Orders.csv").write_text("id\n1\n", encoding="utf-8")
+    svc = ChatService(DummyEngine())
+    bucket, events = _collect()
+    payload = ChatRequest(
+        messages=[ChatMessage(role="user", content="Combien ?")],
+        metadata={"exclude_tables": [" TICKETS ", 3, ""]},
+    )
+
+    resp = svc.completion(payload, events=events, allowed_tables=["tickets"])
+
+    assert resp.metadata == {"provider": "nl2sql-acl", "effective_tables": []}
+    assert ("meta", {"effective_tables": []}) in bucket
+
+    bucket.clear()
+    svc.completion(
+        ChatRequest(messages=[ChatMessage(role="user", content="Combien ?")], metadata={"exclude_tables": ["tickets"]}),
+        events=events,
+    )
+    assert bucket[0] == ("meta", {"effective_tables": ["Orders"]})
+
+
+def test_completion_truncates_explore_rows_but_not_answer(nl2sql_env, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "events_row_preview", 1)
+    monkeypatch.setattr(
+        FakeMindsDB,
+        "sql",
+        lambda self, query: {"type": "table", "column_names": ["n"], "data": [[1], [2], [3]]},
+    )
+    svc = ChatService(DummyEngine())
+    bucket, events = _collect()
+
+    svc.completion(ChatRequest(messages=[ChatMessage(role="user", content="Combien ?")]), events=events)
+
+    rows = {p["purpose"]: p for k, p in bucket if k == "rows"}
+    assert rows["explore"]["rows"] == [[1]]
+    assert rows["explore"]["row_count"] == 3 and rows["explore"]["truncated"] is True
+    assert rows["answer"]["rows"] == [[1], [2], [3]] and "truncated" not in rows["answer"]
+
+
+def test_completion_runs_evidence_query_while_writer_streams(nl2sql_env, monkeypatch: pytest.MonkeyPatch):
+    writer_started = threading.Event()
+    overlapped: List[bool] = []
+    answer_sql = FakeMindsDB.sql
+
+    def _sql(self, query: str) -> Dict[str, Any]:
+        if query.startswith("SELECT * "):
+            # The evidence query only completes once the writer is running
+            overlapped.append(writer_started.wait(timeout=5))
+        return answer_sql(self, query)
+
+    def _write_stream(self, **_: Any):
+        writer_started.set()
+        yield "ok"
+
+    monkeypatch.setattr(FakeMindsDB, "sql", _sql)
+    monkeypatch.setattr(FakeNL2SQL, "write_stream", _write_stream)
+    svc = ChatService(DummyEngine())
+    bucket, events = _collect()
+
+    resp = svc.completion(ChatRequest(messages=[ChatMessage(role="user", content="Combien ?")]), events=events)
+
+    assert resp.reply == "ok"
+    assert overlapped == [True]
+    # Evidence events are all emitted before completion() returns
+    assert any(k == "rows" and p.get("purpose") == "evidence" for k, p in bucket)
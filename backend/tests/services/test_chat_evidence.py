@@ -3,7 +3,15 @@ from typing import Any, Dict, List, Tuple
 import pytest
 
 from insight_backend.core.config import settings
-from insight_backend.services.chat_service import ChatService
+from insight_backend.schemas.chat import ChatMessage
+from insight_backend.services.chat_service import (
+    ChatService,
+    _EvidenceBuffer,
+    _RequestSQLCache,
+    _preview_text,
+    _serialize_dico_compact,
+    extract_sql_command,
+)
 
 
 class DummyEngine:
@@ -59,6 +67,23 @@ def test_derive_evidence_sql_with_cte_keeps_where_and_cte():
     assert low.startswith("with ") and " from t " in low and " where status='open'" in low
 
 
+def test_derive_evidence_sql_rejects_malformed_statements():
+    svc = ChatService(DummyEngine())
+    # Strict parsing: a tolerant parser would "repair" these into evidence for a query that never ran
+    assert svc._derive_evidence_sql("SELECT count(*) FROM files.t WHERE (a=1") is None
+    assert svc._derive_evidence_sql("SELECT a FROM files.t WHERE") is None
+
+
+
+def test_derive_evidence_sql_accepts_leading_parentheses_and_comments():
+    svc = ChatService(DummyEngine())
+    assert svc._derive_evidence_sql("(SELECT * FROM files.tickets)") == "(SELECT * FROM files.tickets) LIMIT 100"
+    derived = svc._derive_evidence_sql(
+        "-- tickets ouverts\n/* v2 */ SELECT count(*) FROM files.tickets WHERE status='open'"
+    )
+    assert derived is not None
+    assert derived.lower().startswith("select * from files.tickets where status")
+
 def test_derive_evidence_sql_union_is_skipped():
     svc = ChatService(DummyEngine())
     sql = (
@@ -68,6 +93,20 @@ def test_derive_evidence_sql_union_is_skipped():
     assert svc._derive_evidence_sql(sql) is None
 
 
+def test_derive_evidence_sql_rejects_non_select_without_parsing(monkeypatch: pytest.MonkeyPatch):
+    from insight_backend.services import chat_service as chat_module
+
+    def _no_parse(*_: Any, **__: Any):
+        raise AssertionError("parse_one should not be called")
+
+    monkeypatch.setattr(chat_module, "parse_one", _no_parse)
+    svc = ChatService(DummyEngine())
+    assert svc._derive_evidence_sql("INSERT INTO files.t SELECT * FROM files.u") is None
+    assert svc._derive_evidence_sql("  delete from files.t") is None
+    assert svc._derive_evidence_sql("") is None
+    assert svc._derive_evidence_sql("select * from files.t", limit=7) == "select * from files.t LIMIT 7"
+
+
 def test_build_evidence_spec_infers_keys_and_limit():
     svc = ChatService(DummyEngine())
     cols = ["ticket_id", "title", "status", "created_at"]
@@ -78,6 +117,28 @@ def test_build_evidence_spec_infers_keys_and_limit():
     assert spec["limit"] == 100
 
 
+def test_build_evidence_spec_returns_actual_column_names():
+    svc = ChatService(DummyEngine())
+    spec = svc._build_evidence_spec(["ID", "Feedback_Text", "CreatedAt", "State"])
+    assert spec["entity_label"] == "Feedback"
+    assert spec["pk"] == "ID"
+    assert spec["display"] == {"status": "State", "created_at": "CreatedAt"}
+
+
+def test_build_evidence_spec_reuses_column_profile_but_returns_fresh_specs():
+    from insight_backend.services import chat_service as chat_module
+
+    chat_module._evidence_columns_profile.cache_clear()
+    svc = ChatService(DummyEngine())
+    cols = ["id", "title"]
+    first = svc._build_evidence_spec(cols, label_hint="tickets")
+    first["display"]["title"] = "mutated"
+    second = svc._build_evidence_spec(cols, label_hint="autre")
+    assert second["display"] == {"title": "title"}
+    assert (first["entity_label"], second["entity_label"]) == ("Tickets", "Éléments")
+    assert chat_module._evidence_columns_profile.cache_info().hits == 1
+
+
 def test_normalize_result_handles_table_shape():
     svc = ChatService(DummyEngine())
     payload = {
@@ -104,6 +165,16 @@ def test_normalize_result_caps_rows_and_columns(monkeypatch: pytest.MonkeyPatch)
     assert rows == [[1]]
 
 
+def test_normalize_result_trims_dict_and_tuple_rows(monkeypatch: pytest.MonkeyPatch):
+    svc = ChatService(DummyEngine())
+    monkeypatch.setattr(settings, "agent_output_max_columns", 2)
+    cols, rows = svc._normalize_result({"columns": ["a", "b", "c"], "rows": [{"a": 1, "c": 3}, {"b": 2}]})
+    assert cols == ["a", "b"]
+    assert rows == [{"a": 1, "b": None}, {"a": None, "b": 2}]
+    _, rows = svc._normalize_result({"columns": ["a", "b", "c"], "rows": [(4, 5, 6), (7, 8, 9)]})
+    assert rows == [(4, 5), (7, 8)]
+
+
 def test_emit_evidence_uses_fallback_when_no_derived():
     svc = ChatService(DummyEngine())
     bucket, events = collect_events()
@@ -178,3 +249,175 @@ def test_append_highlight_adds_separator():
     result = ChatService._append_highlight("Réponse", "Mise en avant : Exemple")
     assert result.endswith("Mise en avant : Exemple")
     assert "\n\n" in result
+
+
+def test_append_highlight_handles_blank_parts():
+    assert ChatService._append_highlight("Réponse  \n", "") == "Réponse"
+    assert ChatService._append_highlight("Réponse ", " \n ") == "Réponse"
+    assert ChatService._append_highlight("", " Mise en avant ") == "Mise en avant"
+    assert ChatService._append_highlight("  ", "Mise en avant") == "Mise en avant"
+    assert ChatService._append_highlight(" A ", " B ") == " A\n\nB"
+
+
+def test_request_sql_cache_deduplicates_identical_queries():
+    calls: List[str] = []
+
+    class CountingClient:
+        def sql(self, query: str):
+            calls.append(query)
+            return {"type": "table", "column_names": ["n"], "data": [[len(calls)]]}
+
+    cache = _RequestSQLCache(CountingClient())  # type: ignore[arg-type]
+    first = cache.sql("SELECT 1")
+    second = cache.sql("  SELECT 1 ")
+    other = cache.sql("SELECT 2")
+    assert first is second
+    assert other["data"] == [[2]]
+    assert calls == ["SELECT 1", "SELECT 2"]
+
+
+def test_request_sql_cache_batch_skips_cached_and_duplicate_queries():
+    batches: List[List[str]] = []
+
+    class BatchClient:
+        def sql(self, query: str):
+            return {"query": query}
+
+        def sql_batch(self, queries: List[str]):
+            batches.append(list(queries))
+            return [{"query": q} for q in queries]
+
+    cache = _RequestSQLCache(BatchClient())  # type: ignore[arg-type]
+    cache.sql("SELECT 1")
+    results = cache.sql_batch(["SELECT 1", "SELECT 2", "SELECT 2 "])
+    assert [r["query"] for r in results] == ["SELECT 1", "SELECT 2", "SELECT 2"]
+    assert batches == [["SELECT 2"]]
+
+
+
+def test_request_sql_cache_waits_for_in_flight_query():
+    import threading
+
+    calls: List[str] = []
+    started = threading.Event()
+    release = threading.Event()
+
+    class SlowClient:
+        def sql(self, query: str):
+            calls.append(query)
+            started.set()
+            release.wait(5)
+            return {"query": query}
+
+    cache = _RequestSQLCache(SlowClient())  # type: ignore[arg-type]
+    results: List[Dict[str, Any]] = []
+
+    def _run(query: str) -> None:
+        results.append(cache.sql(query))
+
+    prefetch = threading.Thread(target=_run, args=("SELECT * FROM files.t LIMIT 100",))
+    prefetch.start()
+    assert started.wait(5)
+    waiter = threading.Thread(target=_run, args=("SELECT * FROM files.t LIMIT 100 ",))
+    waiter.start()
+    waiter.join(0.1)  # the second caller is now blocked on the first one's result
+    release.set()
+    prefetch.join(5)
+    waiter.join(5)
+
+    assert calls == ["SELECT * FROM files.t LIMIT 100"]
+    assert len(results) == 2 and results[0] is results[1]
+
+
+def test_request_sql_cache_retries_after_failed_in_flight_query():
+    attempts: List[str] = []
+
+    class FlakyClient:
+        def sql(self, query: str):
+            attempts.append(query)
+            if len(attempts) == 1:
+                raise RuntimeError("MindsDB indisponible")
+            return {"query": query}
+
+    cache = _RequestSQLCache(FlakyClient())  # type: ignore[arg-type]
+    with pytest.raises(RuntimeError):
+        cache.sql("SELECT 1")
+    assert cache.sql("SELECT 1") == {"query": "SELECT 1"}
+    assert len(attempts) == 2
+
+def test_evidence_buffer_dedups_sql_and_caps_rows():
+    buf = _EvidenceBuffer(max_rows=2)
+    buf.add(purpose="a", sql="SELECT 1", columns=["x"], rows=[[1], [2], [3]])
+    buf.add(purpose="b", sql=" SELECT 1 ", columns=["x"], rows=[[9]])
+    buf.add(purpose="c", sql="SELECT 2", columns=["x"], rows=[])
+    items = buf.to_list()
+    assert len(buf) == 2
+    assert [i["purpose"] for i in items] == ["a", "c"]
+    assert items[0]["rows"] == [[1], [2]]
+    assert items[0]["row_count"] == 3
+
+
+def test_extract_sql_command_matches_prefix_only():
+    assert extract_sql_command("  /SQL SELECT 1 ") == "SELECT 1"
+    assert extract_sql_command("/sql   SELECT 1") == "SELECT 1"
+    assert extract_sql_command("/sql") is None
+    assert extract_sql_command("/sql   ") is None
+    assert extract_sql_command("/sqlSELECT 1") is None
+    assert extract_sql_command("Combien de /sql ?") is None
+
+
+def test_derive_evidence_sql_parses_each_statement_once(monkeypatch: pytest.MonkeyPatch):
+    from insight_backend.services import chat_service as chat_module
+
+    chat_module._derive_evidence_sql_cached.cache_clear()
+    parsed: List[str] = []
+    real_parse_one = chat_module.parse_one
+
+    def _counting_parse_one(sql: str, **kwargs: Any):
+        parsed.append(sql)
+        return real_parse_one(sql, **kwargs)
+
+    monkeypatch.setattr(chat_module, "parse_one", _counting_parse_one)
+    sql = "SELECT count(*) FROM files.tickets WHERE status='open'"
+    first = ChatService(DummyEngine())._derive_evidence_sql(sql)
+    # A later request (new service instance) reuses the derived query
+    second = ChatService(DummyEngine())._derive_evidence_sql(f"  {sql} ")
+    assert first == second
+    assert parsed == [sql]
+    assert ChatService(DummyEngine())._derive_evidence_sql(sql, limit=5).endswith("LIMIT 5")
+    assert parsed == [sql, sql]
+
+
+def test_preview_text_collapses_whitespace_and_caps_length():
+    assert _preview_text("  a \n\t b\u00a0 c  ") == "a b c"
+    assert _preview_text("x" * 10, limit=5) == "xx..."
+
+
+def test_serialize_dico_compact_reports_counts():
+    dico = {
+        "a": {"columns": [{"name": "x"}, {"name": "y"}]},
+        "b": {"columns": [{"name": "z"}]},
+    }
+    blob, truncated, kept_tables, kept_cols = _serialize_dico_compact(dico, limit=10_000, max_cols=2)
+    assert (truncated, kept_tables, kept_cols) == (False, 2, 2)
+    assert blob.startswith('{"a":')
+
+    _, truncated, kept_tables, kept_cols = _serialize_dico_compact(dico, limit=40, max_cols=2)
+    assert truncated is True and kept_cols == 1
+
+
+def test_prepare_nl2sql_question_keeps_last_eight_turns_in_order():
+    svc = ChatService(DummyEngine())
+    messages = [ChatMessage(role="system", content="sys")]
+    for i in range(12):
+        messages.append(ChatMessage(role="user" if i % 2 == 0 else "assistant", content=f"m{i}"))
+    messages.insert(10, ChatMessage(role="user", content="   "))
+    messages.append(ChatMessage(role="user", content=" Et en mai ? "))
+
+    raw, enriched = svc._prepare_nl2sql_question(messages)
+
+    assert raw == "Et en mai ?"
+    history = enriched.splitlines()[1:-1]
+    assert history == [f"{'User' if i % 2 == 0 else 'Assistant'}: m{i}" for i in range(4, 12)]
+    assert enriched.endswith("Current user question: Et en mai ?")
+    assert svc._prepare_nl2sql_question([ChatMessage(role="user", content="Seule")]) == ("Seule", "Seule")
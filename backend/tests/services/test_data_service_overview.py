@@ -212,3 +212,296 @@ def test_explore_table_supports_pagination_and_date_sort(tmp_path):
     assert [row["date"] for row in filtered.preview_rows] == ["2024-05-02", "2024-05-03"]
     assert filtered.date_from == "2024-05-02"
     assert filtered.date_to == "2024-05-03"
+
+
+def test_normalize_date_is_memoized_per_raw_string():
+    from insight_backend.services.data_service import _normalize_date
+
+    _normalize_date.cache_clear()
+    assert [_normalize_date("02/05/2024") for _ in range(3)] == ["2024-05-02"] * 3
+    assert _normalize_date("pas une date") is None
+    info = _normalize_date.cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+
+
+def test_normalize_date_parses_slash_formats_without_strptime():
+    from insight_backend.services.data_service import _normalize_date
+
+    assert _normalize_date("2/5/2024") == "2024-05-02"
+    assert _normalize_date("02/05/24") == "2024-05-02"
+    assert _normalize_date("01/01/69") == "1969-01-01"
+    assert _normalize_date("2024/05/02") == "2024-05-02"
+    assert _normalize_date("31/02/2024") is None
+    assert _normalize_date("01/01/202") is None
+
+
+def test_build_breakdown_keeps_top_values_with_label_tie_break():
+    from insight_backend.services.data_service import MAX_VALUES_PER_FIELD, FieldAccumulator
+
+    acc = FieldAccumulator(name="tag", parse_dates=False)
+    for i in reversed(range(MAX_VALUES_PER_FIELD + 5)):
+        acc.add(f"v{i:02d}")
+    acc.add("v33")
+
+    text = acc.build_breakdown(total_rows=acc.non_null)
+    assert text.truncated is True
+    assert [c.label for c in text.counts] == ["v33"] + [f"v{i:02d}" for i in range(MAX_VALUES_PER_FIELD - 1)]
+
+    dates = FieldAccumulator(name="date")
+    for day in range(1, MAX_VALUES_PER_FIELD + 2):
+        dates.add(f"2024-01-{day:02d}")
+    breakdown = dates.build_breakdown(total_rows=dates.non_null)
+    assert breakdown.kind == "date" and breakdown.truncated is True
+    assert [c.label for c in breakdown.counts] == [f"2024-01-{d:02d}" for d in range(2, MAX_VALUES_PER_FIELD + 2)]
+
+
+def test_overview_batches_merge_counts_across_raw_variants(tmp_path, monkeypatch):
+    import insight_backend.services.data_service as data_service
+
+    monkeypatch.setattr(data_service, "OVERVIEW_BATCH_ROWS", 2)
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+
+    sample = tables_dir / "dataset.csv"
+    sample.write_text(
+        "\n".join(
+            [
+                "Category,Sub Category,date",
+                "A,X,2024-01-01",
+                " A ,X ,2024-01-02",
+                "A,X,2023-12-31",
+                "B,,2024-01-03",
+                "B",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    service = DataService(repo=DataRepository(tables_dir=tables_dir))
+    source = service.get_overview(date_from="2024-01-01").sources[0]
+
+    assert source.total_rows == 3
+    assert source.date_min == "2023-12-31"
+    pairs = {(item.category, item.sub_category): item.count for item in source.category_breakdown}
+    assert pairs == {("A", "X"): 2}
+    fields = {field.field: field for field in source.fields}
+    assert [(c.label, c.count) for c in fields["Category"].counts] == [("A", 2), ("B", 1)]
+    assert fields["Sub Category"].missing_values == 1
+
+
+def test_overview_parallel_workers_keep_table_order(tmp_path, monkeypatch):
+    from insight_backend.services import data_service
+
+    monkeypatch.setattr(data_service.settings, "overview_workers", 2)
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+    for name, rows in (("alpha", 3), ("beta", 1), ("gamma", 2)):
+        lines = ["Category,Sub Category"] + ["A,X"] * rows
+        (tables_dir / f"{name}.csv").write_text("\n".join(lines), encoding="utf-8")
+
+    service = DataService(repo=DataRepository(tables_dir=tables_dir))
+    sequential = service.get_overview(lightweight=True)
+    overview = service.get_overview()
+
+    assert [s.source for s in overview.sources] == [s.source for s in sequential.sources]
+    assert {s.source: s.total_rows for s in overview.sources} == {"alpha": 3, "beta": 1, "gamma": 2}
+
+    # The worker pool outlives the call and is shared by other service instances
+    pool = data_service._overview_pool
+    try:
+        assert pool is not None
+        other = DataService(repo=DataRepository(tables_dir=tables_dir))
+        assert len(other.get_overview().sources) == 3
+        assert data_service._overview_pool is pool
+    finally:
+        data_service.close_overview_pool()
+    assert data_service._overview_pool is None
+
+
+def test_overview_cache_reuses_result_until_file_changes(tmp_path, monkeypatch):
+    import os
+
+    from insight_backend.services import data_service
+
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+    sample = tables_dir / "dataset.csv"
+    sample.write_text("Category,Sub Category\nA,X\nA,Y\n", encoding="utf-8")
+
+    service = DataService(repo=DataRepository(tables_dir=tables_dir))
+    first = service.get_overview().sources[0]
+    first.total_rows = -1  # mutating a response must not leak into the cache
+
+    calls = []
+    original = DataService._compute_table_overview
+
+    def _spy(self, **kwargs):
+        calls.append(kwargs["table_name"])
+        return original(self, **kwargs)
+
+    monkeypatch.setattr(DataService, "_compute_table_overview", _spy)
+    assert service.get_overview().sources[0].total_rows == 2
+    assert calls == []
+
+    sample.write_text("Category,Sub Category\nA,X\nA,Y\nB,Z\n", encoding="utf-8")
+    stat = sample.stat()
+    os.utime(sample, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert service.get_overview().sources[0].total_rows == 3
+    assert calls == ["dataset"]
+
+    monkeypatch.setattr(data_service.settings, "overview_cache_max_entries", 0)
+    service.get_overview()
+    assert calls == ["dataset", "dataset"]
+
+
+def test_explore_table_reads_indexed_rows_and_rebuilds_on_change(tmp_path):
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+
+    sample = tables_dir / "dataset.csv"
+    sample.write_bytes(
+        "Category,Sub Category,note,date\r\n"
+        'A,X,"ligne\r\nsur deux",2024-02-01\r\n'
+        "B,X,autre,2024-01-01\r\n"
+        "\r\n"
+        "A,X,été,01/01/2024\r\n"
+        "A,X\r\n".encode("utf-8")
+    )
+
+    service = DataService(repo=DataRepository(tables_dir=tables_dir))
+    result = service.explore_table(
+        table_name="dataset", category="A", sub_category="X", sort_date="asc", limit=10
+    )
+
+    assert result.matching_rows == 3
+    assert [row["note"] for row in result.preview_rows] == [None, "été", "ligne\r\nsur deux"]
+    assert (result.date_min, result.date_max) == ("2024-01-01", "2024-02-01")
+
+    sample.write_text("Category,Sub Category,note,date\nA,X,seule,2024-03-01\n", encoding="utf-8")
+    result = service.explore_table(table_name="dataset", category="A", sub_category="X")
+    assert [row["note"] for row in result.preview_rows] == ["seule"]
+
+
+def test_iter_csv_rows_matches_csv_reader(tmp_path):
+    import csv
+
+    from insight_backend.services.data_service import _iter_csv_rows
+
+    samples = {
+        "fast.csv": "a,b,c\r\n1, 2 ,\r\n\r\nété,x\n3,4,5,6",
+        "quoted.csv": 'a,b\n"x,y",z\n"multi\nline",w\n',
+        "bare_cr.csv": "a,b\r1,2\r",
+        "empty.csv": "",
+    }
+    for name, content in samples.items():
+        path = tmp_path / name
+        path.write_bytes(content.encode("utf-8"))
+        with path.open("r", newline="", encoding="utf-8") as handle:
+            expected = list(csv.reader(handle))
+        with path.open("rb") as handle:
+            assert list(_iter_csv_rows(handle, ",")) == expected, name
+
+
+def test_hinted_date_column_stops_parsing_when_values_are_not_dates():
+    from collections import Counter
+
+    from insight_backend.services.data_service import DATE_PROBE_MIN_VALUES, FieldAccumulator
+
+    acc = FieldAccumulator(name="update_note", probe_dates=True)
+    acc.add_counts(Counter({"2024-01-01": 1}))
+    acc.add_counts(Counter(f"note {i}" for i in range(DATE_PROBE_MIN_VALUES)))
+
+    assert acc.parse_dates is False
+    breakdown = acc.build_breakdown(total_rows=acc.non_null)
+    assert breakdown.kind == "text"
+    assert breakdown.non_null == DATE_PROBE_MIN_VALUES + 1
+
+
+def test_overview_resumes_scan_after_append(tmp_path, monkeypatch):
+    import os
+
+    from insight_backend.services import data_service
+
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+    sample = tables_dir / "dataset.csv"
+    sample.write_text("Category,Sub Category,date\nA,X,2024-01-01\nA,Y,2024-01-02\n", encoding="utf-8")
+
+    service = DataService(repo=DataRepository(tables_dir=tables_dir))
+    assert service.get_overview().sources[0].total_rows == 2
+
+    consumed: list[int] = []
+    original = data_service.OverviewScan.consume
+
+    def _spy(self, rows):
+        before = self.total_rows
+        original(self, rows)
+        consumed.append(self.total_rows - before)
+
+    monkeypatch.setattr(data_service.OverviewScan, "consume", _spy)
+    with sample.open("a", encoding="utf-8") as handle:
+        handle.write('"B",X,2024-02-01\n')
+    stat = sample.stat()
+    os.utime(sample, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    source = service.get_overview().sources[0]
+    assert consumed == [1]
+    assert source.total_rows == 3
+    assert source.date_max == "2024-02-01"
+    pairs = {(item.category, item.sub_category): item.count for item in source.category_breakdown}
+    assert pairs == {("A", "X"): 1, ("A", "Y"): 1, ("B", "X"): 1}
+
+    sample.write_text("Category,Sub Category,date\nC,Z,2023-01-01\n", encoding="utf-8")
+    source = service.get_overview().sources[0]
+    assert consumed[-1] == 1
+    assert source.total_rows == 1
+
+
+def test_overview_rescans_when_middle_row_changes_before_append(tmp_path, monkeypatch):
+    import os
+
+    from insight_backend.services import data_service
+
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+    sample = tables_dir / "dataset.csv"
+    rows = [f"A,X,2024-01-{(idx % 28) + 1:02d}\n" for idx in range(2000)]
+    sample.write_text("Category,Sub Category,date\n" + "".join(rows), encoding="utf-8")
+
+    service = DataService(repo=DataRepository(tables_dir=tables_dir))
+    assert service.get_overview().sources[0].total_rows == 2000
+
+    consumed: list[int] = []
+    original = data_service.OverviewScan.consume
+
+    def _spy(self, rows):
+        before = self.total_rows
+        original(self, rows)
+        consumed.append(self.total_rows - before)
+
+    monkeypatch.setattr(data_service.OverviewScan, "consume", _spy)
+    # Same length, far from the first and last 4 KiB, then an append
+    rows[1000] = "B,X" + rows[1000][3:]
+    sample.write_text("Category,Sub Category,date\n" + "".join(rows) + "A,Y,2024-02-01\n", encoding="utf-8")
+    stat = sample.stat()
+    os.utime(sample, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    source = service.get_overview().sources[0]
+    assert consumed == [2001]
+    pairs = {(item.category, item.sub_category): item.count for item in source.category_breakdown}
+    assert pairs == {("A", "X"): 1999, ("B", "X"): 1, ("A", "Y"): 1}
+
+
+def test_overview_keeps_raw_scans_only_for_unfiltered_overviews(tmp_path):
+    tables_dir = tmp_path / "tables"
+    tables_dir.mkdir()
+    sample = tables_dir / "dataset.csv"
+    sample.write_text("Category,Sub Category,date\nA,X,2024-01-01\nA,Y,2024-02-02\n", encoding="utf-8")
+
+    service = DataService(repo=DataRepository(tables_dir=tables_dir))
+    source = service.get_overview(date_from="2024-02-01").sources[0]
+    assert source.total_rows == 1
+    assert not service._overview_scans
+
+    service.get_overview()
+    assert len(service._overview_scans) == 1
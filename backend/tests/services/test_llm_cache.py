@@ -0,0 +1,36 @@
+import pytest
+
+from insight_backend.services import llm_cache
+from insight_backend.services.llm_cache import LLMResponseCache
+
+
+def test_cache_hits_only_on_identical_prompt():
+    cache = LLMResponseCache(ttl_s=60, max_entries=8)
+    messages = [{"role": "user", "content": "Combien ?"}]
+    key = cache.key(role="redaction", model="m", messages=messages)
+    cache.set(key, "42")
+
+    assert cache.get(cache.key(role="redaction", model="m", messages=list(messages))) == "42"
+    assert cache.get(cache.key(role="retrieval", model="m", messages=messages)) is None
+    assert cache.get(cache.key(role="redaction", model="other", messages=messages)) is None
+
+
+def test_cache_expires_and_evicts(monkeypatch: pytest.MonkeyPatch):
+    now = [100.0]
+    monkeypatch.setattr(llm_cache.time, "monotonic", lambda: now[0])
+    cache = LLMResponseCache(ttl_s=10, max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+
+    now[0] += 11
+    assert cache.get("a") is None
+
+
+def test_disabled_cache_stores_nothing():
+    cache = LLMResponseCache(ttl_s=0, max_entries=8)
+    cache.set("a", "1")
+    assert cache.get("a") is None
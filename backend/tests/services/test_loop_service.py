@@ -5,7 +5,7 @@ from datetime import date, timedelta
 import pytest
 
 from insight_backend.core.config import settings
-from insight_backend.services.loop_service import LoopService
+from insight_backend.services.loop_service import LoopEntries, LoopService
 
 
 class _StubRepo:
@@ -27,15 +27,242 @@ def test_group_by_day_uses_latest_available_date() -> None:
     recent = today - timedelta(days=1)
     older = today - timedelta(days=5)
 
-    entries = [
-        {"date": older, "text": "ancien"},
-        {"date": recent, "text": "recent"},
-    ]
+    entries = LoopEntries(
+        texts=["recent", "ancien"],
+        dates=[recent, older],
+        ticket_ids=[None, None],
+    )
 
-    groups = service._group_by_day(entries)
+    groups = service._group_by_day(service._bucketize(entries))
 
     assert len(groups) == 1
     assert groups[0]["start"] == recent
     assert groups[0]["end"] == recent
-    assert groups[0]["items"]
-    assert all(item["date"] == recent for item in groups[0]["items"])
+    assert groups[0]["items"] == [0]
+
+
+def test_parse_date_is_memoized_per_text() -> None:
+    from insight_backend.services.loop_service import _parse_date_text
+
+    service = LoopService(repo=_StubRepo(), data_repo=_StubDataRepo())
+    _parse_date_text.cache_clear()
+
+    assert service._parse_date(" 02/05/2024 ") == date(2024, 5, 2)
+    assert service._parse_date("02/05/2024") == date(2024, 5, 2)
+    assert service._parse_date("2024-05-02T10:00:00") == date(2024, 5, 2)
+    assert service._parse_date("pas une date") is None
+    info = _parse_date_text.cache_info()
+    assert (info.hits, info.misses) == (1, 3)
+
+
+def test_parse_date_text_matches_strptime_formats() -> None:
+    from insight_backend.services.loop_service import _parse_date_text
+
+    assert _parse_date_text("2024-5-2") == date(2024, 5, 2)
+    assert _parse_date_text("2024-05-02") == date(2024, 5, 2)
+    assert _parse_date_text("2024-02-30") is None
+    assert _parse_date_text("2024-05-02 10:11:12") == date(2024, 5, 2)
+    assert _parse_date_text("2024-05-02T1:2:3") == date(2024, 5, 2)
+    assert _parse_date_text("2024/05/02") == date(2024, 5, 2)
+    assert _parse_date_text("2/5/2024") == date(2024, 5, 2)
+    assert _parse_date_text("2024-05-02T10:11:12+02:00") == date(2024, 5, 2)
+    assert _parse_date_text("31/02/2024") is None
+    assert _parse_date_text("2024-05-02 24:00:00") is None
+    assert _parse_date_text("2024/5/2 10:00:00") is None
+    assert _parse_date_text("１２/０５/２０２４") is None
+
+
+def test_prepare_entries_logs_invalid_dates_once(caplog: pytest.LogCaptureFixture) -> None:
+    service = LoopService(repo=_StubRepo(), data_repo=_StubDataRepo())
+    rows = [
+        {"text": "a", "date": "2024-05-01", "id": "1"},
+        {"text": "b", "date": "2024-05-03", "ticket_id": "2"},
+        {"text": "c", "date": "n/a"},
+        {"text": "d", "date": "n/a"},
+        {"text": " ", "date": "2024-05-04"},
+    ]
+
+    with caplog.at_level("WARNING", logger="insight.services.loop"):
+        entries = service._prepare_entries(rows=rows, text_column="text", date_column="date")
+
+    assert entries.texts == ["b", "a"]
+    assert entries.dates == [date(2024, 5, 3), date(2024, 5, 1)]
+    assert entries.ticket_ids == ["2", "1"]
+    warnings = [r for r in caplog.records if "date invalide" in r.getMessage()]
+    assert len(warnings) == 1
+    assert "2 lignes" in warnings[0].getMessage()
+
+
+def test_chunk_and_format_read_entries_by_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = LoopService(repo=_StubRepo(), data_repo=_StubDataRepo())
+    monkeypatch.setattr(settings, "loop_max_tickets_per_call", 2)
+    day = date(2024, 5, 2)
+    entries = LoopEntries(texts=["a", "b", "c"], dates=[day, day, day], ticket_ids=["1", None, "3"])
+
+    chunks = service._chunk_items(entries, [0, 1, 2])
+    block, count, truncated = service._format_context(entries, chunks[0])
+
+    assert chunks == [[0, 1], [2]]
+    assert block == "1. 2024-05-02 #1 — a\n2. 2024-05-02 — b"
+    assert count == 2
+    assert truncated is False
+
+
+def test_bucketize_fills_day_week_and_month_in_one_pass() -> None:
+    service = LoopService(repo=_StubRepo(), data_repo=_StubDataRepo())
+    dates = [date(2024, 6, 3), date(2024, 6, 3), date(2024, 6, 2), date(2024, 5, 31)]
+    entries = LoopEntries(texts=["a", "b", "c", "d"], dates=dates, ticket_ids=[None] * 4)
+
+    buckets = service._bucketize(entries)
+
+    assert buckets.days == {date(2024, 6, 3): [0, 1], date(2024, 6, 2): [2], date(2024, 5, 31): [3]}
+    assert buckets.weeks == {(2024, 23): [0, 1], (2024, 22): [2, 3]}
+    assert buckets.months == {(2024, 6): [0, 1, 2], (2024, 5): [3]}
+
+
+class _RecordingAgent:
+    def __init__(self) -> None:
+        self.labels: list[str] = []
+
+    def summarize(
+        self, *, period_label: str, period_start, period_end, tickets_block: str, ticket_count: int, total_tickets: int
+    ) -> str:
+        assert tickets_block.count("\n") == ticket_count - 1
+        self.labels.append(period_label)
+        return f"résumé {period_label}"
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_summarize_groups_fuses_each_group_after_its_chunks(monkeypatch: pytest.MonkeyPatch, workers: int) -> None:
+    agent = _RecordingAgent()
+    service = LoopService(repo=_StubRepo(), data_repo=_StubDataRepo(), agent=agent)
+    monkeypatch.setattr(settings, "loop_max_tickets_per_call", 2)
+    monkeypatch.setattr(settings, "loop_workers", workers)
+    day = date(2024, 5, 2)
+    entries = LoopEntries(texts=["a", "b", "c"], dates=[day, day, day], ticket_ids=[None] * 3)
+    groups = [
+        ("daily", {"label": "J", "start": day, "end": day, "items": [0, 1, 2]}),
+        ("weekly", {"label": "S", "start": day, "end": day, "items": [0]}),
+        ("monthly", {"label": "M", "start": day, "end": day, "items": []}),
+    ]
+
+    payloads = service._summarize_groups(entries, groups)
+
+    assert [p["content"] for p in payloads] == [
+        "résumé J (fusion)",
+        "résumé S (part 1/1)",
+        "Aucun ticket enregistré sur cette période. Aucun suivi requis.",
+    ]
+    assert [p["ticket_count"] for p in payloads] == [3, 1, 0]
+    assert sorted(agent.labels) == ["J (fusion)", "J (part 1/2)", "J (part 2/2)", "S (part 1/1)"]
+    fusion_at = agent.labels.index("J (fusion)")
+    assert fusion_at > max(agent.labels.index("J (part 1/2)"), agent.labels.index("J (part 2/2)"))
+
+
+
+def test_summarize_groups_stops_queued_calls_after_a_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    import time
+
+    class _FailingAgent(_RecordingAgent):
+        def summarize(self, **kwargs) -> str:
+            label = kwargs["period_label"]
+            self.labels.append(label)
+            if label == "P0 (part 1/1)":
+                raise RuntimeError("LLM indisponible")
+            time.sleep(0.2)
+            return f"résumé {label}"
+
+    agent = _FailingAgent()
+    service = LoopService(repo=_StubRepo(), data_repo=_StubDataRepo(), agent=agent)
+    monkeypatch.setattr(settings, "loop_workers", 2)
+    day = date(2024, 5, 2)
+    entries = LoopEntries(texts=["a"], dates=[day], ticket_ids=[None])
+    groups = [("daily", {"label": f"P{i}", "start": day, "end": day, "items": [0]}) for i in range(6)]
+
+    with pytest.raises(RuntimeError, match="LLM indisponible"):
+        service._summarize_groups(entries, groups)
+    # The failing call, the one running beside it, and at most one picked up before cancellation
+    assert len(agent.labels) <= 3
+
+def test_looper_client_is_shared_per_backend() -> None:
+    from insight_backend.services import looper_agent
+
+    looper_agent.close_looper_clients()
+    first = looper_agent._get_client("http://llm.local/v1", None)
+
+    assert looper_agent._get_client("http://llm.local/v1", None) is first
+    assert looper_agent._get_client("http://llm.local/v1", "key") is not first
+
+    looper_agent.close_looper_clients()
+    assert first.client.is_closed
+    assert looper_agent._get_client("http://llm.local/v1", None) is not first
+    looper_agent.close_looper_clients()
+
+
+def test_chunk_items_matches_greedy_packing(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = LoopService(repo=_StubRepo(), data_repo=_StubDataRepo())
+    monkeypatch.setattr(settings, "loop_max_tickets_per_call", 3)
+    monkeypatch.setattr(settings, "loop_max_input_chars", 1000)
+    monkeypatch.setattr(settings, "loop_ticket_text_max_chars", 600)
+    lengths = [400, 400, 300, 900, 100, 100, 100, 100, 5]
+    day = date(2024, 5, 2)
+    entries = LoopEntries(texts=["x" * n for n in lengths], dates=[day] * 9, ticket_ids=[None] * 9)
+
+    chunks = service._chunk_items(entries, list(range(9)))
+
+    # 400+400 ≤ 1000 < +300; 300+600 (plafonné)+100 = 1000; puis 3 tickets max par appel
+    assert chunks == [[0, 1], [2, 3, 4], [5, 6, 7], [8]]
+
+
+def test_regenerate_returns_first_summary_of_each_kind(monkeypatch: pytest.MonkeyPatch) -> None:
+    from types import SimpleNamespace
+
+    day = date(2024, 5, 2)
+
+    class _Repo:
+        def replace_summaries(self, *, config, items):
+            return [SimpleNamespace(**item) for item in items]
+
+        def touch_generated(self, *, config_id, ts):
+            pass
+
+    class _DataRepo:
+        def iter_rows(self, table_name, *, columns=None):
+            yield {"text": "a", "date": day.isoformat()}
+            yield {"text": "b", "date": day.isoformat()}
+
+    monkeypatch.setattr(settings, "loop_max_tickets_per_call", 1)
+    service = LoopService(repo=_Repo(), data_repo=_DataRepo(), agent=_RecordingAgent())
+    config = SimpleNamespace(id=1, table_name="tickets", text_column="text", date_column="date")
+
+    _, daily, weekly, monthly = service._regenerate_for_config(config)
+
+    assert [item.kind for item in daily + weekly + monthly] == ["daily", "weekly", "monthly"]
+    assert daily[0].content == "résumé 2024-05-02 (fusion)"
+
+
+def test_group_by_day_puts_today_first_within_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = LoopService(repo=_StubRepo(), data_repo=_StubDataRepo())
+    monkeypatch.setattr(settings, "loop_max_days", 2)
+    today = date.today()
+    future = [today + timedelta(days=3), today + timedelta(days=2)]
+    dates = future + [today, today - timedelta(days=1)]
+    entries = LoopEntries(texts=["a", "b", "c", "d"], dates=dates, ticket_ids=[None] * 4)
+
+    groups = service._group_by_day(service._bucketize(entries))
+
+    assert [g["start"] for g in groups] == [today, future[0]]
+    assert groups[0]["items"] == [2]
+
+
+def test_chunk_items_single_chunk_fast_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = LoopService(repo=_StubRepo(), data_repo=_StubDataRepo())
+    monkeypatch.setattr(settings, "loop_max_tickets_per_call", 10)
+    monkeypatch.setattr(settings, "loop_max_input_chars", 1000)
+    monkeypatch.setattr(settings, "loop_ticket_text_max_chars", 600)
+    day = date(2024, 5, 2)
+    entries = LoopEntries(texts=["x" * 300, "y" * 300, "z" * 300], dates=[day] * 3, ticket_ids=[None] * 3)
+    items = [0, 1, 2]
+
+    assert service._chunk_items(entries, items)[0] is items
+    assert service._chunk_items(entries, [0, 1]) == [[0, 1]]
@@ -1,6 +1,8 @@
 import asyncio
 import ssl
 
+import pytest
+
 from insight_backend.services import mcp_chart_service as service
 
 
@@ -25,3 +27,144 @@ def test_openai_http_client_respects_llm_verify_ssl():
         asyncio.run(client_true.aclose())
         asyncio.run(client_false.aclose())
         service._openai_http_client.cache_clear()
+
+
+def test_stdout_noise_prefilter_skips_only_non_jsonrpc_lines():
+    assert service._is_stdout_noise("")
+    assert service._is_stdout_noise("   ")
+    assert service._is_stdout_noise("Server listening on stdio")
+    assert not service._is_stdout_noise('  {"jsonrpc": "2.0", "id": 1, "result": {}}')
+    assert not service._is_stdout_noise("[]")
+    # Non-JSON mais mentionne jsonrpc: l'erreur de parsing reste remontée à la session
+    assert not service._is_stdout_noise("error: bad jsonrpc frame")
+
+
+def test_stdout_noise_prefilter_accepts_raw_bytes():
+    assert service._is_stdout_noise(b"  INFO starting server")
+    assert not service._is_stdout_noise(b'{"jsonrpc": "2.0", "method": "ping"}')
+    assert not service._is_stdout_noise(b"jsonrpc framing error")
+
+
+class _FakeServer:
+    def __init__(self):
+        self.exited = False
+
+    def process_exited(self):
+        return self.exited
+
+
+def test_chart_agent_is_reused_across_service_instances(monkeypatch):
+    opened = []
+
+    class _FakeAgent:
+        async def __aenter__(self):
+            opened.append(self)
+            return self
+
+        async def __aexit__(self, *exc):
+            return None
+
+    def _fake_build_agent(self, provider, model_name, server):
+        return _FakeAgent()
+
+    monkeypatch.setattr(service.ChartGenerationService, "_build_agent", _fake_build_agent)
+    monkeypatch.setattr(service.ChartGenerationService, "_build_server", lambda self: _FakeServer())
+    monkeypatch.setattr(service.ChartGenerationService, "_build_provider", lambda self, url, key: None)
+
+    def _make_service():
+        svc = object.__new__(service.ChartGenerationService)
+        svc._chart_spec = service.MCPServerSpec(name="chart", command="npx", args=["chart"], env={})
+        return svc
+
+    async def scenario():
+        key = ("chart", "npx", ("chart",), (), "m", "http://llm")
+        first = await _make_service()._get_agent(key, "http://llm", "m", None)
+        second = await _make_service()._get_agent(key, "http://llm", "m", None)
+        assert first is second
+        assert first.alive()
+        await service.close_chart_agents()
+        assert not first.alive()
+
+    asyncio.run(scenario())
+    assert len(opened) == 1
+
+
+def test_chart_agent_replaced_when_server_process_exited(monkeypatch):
+    class _FakeAgent:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return None
+
+    monkeypatch.setattr(
+        service.ChartGenerationService, "_build_agent", lambda self, provider, name, server: _FakeAgent()
+    )
+    monkeypatch.setattr(service.ChartGenerationService, "_build_server", lambda self: _FakeServer())
+    monkeypatch.setattr(service.ChartGenerationService, "_build_provider", lambda self, url, key: None)
+
+    svc = object.__new__(service.ChartGenerationService)
+    svc._chart_spec = service.MCPServerSpec(name="chart", command="npx", args=["chart"], env={})
+
+    async def scenario():
+        key = ("chart", "npx", ("chart",), (), "m", "http://llm")
+        first = await svc._get_agent(key, "http://llm", "m", None)
+        # Sous-processus stdio mort alors que la tâche qui tient le contexte tourne encore
+        first.server.exited = True
+        assert not first.alive()
+        second = await svc._get_agent(key, "http://llm", "m", None)
+        assert second is not first and second.alive()
+        assert first.task.done()
+        await service.close_chart_agents()
+
+    asyncio.run(scenario())
+
+
+def test_run_failure_keeps_shared_chart_server(monkeypatch):
+    from insight_backend.schemas.mcp_chart import ChartDataset
+
+    class _FailingAgent:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return None
+
+        async def run(self, prompt, deps):
+            raise RuntimeError("LLM timeout")
+
+    monkeypatch.setattr(
+        service.ChartGenerationService, "_build_agent", lambda self, provider, name, server: _FailingAgent()
+    )
+    monkeypatch.setattr(service.ChartGenerationService, "_build_server", lambda self: _FakeServer())
+    monkeypatch.setattr(service.ChartGenerationService, "_build_provider", lambda self, url, key: None)
+    monkeypatch.setattr(service.ChartGenerationService, "_llm_target", lambda self: ("http://llm", "m", None))
+    monkeypatch.setattr(service, "check_and_increment", lambda name: None)
+
+    svc = object.__new__(service.ChartGenerationService)
+    svc._chart_spec = service.MCPServerSpec(name="chart", command="npx", args=["chart"], env={})
+    dataset = ChartDataset(sql="SELECT 1", columns=["a"], rows=[{"a": 1}])
+
+    async def scenario():
+        with pytest.raises(service.ChartGenerationError, match="LLM timeout"):
+            await svc.generate_chart("graphique", dataset)
+        cached = list(service._agent_cache.values())
+        assert len(cached) == 1 and cached[0].alive()
+        await service.close_chart_agents()
+
+    asyncio.run(scenario())
+
+
+def test_normalize_rows_pads_truncates_and_maps_dicts():
+    rows = [
+        {"a": 1, "c": 3},
+        [1, 2, 3, 4],
+        (5,),
+        "scalar",
+    ]
+    assert service.ChartGenerationService._normalize_rows(["a", "b"], rows) == [
+        {"a": 1, "b": None},
+        {"a": 1, "b": 2},
+        {"a": 5, "b": None},
+        {"a": "scalar"},
+    ]
@@ -0,0 +1,77 @@
+import os
+import sys
+import types
+
+import pytest
+
+from insight_backend.services import mindsdb_embeddings
+
+
+class _FakeArray(list):
+    def tolist(self):
+        return [list(row) for row in self]
+
+
+class _FakeSentenceTransformer:
+    loads = 0
+
+    def __init__(self, model_name: str):
+        type(self).loads += 1
+        self.calls: list[dict] = []
+
+    def encode(self, inputs, **kwargs):
+        self.calls.append(kwargs)
+        return _FakeArray([[float(len(text)), 0.5] for text in inputs])
+
+
+@pytest.fixture()
+def fake_sentence_transformers(monkeypatch: pytest.MonkeyPatch):
+    module = types.SimpleNamespace(SentenceTransformer=_FakeSentenceTransformer)
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+    monkeypatch.setattr(mindsdb_embeddings, "_models", {})
+    _FakeSentenceTransformer.loads = 0
+    return _FakeSentenceTransformer
+
+
+def test_local_model_is_loaded_once_and_encodes_each_batch_in_one_pass(fake_sentence_transformers):
+    first = mindsdb_embeddings._SentenceTransformerClient(model_name="m")
+    second = mindsdb_embeddings._SentenceTransformerClient(model_name="m")
+
+    vectors = second.embeddings(model="m", inputs=["ab", "abcd", "a"])
+
+    assert fake_sentence_transformers.loads == 1
+    assert first._model is second._model
+    assert vectors == [[2.0, 0.5], [4.0, 0.5], [1.0, 0.5]]
+    assert second._model.calls[-1]["batch_size"] == 3
+
+
+def test_embedding_config_yaml_is_parsed_once_per_file_version(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    from insight_backend.core.config import settings
+
+    monkeypatch.setattr(settings, "mindsdb_embeddings_enabled", True)
+    monkeypatch.setattr(settings, "embedding_mode", "api")
+    path = tmp_path / "embeddings.yaml"
+    path.write_text(
+        "default_model: m\nbatch_size: 4\ntables:\n  t:\n    source_column: a\n    embedding_column: e\n",
+        encoding="utf-8",
+    )
+    mindsdb_embeddings._read_config_yaml.cache_clear()
+
+    first = mindsdb_embeddings.load_embedding_config(str(path))
+    second = mindsdb_embeddings.load_embedding_config(str(path))
+    assert first == second
+    assert mindsdb_embeddings._read_config_yaml.cache_info().misses == 1
+
+    stat = path.stat()
+    path.write_text(path.read_text(encoding="utf-8").replace("batch_size: 4", "batch_size: 8"), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert mindsdb_embeddings.load_embedding_config(str(path)).batch_size == 8
+
+
+def test_normalise_embedding_accepts_json_and_numeric_strings():
+    assert list(mindsdb_embeddings.normalise_embedding("[1, 2.5, -3]")) == [1.0, 2.5, -3.0]
+    assert list(mindsdb_embeddings.normalise_embedding(["0.5", 1])) == [0.5, 1.0]
+    with pytest.raises(ValueError):
+        mindsdb_embeddings.normalise_embedding({"not": "a vector"})
+    with pytest.raises(TypeError):
+        mindsdb_embeddings.normalise_embedding([None])
@@ -10,6 +10,7 @@ from pathlib import Path
 import pytest
 
 from insight_backend.core.config import settings
+from insight_backend.services import mindsdb_embeddings
 from insight_backend.services.mindsdb_sync import sync_all_tables
 from insight_backend.services.mindsdb_embeddings import (
     build_embedding_client,
@@ -87,6 +88,7 @@ def test_build_embedding_client_local(monkeypatch: pytest.MonkeyPatch) -> None:
             self,
             inputs: list[str],
             *,
+            batch_size: int = 32,
             convert_to_numpy: bool = True,
             show_progress_bar: bool = False,
         ) -> list[list[float]]:
@@ -94,6 +96,7 @@ def test_build_embedding_client_local(monkeypatch: pytest.MonkeyPatch) -> None:
 
     fake_module = types.SimpleNamespace(SentenceTransformer=_StubSentenceTransformer)
     monkeypatch.setitem(sys.modules, "sentence_transformers", fake_module)
+    monkeypatch.setattr(mindsdb_embeddings, "_models", {})
 
     client, model = build_embedding_client(config)
     try: